@@ -0,0 +1,69 @@
+# amortization_bench.py
+# Times the old month-by-month amortization loop against the vectorized schedule.
+# Run from the repo root: python benchmarks/amortization_bench.py [n_loans]
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from money_matters.engine.amortization import amortization_schedule, monthly_payment
+
+
+def loop_schedule(loan_amount, annual_interest_rate, loan_term_years, years_held, start_year):
+    # The per-page implementation this module replaced
+    monthly_rate = annual_interest_rate / 12 / 100
+    payment = monthly_payment(loan_amount, annual_interest_rate, loan_term_years)
+    schedule = []
+    balance = loan_amount
+
+    for i in range(years_held):
+        interest_paid = 0
+        principal_paid = 0
+        for _ in range(12):
+            interest = balance * monthly_rate
+            principal = payment - interest
+            balance -= principal
+            interest_paid += interest
+            principal_paid += principal
+        schedule.append({
+            "Year": start_year + i,
+            "Beginning Balance": schedule[-1]["Ending Balance"] if schedule else loan_amount,
+            "Principal Paid": principal_paid,
+            "Interest Paid": interest_paid,
+            "Ending Balance": balance
+        })
+
+    return schedule
+
+
+def main(n_loans=10000, years=30):
+    rng = np.random.default_rng(0)
+    loans = rng.uniform(100_000, 1_000_000, n_loans)
+    rates = rng.uniform(2.0, 9.0, n_loans)
+
+    start = time.perf_counter()
+    looped = [loop_schedule(float(l), float(r), years, years, 2025) for l, r in zip(loans, rates)]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = amortization_schedule(loans, rates, years, years, 2025)
+    vector_seconds = time.perf_counter() - start
+
+    worst = max(
+        np.abs(np.array([row[column] for row in schedule]) - vectorized[column][i]).max()
+        for i, schedule in enumerate(looped)
+        for column in ("Principal Paid", "Interest Paid", "Ending Balance")
+    )
+
+    print(f"{n_loans:,} loans x {years} years")
+    print(f"  loop:       {loop_seconds:8.3f} s")
+    print(f"  vectorized: {vector_seconds:8.3f} s  ({loop_seconds / vector_seconds:,.0f}x faster)")
+    print(f"  max abs difference: ${worst:.6f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,112 @@
+# import_time.py
+# Tracks cold-start cost: per-module import time (python -X importtime) and each page's
+# first render and rerun latency, every measurement in a fresh interpreter.
+# Run from the repo root: python benchmarks/import_time.py [--json]
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "streamlit",
+    "numpy",
+    "pandas",
+    "plotly.graph_objects",
+    "plotly.express",
+    "openpyxl",
+    "streamlit_javascript",
+    "money_matters.engine",
+    "style_utils",
+    "shared_components",
+    "budget_summary_analysis",
+    "utils_export",
+]
+
+PAGES = [
+    "pages/0_Home.py",
+    "pages/1_Core_Tracker.py",
+    "pages/2_Advanced_Planner.py",
+    "pages/3_Withdrawal_Strategy.py",
+    "pages/4_Lifestyle_Budgeter.py",
+    "pages/5_Real_Estate_Planner.py",
+    "pages/6_Investment_Analyzer.py",
+]
+
+# Modules a page should not load until the user asks for a result (Home's logo already pulls in NumPy)
+HEAVY_MODULES = ["numpy", "pandas", "plotly.graph_objs._figure", "plotly.express", "openpyxl", "streamlit_javascript"]
+
+# Pages are rendered through the router, the way the deployed app reaches them
+PAGE_PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("router.py", default_timeout=120).run()
+already_loaded = set(sys.modules)
+start = time.perf_counter()
+app.switch_page({page!r}).run()
+first = time.perf_counter() - start
+start = time.perf_counter()
+app.run()
+rerun = time.perf_counter() - start
+print(json.dumps({{
+    "first_render_ms": first * 1000,
+    "rerun_ms": rerun * 1000,
+    "errors": [str(e.value) for e in app.exception],
+    "heavy_modules": [m for m in {heavy!r} if m in sys.modules and m not in already_loaded],
+}}))
+"""
+
+
+def module_import_ms(module):
+    """Cumulative import time of `module` in a fresh interpreter, from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    for line in reversed(result.stderr.splitlines()):
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    return None
+
+
+def page_latency(page):
+    result = subprocess.run(
+        [sys.executable, "-c", PAGE_PROBE.format(page=page, heavy=HEAVY_MODULES)],
+        cwd=ROOT, capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT}
+    )
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        return {"errors": [result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"]}
+    return json.loads(lines[-1])
+
+
+def main(as_json=False):
+    report = {
+        "modules": {module: module_import_ms(module) for module in MODULES},
+        "pages": {page: page_latency(page) for page in PAGES},
+    }
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print("Module import time (cold, cumulative)")
+    for module, ms in report["modules"].items():
+        print(f"  {module:<26} {'not installed' if ms is None else f'{ms:8.1f} ms'}")
+
+    print("\nPage latency (first render after Home, then a rerun)")
+    for page, stats in report["pages"].items():
+        if "first_render_ms" not in stats:
+            print(f"  {page:<34} failed: {stats['errors'][0]}")
+            continue
+        heavy = ", ".join(stats["heavy_modules"]) or "none"
+        print(f"  {page:<34} {stats['first_render_ms']:8.1f} ms  rerun {stats['rerun_ms']:7.1f} ms  loads: {heavy}")
+
+
+if __name__ == "__main__":
+    main(as_json="--json" in sys.argv[1:])
@@ -0,0 +1,53 @@
+# parallel_scaling_bench.py
+# Scaling of the multi-process Monte Carlo engine: wall time, speedup and efficiency
+# (speedup / workers) for 1, 2, 4, ... workers up to the cores available. One worker runs
+# the same blocks in-process, so its time is the baseline. Pools are started before timing.
+# Run from the repo root: python benchmarks/parallel_scaling_bench.py [n_paths] [n_years] [max_workers]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from money_matters.engine.monte_carlo import run_monte_carlo_parallel
+from money_matters.engine.parallel import available_workers, get_pool
+
+
+def worker_counts(max_workers):
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def run(n_paths, n_years, n_workers):
+    return run_monte_carlo_parallel(
+        300_000, 30_000, 80_000, 0.04, n_paths=n_paths, n_years=n_years, seed=0, n_workers=n_workers
+    )
+
+
+def main(n_paths=1_000_000, n_years=60, max_workers=None):
+    max_workers = max_workers or available_workers()
+    print(f"{n_paths:,} paths x {n_years} years, {available_workers()} cores available")
+    print(f"{'workers':>7} {'seconds':>9} {'speedup':>8} {'efficiency':>10}")
+
+    baseline = None
+    for n_workers in worker_counts(max_workers):
+        if n_workers > 1:
+            get_pool(n_workers)
+            run(n_workers * 4096, n_years, n_workers)  # wake every worker and import NumPy there
+        start = time.perf_counter()
+        result = run(n_paths, n_years, n_workers)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        speedup = baseline / seconds
+        print(f"{n_workers:>7} {seconds:>9.3f} {speedup:>7.2f}x {speedup / n_workers:>10.0%}")
+    print(f"success probability {result['success_probability']:.2%} (identical for every worker count)")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:4]]
+    main(*args)
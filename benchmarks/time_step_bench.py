@@ -0,0 +1,42 @@
+# time_step_bench.py
+# Compares annual and monthly time steps for the projection engines (uncached calls).
+# Run from the repo root: python benchmarks/time_step_bench.py [repeats]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from money_matters.engine.fire import estimate_years_to_fi, project_lifetime, solve_fire_year
+from money_matters.engine.simulations import cashflow_path, equity_path
+
+CASES = {
+    "estimate_years_to_fi": lambda p: estimate_years_to_fi.uncached(100_000, 30_000, 0.07, 2_000_000, 0.02, p),
+    "solve_fire_year": lambda p: solve_fire_year.uncached(35, 300_000, 400_000, 30_000, 0.07, 80_000, 0.035, 0.025, periods_per_year=p),
+    "project_lifetime": lambda p: project_lifetime.uncached(300_000, 30_000, 0.07, 20, 80_000, 35, 95, 0.025, social_security=30_000, periods_per_year=p),
+    "cashflow_path": lambda p: cashflow_path.uncached(24_000, 5_000, 1.5, 18_000, 30, 2.5, p),
+    "equity_path": lambda p: equity_path.uncached(125_000, 30, 7.0, 1.5, False, p),
+}
+
+
+def best_of(func, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(repeats=50):
+    print(f"{'engine':<22} {'annual':>10} {'monthly':>10}  ratio")
+    for name, case in CASES.items():
+        case(1)  # warm up imports
+        annual = best_of(lambda: case(1), repeats)
+        monthly = best_of(lambda: case(12), repeats)
+        print(f"{name:<22} {annual * 1e6:8.0f} us {monthly * 1e6:8.0f} us  {monthly / annual:5.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,73 @@
+# transaction_import_bench.py
+# Times the streaming bank CSV import on a synthetic year of transactions, with and without
+# recurring-charge detection, and the detector alone on a multi-year columnar history.
+# Run from the repo root: python benchmarks/transaction_import_bench.py [n_rows]
+
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from money_matters.transactions import find_recurring_charges, import_transactions
+
+MERCHANTS = [
+    "WHOLE FOODS MKT #{n} AUSTIN TX", "SHELL OIL {n}", "AMZN Mktp US*{n}", "NETFLIX.COM", "UBER EATS {n}",
+    "UBER *TRIP {n}", "STARBUCKS STORE {n}", "TARGET T-{n}", "CVS/PHARMACY #{n}", "VERIZON WIRELESS",
+    "DELTA AIR LINES {n}", "MARRIOTT HOTEL {n}", "SQ *LOCAL VENDOR {n}", "ONLINE PAYMENT THANK YOU",
+    "RENT PAYMENT APT {n}", "GEICO AUTO INSURANCE", "VANGUARD BUY {n}", "GREAT CLIPS BARBER {n}",
+]
+
+
+def synthetic_csv(n_rows, seed=0):
+    rng = random.Random(seed)
+    lines = ["Date,Description,Amount\n"]
+    for _ in range(n_rows):
+        merchant = rng.choice(MERCHANTS).format(n=rng.randrange(10_000))
+        lines.append(f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d},{merchant},-{rng.uniform(1, 250):.2f}\n")
+    return "".join(lines)
+
+
+def main(n_rows=500_000):
+    text = synthetic_csv(n_rows)
+    print(f"{n_rows:,} transactions, {len(text) / 1e6:.1f} MB")
+
+    lines = io.StringIO(text)
+    start = time.perf_counter()
+    result = import_transactions(lines)
+    print(f"  categorized in {time.perf_counter() - start:.2f} s")
+
+    # Memory is measured on a second run; tracing slows it down several times
+    lines = io.StringIO(text)
+    tracemalloc.start()
+    import_transactions(lines)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  peak {peak / 1e6:.1f} MB beyond the input")
+
+    lines = io.StringIO(text)
+    start = time.perf_counter()
+    found = import_transactions(lines, detect_recurring=True)["recurring"]
+    print(f"  with recurring detection in {time.perf_counter() - start:.2f} s ({len(found)} recurring merchants)")
+
+    # Detector alone: a million charges over five years, 50k merchants
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    n_charges = 1_000_000
+    merchants = rng.integers(0, 50_000, n_charges)
+    days = 738_000 + rng.integers(0, 5 * 365, n_charges)
+    amounts = rng.uniform(1, 250, n_charges)
+    start = time.perf_counter()
+    find_recurring_charges(merchants, days, amounts, days.max())
+    print(f"  detector on {n_charges:,} charges in {time.perf_counter() - start:.2f} s")
+    for category, amount in result["monthly"].items():
+        if amount:
+            print(f"    {category:<18} ${amount:>10,.0f}/mo")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
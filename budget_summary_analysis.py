@@ -1,31 +1,31 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+from derived_values import derived
+
+# --- Category Groups ---
+BUDGET_GROUPS = {
+    "🏠 Essentials": ["Housing", "Utilities", "Food", "Transportation", "Insurance", "Phone/Internet", "Childcare", "Health & Wellness"],
+    "💬 Life & Services": ["Subscriptions", "Discretionary", "Shopping", "Personal Care"],
+    "🎉 Lifestyle": ["Travel", "Other"],
+    "🎯 Goals & Giving": ["Investments", "Giving", "Education"],
+}
 
 def render_budget_analysis():
+    # pandas and plotly.express are only needed once the summary is shown
+    import pandas as pd
+    import plotly.express as px
+
     # --- Retrieve Session Data ---
     monthly_expenses = st.session_state.get("expense_template", {})
     annual_income = st.session_state.get("annual_income", 0)
     annual_savings = st.session_state.get("annual_savings", 0)
 
-    # --- Define Category Groups ---
-    ESSENTIALS = ["Housing", "Utilities", "Food", "Transportation", "Insurance", "Phone/Internet", "Childcare", "Health & Wellness"]
-    LIFE_SERVICES = ["Subscriptions", "Discretionary", "Shopping", "Personal Care"]
-    LIFESTYLE = ["Travel", "Other"]
-    GOALS_GIVING = ["Investments", "Giving", "Education"]
-
-    def sum_group(group):
-        return sum(monthly_expenses.get(cat, 0) for cat in group)
-
-    # --- Calculate Totals ---
-    monthly_essentials = sum_group(ESSENTIALS)
-    monthly_services = sum_group(LIFE_SERVICES)
-    monthly_lifestyle = sum_group(LIFESTYLE)
-    monthly_goals = sum_group(GOALS_GIVING)
-    monthly_total = sum(monthly_expenses.values())
+    # --- Calculate Totals (recomputed only when the template or income changes) ---
+    group_totals = derived("budget_group_totals")
+    monthly_essentials, monthly_services, monthly_lifestyle, monthly_goals = group_totals.values()
+    monthly_total = derived("monthly_budget_total")
     annual_total = monthly_total * 12
     delta = annual_income - annual_total
-    savings_rate = round((annual_savings / annual_income) * 100, 1) if annual_income else 0
+    savings_rate = derived("savings_rate")
     buffer = delta - annual_savings
 
     # --- FIRE Impact First ---
@@ -66,10 +66,21 @@ def render_budget_analysis():
     | <strong>📊 Total Expense</strong> | <strong>${monthly_total:,.0f}</strong> | <strong>${annual_total:,.0f}</strong> |
     """, unsafe_allow_html=True)
 
+    # --- Closest Lifestyle Template ---
+    if st.session_state.get("expenses_customized", False):
+        from lifestyle_profiles import closest_template
+
+        household_type = st.session_state.get("household_type")
+        _, template, tier, distance = closest_template(monthly_expenses, household_type=household_type)
+        st.markdown(
+            f"🧭 **Closest lifestyle template:** {template} · {tier} "
+            f"(about \\${distance:,.0f}/month apart across categories)."
+        )
+
     # --- Bar Chart ---
     data = pd.DataFrame({
-        "Category": ["🏠 Essentials", "💬 Life & Services", "🎉 Lifestyle", "🎯 Goals & Giving"],
-        "Monthly Expense": [monthly_essentials, monthly_services, monthly_lifestyle, monthly_goals]
+        "Category": list(group_totals),
+        "Monthly Expense": list(group_totals.values())
     })
 
     fig = px.bar(
@@ -0,0 +1,146 @@
+# derived_values.py
+# Values the pages derive from session inputs, declared once with the inputs they read.
+# Each session keeps its own versions and results, so a rerun only recomputes the values
+# whose inputs changed; everything else is served from the previous run.
+
+import datetime
+from collections import ChainMap
+
+import streamlit as st
+
+from money_matters.reactive import DerivedGraph
+
+DERIVED = DerivedGraph()
+
+
+# --- FIRE Tracker ---
+
+@DERIVED.node("liquid_assets", "retirement_assets", "illiquid_assets")
+def total_net_worth(liquid_assets, retirement_assets, illiquid_assets):
+    return liquid_assets + retirement_assets + illiquid_assets
+
+
+@DERIVED.node("liquid_assets", "illiquid_assets", "include_illiquid")
+def current_net_worth(liquid_assets, illiquid_assets, include_illiquid):
+    return liquid_assets + illiquid_assets if include_illiquid else liquid_assets
+
+
+@DERIVED.node(
+    "user_age", "liquid_assets", "retirement_assets", "annual_savings", "expected_return_percent",
+    "fire_expenses", "withdrawal_rate", "inflation_rate", "growth_growth_rate", "include_illiquid",
+    "illiquid_assets", "adjust_fire_expenses_for_inflation", "current_year", "tax_aware_access",
+    "filing_status", "time_step",
+)
+def fire_solution(user_age, liquid_assets, retirement_assets, annual_savings, expected_return_percent,
+                  fire_expenses, withdrawal_rate, inflation_rate, growth_rate, include_illiquid,
+                  illiquid_assets, adjust_for_inflation, current_year, tax_aware_access,
+                  filing_status, time_step):
+    from money_matters.engine import solve_fire_year
+    from money_matters.engine.periods import TIME_STEPS
+
+    # Session rates are in percent
+    return solve_fire_year(
+        user_age, liquid_assets, retirement_assets, annual_savings, expected_return_percent / 100,
+        fire_expenses, withdrawal_rate / 100,
+        inflation_rate=inflation_rate / 100, merit_growth=growth_rate / 100,
+        include_illiquid=include_illiquid, illiquid_assets=illiquid_assets,
+        adjust_for_inflation=adjust_for_inflation, current_year=current_year,
+        access_model="tax_aware" if tax_aware_access else "haircut", filing_status=filing_status,
+        periods_per_year=TIME_STEPS[time_step]
+    )
+
+
+@DERIVED.node("fire_solution")
+def fire_goal(solution):
+    return solution["fire_goal"]
+
+
+@DERIVED.node("fire_solution")
+def adjusted_expenses(solution):
+    return solution["adjusted_expenses"]
+
+
+# --- Real Estate Planner ---
+
+@DERIVED.node("purchase_price", "down_payment_pct")
+def down_payment(purchase_price, down_payment_pct):
+    return purchase_price * (down_payment_pct / 100)
+
+
+@DERIVED.node("purchase_price", "down_payment_pct")
+def loan_amount(purchase_price, down_payment_pct):
+    return purchase_price * (1 - down_payment_pct / 100)
+
+
+@DERIVED.node("down_payment", "closing_costs", "renovation_costs")
+def property_initial_investment(down_payment, closing_costs, renovation_costs):
+    return down_payment + closing_costs + renovation_costs
+
+
+@DERIVED.node("loan_amount", "interest_rate", "mortgage_years")
+def annual_debt_service(loan_amount, interest_rate, mortgage_years):
+    from money_matters.engine import monthly_payment
+
+    return float(monthly_payment(loan_amount, interest_rate, mortgage_years)) * 12
+
+
+@DERIVED.node("annual_rent", "purchase_price")
+def gross_yield(annual_rent, purchase_price):
+    return (annual_rent / purchase_price) * 100
+
+
+# --- Lifestyle Budgeter ---
+
+@DERIVED.node("expense_template")
+def budget_group_totals(expense_template):
+    from budget_summary_analysis import BUDGET_GROUPS
+
+    expenses = expense_template or {}
+    return {group: sum(expenses.get(category, 0) for category in categories) for group, categories in BUDGET_GROUPS.items()}
+
+
+@DERIVED.node("expense_template")
+def monthly_budget_total(expense_template):
+    return sum((expense_template or {}).values())
+
+
+@DERIVED.node("annual_savings", "annual_income")
+def savings_rate(annual_savings, annual_income):
+    return round((annual_savings / annual_income) * 100, 1) if annual_income else 0
+
+
+# --- Session Binding ---
+
+def _graph_state():
+    if "derived_graph" not in st.session_state:
+        st.session_state["derived_graph"] = DERIVED.state()
+    return st.session_state["derived_graph"]
+
+
+def _inputs():
+    # The calendar year counts as an input too, so year-based results roll over with it
+    return ChainMap({"current_year": datetime.datetime.now().year}, st.session_state)
+
+
+def derived(name):
+    """Current value of a derived node for this session, recomputed only if its inputs changed."""
+    return _graph_state().get(name, _inputs())
+
+
+def begin_derived_run():
+    """Start this rerun's recompute counters (called by the router before the page runs)."""
+    _graph_state().begin_run()
+
+
+def render_derived_stats():
+    """Sidebar readout of how many derived values this rerun recomputed vs. served from cache."""
+    graph = _graph_state()
+    stats = graph.run_stats()
+    with st.sidebar.expander("♻️ Derived Values", expanded=False):
+        st.caption(
+            f"This run: {len(stats['recomputed'])} recomputed · {len(stats['cached'])} from cache. "
+            f"Session: {graph.totals['recomputed']:,} recomputed · {graph.totals['cached']:,} cached lookups "
+            f"over {graph.runs:,} runs."
+        )
+        if stats["recomputed"]:
+            st.caption("Recomputed: " + ", ".join(stats["recomputed"]))
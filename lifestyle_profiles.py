@@ -1,3 +1,5 @@
+import functools
+
 EXPENSE_CATEGORIES = [
     "Housing", "Utilities", "Food", "Transportation", "Insurance",
     "Phone/Internet", "Childcare", "Health & Wellness", "Subscriptions",
@@ -39,7 +41,7 @@ BASE_EXPENSES_STUDENT = {
         "Discretionary": 0, "Travel": 150, "Shopping": 150, "Personal Care": 80,
         "Giving": 50, "Investments": 150, "Education": 150, "Other": 80
     },
-    "🏡 Suburban Comfort ($$) ($$)": {
+    "🏡 Suburban Comfort ($$)": {
         "Housing": 1000, "Utilities": 180, "Food": 400, "Transportation": 200, "Insurance": 250,
         "Phone/Internet": 70, "Childcare": 0, "Health & Wellness": 80, "Subscriptions": 30,
         "Discretionary": 0, "Travel": 100, "Shopping": 120, "Personal Care": 60,
@@ -221,3 +223,80 @@ LOCATION_MULTIPLIERS = {
     "Major Metro Area": 1.2,
     "Large Coastal City": 1.35
 }
+
+LIFESTYLE_TEMPLATES = [
+    "🧘‍♀️ Lean & Serene ($)",
+    "🏡 Suburban Comfort ($$)",
+    "🏙️ Urban Explorer ($$$)",
+    "🎨 Creative Nomad ($$$)",
+    "✈️ Jetsetter ($$$$)"
+]
+
+# Tier used when a location isn't recognized (multiplier 1.0)
+DEFAULT_LOCATION_TIER = "Mid-Sized City or Suburb"
+
+# --- Template Tensor ---
+# Integer positions along each axis of template_tensor()
+HOUSEHOLD_INDEX = {name: i for i, name in enumerate(HOUSEHOLD_TYPES)}
+TEMPLATE_INDEX = {name: i for i, name in enumerate(LIFESTYLE_TEMPLATES)}
+TIER_INDEX = {name: i for i, name in enumerate(LOCATION_TIERS)}
+CATEGORY_INDEX = {name: i for i, name in enumerate(EXPENSE_CATEGORIES)}
+
+
+@functools.lru_cache(maxsize=None)
+def template_tensor():
+    """
+    Monthly amounts as one read-only household x template x tier x category array,
+    built from the tables above on first use (NumPy loads only then).
+    """
+    import numpy as np
+
+    base = np.array([
+        [[BASE_EXPENSES_BY_HOUSEHOLD[household][template].get(category, 0) for category in EXPENSE_CATEGORIES]
+         for template in LIFESTYLE_TEMPLATES]
+        for household in HOUSEHOLD_TYPES
+    ], dtype=float)
+    multipliers = np.array([LOCATION_MULTIPLIERS[tier] for tier in LOCATION_TIERS])
+    tensor = base[:, :, None, :] * multipliers[None, None, :, None]
+    tensor.setflags(write=False)
+    return tensor
+
+
+def apply_template(household_type, budget_template, location_tier):
+    """Whole-dollar monthly expenses by category for one selection; unknown profiles give zeros."""
+    import numpy as np
+
+    if household_type not in HOUSEHOLD_INDEX or budget_template not in TEMPLATE_INDEX:
+        return {category: 0 for category in EXPENSE_CATEGORIES}
+    tier = TIER_INDEX.get(location_tier, TIER_INDEX[DEFAULT_LOCATION_TIER])
+    amounts = np.rint(template_tensor()[HOUSEHOLD_INDEX[household_type], TEMPLATE_INDEX[budget_template], tier])
+    return dict(zip(EXPENSE_CATEGORIES, amounts.astype(int).tolist()))
+
+
+def template_totals(household_type, location_tier):
+    """Total monthly spending of every template for a household and location, in LIFESTYLE_TEMPLATES order."""
+    tier = TIER_INDEX.get(location_tier, TIER_INDEX[DEFAULT_LOCATION_TIER])
+    return template_tensor()[HOUSEHOLD_INDEX[household_type], :, tier].sum(axis=-1).tolist()
+
+
+def closest_template(expenses, household_type=None, location_tier=None):
+    """
+    Template and tier nearest to actual monthly `expenses` (category -> amount), by Euclidean
+    distance across categories, in one pass over the tensor. Passing `household_type` or
+    `location_tier` pins that axis. Returns (household, template, tier, distance).
+    """
+    import numpy as np
+
+    actual = np.array([float(expenses.get(category, 0) or 0) for category in EXPENSE_CATEGORIES])
+    distance = np.sqrt(((template_tensor() - actual) ** 2).sum(axis=-1))
+    if household_type in HOUSEHOLD_INDEX:
+        keep = np.zeros(len(HOUSEHOLD_TYPES), dtype=bool)
+        keep[HOUSEHOLD_INDEX[household_type]] = True
+        distance = np.where(keep[:, None, None], distance, np.inf)
+    if location_tier in TIER_INDEX:
+        keep = np.zeros(len(LOCATION_TIERS), dtype=bool)
+        keep[TIER_INDEX[location_tier]] = True
+        distance = np.where(keep[None, None, :], distance, np.inf)
+
+    h, t, l = np.unravel_index(np.argmin(distance), distance.shape)
+    return HOUSEHOLD_TYPES[h], LIFESTYLE_TEMPLATES[t], LOCATION_TIERS[l], float(distance[h, t, l])
@@ -0,0 +1,2 @@
+# money_matters
+# Shared code for the Money Matters FIRE studio
@@ -0,0 +1,47 @@
+# money_matters.engine
+# Headless financial math: no Streamlit, plotly or pandas, and NumPy loads only when an
+# array function first runs. The vectorized engines (monte_carlo, withdrawal_backtest, drawdown,
+# investment_sweep, household_scoring) are imported from their own modules.
+
+from .amortization import monthly_payment
+from .cache import SIMULATION_CACHE, cached_simulation
+from .comparison import compare_fire_paths
+from .fire import (
+    calculate_fire_number,
+    estimate_years_to_fi,
+    get_effective_assets,
+    project_lifetime,
+    projected_net_worth,
+    solve_fire_year,
+)
+from .simulations import (
+    amortization_schedule,
+    cashflow_path,
+    equity_path,
+    project_cashflow,
+    project_property_equity,
+    property_equity_path,
+    simulate_equity,
+    simulate_real_estate_fire_contribution,
+)
+
+__all__ = [
+    "SIMULATION_CACHE",
+    "amortization_schedule",
+    "cached_simulation",
+    "calculate_fire_number",
+    "cashflow_path",
+    "compare_fire_paths",
+    "equity_path",
+    "estimate_years_to_fi",
+    "get_effective_assets",
+    "monthly_payment",
+    "project_cashflow",
+    "project_lifetime",
+    "project_property_equity",
+    "property_equity_path",
+    "projected_net_worth",
+    "simulate_equity",
+    "simulate_real_estate_fire_contribution",
+    "solve_fire_year",
+]
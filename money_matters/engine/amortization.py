@@ -0,0 +1,124 @@
+# amortization.py
+# Closed-form, vectorized mortgage amortization shared by the real estate modules
+# NumPy is imported on first use so the engine package imports without it
+
+SCHEDULE_COLUMNS = ["Year", "Beginning Balance", "Principal Paid", "Interest Paid", "Ending Balance"]
+
+
+def monthly_payment(loan_amount, annual_interest_rate, loan_term_years):
+    """Level monthly payment; the annual rate is in percent (6.0 = 6%). Works on arrays."""
+    import numpy as np
+
+    loan_amount, annual_interest_rate, loan_term_years = (
+        np.asarray(x, dtype=float) for x in (loan_amount, annual_interest_rate, loan_term_years)
+    )
+    rate = annual_interest_rate / 12 / 100
+    num_payments = loan_term_years * 12
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        payment = np.where(
+            rate == 0,
+            loan_amount / num_payments,
+            loan_amount * rate / (1 - (1 + rate) ** -num_payments)
+        )
+    # A zero-length loan is settled in the first month
+    payment = np.where(num_payments > 0, payment, loan_amount)
+    return payment if payment.ndim else float(payment)
+
+
+def _segment_balances(balance, rate, payment, months, out):
+    # Closed form B_m = P/i + (B_0 - P/i)(1+i)^m, floored at zero once the loan is paid off
+    import numpy as np
+
+    growing = rate != 0
+    np.exp(np.multiply.outer(np.log1p(rate), months), out=out)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        level = np.where(growing, payment / rate, 0.0)
+    out *= (balance - level)[:, None]
+    out += level[:, None]
+    if not growing.all():
+        flat = ~growing
+        out[flat] = balance[flat, None] - payment[flat, None] * months
+    np.maximum(out, 0.0, out=out)
+
+
+def monthly_balances(loan_amount, annual_interest_rate, loan_term_years, months,
+                     extra_monthly_principal=0.0, rate_resets=None):
+    """
+    Balance at the end of every month 0..months for each loan, as a (loans, months + 1) array.
+
+    `rate_resets` maps a year offset (1 = start of the second year) to a new annual rate in
+    percent, scalar or per loan; the remaining balance is re-amortized over the remaining
+    term. `extra_monthly_principal` is paid on top of the scheduled payment every month.
+    Also returns the (loans, months) monthly rate in effect, for interest accounting.
+    """
+    import numpy as np
+
+    loan_amount, annual_interest_rate, loan_term_years, extra = (
+        np.atleast_1d(np.asarray(x, dtype=float))
+        for x in np.broadcast_arrays(loan_amount, annual_interest_rate, loan_term_years, extra_monthly_principal)
+    )
+    loans = loan_amount.size
+    loan_amount, annual_interest_rate, loan_term_years, extra = (
+        x.ravel() for x in (loan_amount, annual_interest_rate, loan_term_years, extra)
+    )
+
+    # Segment boundaries in months, each with its own annual rate
+    starts = [0]
+    rates = [annual_interest_rate]
+    for year, new_rate in sorted((rate_resets or {}).items()):
+        month = int(year) * 12
+        if 0 < month < months:
+            starts.append(month)
+            rates.append(np.broadcast_to(np.asarray(new_rate, dtype=float), (loans,)))
+    starts.append(months)
+
+    balances = np.empty((loans, months + 1))
+    monthly_rates = np.empty((loans, months))
+    balances[:, 0] = loan_amount
+
+    for start, end, annual_rate in zip(starts[:-1], starts[1:], rates):
+        balance = balances[:, start]
+        remaining_years = np.maximum(loan_term_years - start / 12, 0)
+        payment = monthly_payment(balance, annual_rate, remaining_years) + extra
+        rate = annual_rate / 12 / 100
+        _segment_balances(balance, rate, np.atleast_1d(payment), np.arange(1, end - start + 1), balances[:, start + 1: end + 1])
+        monthly_rates[:, start:end] = rate[:, None]
+
+    return balances, monthly_rates
+
+
+def amortization_schedule(loan_amount, annual_interest_rate, loan_term_years, years_held, start_year,
+                          extra_monthly_principal=0.0, rate_resets=None):
+    """
+    Yearly amortization schedule as columns of NumPy arrays keyed by SCHEDULE_COLUMNS.
+
+    Scalar loan inputs give 1-D columns of length `years_held`; array inputs give
+    (loans, years_held) columns, so thousands of loans are amortized in one call.
+    Yearly interest sums the month-start balances with a reshape; principal is the balance drop.
+    """
+    import numpy as np
+
+    months = int(years_held) * 12
+    balances, monthly_rates = monthly_balances(
+        loan_amount, annual_interest_rate, loan_term_years, months,
+        extra_monthly_principal=extra_monthly_principal, rate_resets=rate_resets
+    )
+
+    # Resets fall on year boundaries, so each year has a single monthly rate
+    yearly = (balances.shape[0], int(years_held), 12)
+    beginning = balances[:, :-1:12]
+    ending = balances[:, 12::12]
+
+    schedule = {
+        "Year": start_year + np.arange(int(years_held)),
+        "Beginning Balance": beginning,
+        "Principal Paid": beginning - ending,
+        "Interest Paid": balances[:, :-1].reshape(yearly).sum(axis=2) * monthly_rates[:, ::12],
+        "Ending Balance": ending,
+    }
+
+    if np.ndim(loan_amount) == 0 and np.ndim(annual_interest_rate) == 0 and np.ndim(loan_term_years) == 0:
+        for column in SCHEDULE_COLUMNS[1:]:
+            schedule[column] = schedule[column][0]
+    return schedule
@@ -0,0 +1,98 @@
+# bridge.py
+# Roth conversion ladder and 72(t) SEPP search for retiring before retirement accounts open up
+
+from .drawdown import simulate_drawdown
+
+SEPP_FRACTIONS = (0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+
+
+def heirs_tax(deferred_balance, filing_status="married_joint", payout_years=10):
+    """Federal tax left in a tax-deferred balance if heirs draw it evenly over `payout_years`."""
+    from .drawdown import federal_tax
+
+    return payout_years * federal_tax(deferred_balance / payout_years, filing_status=filing_status)
+
+
+def optimize_bridge(start_age, taxable, taxable_basis, deferred, roth, roth_basis, annual_spending,
+                    annual_return, inflation_rate, end_age=95, filing_status="married_joint", access_age=59.5,
+                    conversion_step=5000, max_conversion=150000, sepp_fractions=SEPP_FRACTIONS):
+    """
+    Search Roth conversion amounts and SEPP elections for an early retirement.
+
+    Every policy, a constant yearly conversion (today's dollars) made while under
+    `access_age`, paired with the share of the tax-deferred balance put on a 72(t) SEPP,
+    becomes one scenario of a single simulate_drawdown call. The whole grid is evaluated
+    in one vectorized pass, not one simulation per policy.
+
+    A policy keeps the bridge funded when nothing is short and no early-withdrawal penalty
+    is paid before `access_age`. Among funded policies the best has the lowest lifetime cost:
+    federal tax and penalties through `end_age`, the tax still owed on what is left in
+    tax-deferred accounts (heirs_tax) and any spending the plan could not fund, all in
+    today's dollars. Counting unfunded spending keeps a plan that runs dry (and so stops
+    paying tax) from looking cheap. If no policy funds the bridge, the one with the
+    smallest bridge shortfall wins.
+    """
+    import numpy as np
+
+    n_years = max(int(end_age - start_age), 1)
+    bridge_years = max(int(np.ceil(access_age - start_age)), 0)
+
+    amounts = np.arange(0, max_conversion + conversion_step, conversion_step, dtype=float)
+    fractions = np.asarray(sepp_fractions, dtype=float)
+    amount_grid, fraction_grid = (x.ravel() for x in np.meshgrid(amounts, fractions, indexing="ij"))
+
+    schedule = np.zeros((amount_grid.size, n_years))
+    schedule[:, :bridge_years] = amount_grid[:, None]
+
+    plan = simulate_drawdown(
+        start_age, taxable, taxable_basis, deferred, roth, roth_basis, annual_spending,
+        annual_return, inflation_rate, n_years=n_years, filing_status=filing_status, access_age=access_age,
+        roth_conversions=schedule, sepp_fraction=fraction_grid
+    )
+
+    deflator = plan["price_index"]
+    bridge_shortfall = ((plan["shortfall"] + plan["penalties"])[:, :bridge_years] / deflator[:, :bridge_years]).sum(axis=1)
+    funded = bridge_shortfall < 1.0
+    unfunded = (plan["shortfall"] / deflator[:, :-1]).sum(axis=1)
+    lifetime_cost = plan["lifetime_taxes"] + heirs_tax(plan["deferred"][:, -1] / deflator[:, -1], filing_status) + unfunded
+
+    if funded.any():
+        best = int(np.argmin(np.where(funded, lifetime_cost, np.inf)))
+    else:
+        best = int(np.argmin(bridge_shortfall))
+    baseline = 0  # no conversions, no SEPP
+
+    def _summary(i):
+        return {
+            "annual_conversion": float(amount_grid[i]),
+            "sepp_fraction": float(fraction_grid[i]),
+            "sepp_payment": float(plan["sepp_payments"][i, 0]),
+            "bridge_funded": bool(funded[i]),
+            "bridge_shortfall": float(bridge_shortfall[i]),
+            "lifetime_cost": float(lifetime_cost[i]),
+            "lifetime_taxes": float(plan["lifetime_taxes"][i]),
+            "unfunded_spending": float(unfunded[i]),
+            "success": bool(plan["success"][i]),
+            "ending_balance_real": float(plan["ending_balance_real"][i]),
+        }
+
+    grid_shape = (amounts.size, fractions.size)
+    return {
+        "bridge_years": bridge_years,
+        "best": _summary(best),
+        "baseline": _summary(baseline),
+        "conversion_amounts": amounts,
+        "sepp_fractions": fractions,
+        "lifetime_cost": lifetime_cost.reshape(grid_shape),
+        "funded": funded.reshape(grid_shape),
+        "schedule": {
+            "taxable": plan["taxable"][best],
+            "deferred": plan["deferred"][best],
+            "roth": plan["roth"][best],
+            "roth_conversions": plan["roth_conversions"][best],
+            "sepp_payments": plan["sepp_payments"][best],
+            "taxes": plan["taxes"][best],
+            "penalties": plan["penalties"][best],
+            "price_index": deflator[best],
+        },
+    }
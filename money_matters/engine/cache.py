@@ -0,0 +1,142 @@
+# cache.py
+# Process-wide memoization for the pure simulation functions (no Streamlit required)
+
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from collections import OrderedDict
+
+DEFAULT_CACHE_SIZE = 512
+
+# Inputs are rounded before hashing so 0.07 and 0.07000000001 share an entry
+ROUND_DIGITS = 6
+
+
+def _normalize(value):
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float)):
+        # 25 and 25.0 are the same scenario input
+        value = round(float(value), ROUND_DIGITS)
+        return 0.0 if value == 0 else value  # -0.0 and 0.0 hash the same
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if type(value).__module__ == "numpy":
+        # Only reached for NumPy inputs, so NumPy is never imported just to build a key
+        import numpy as np
+
+        if isinstance(value, np.bool_):
+            return bool(value)
+        if isinstance(value, np.number):
+            return _normalize(value.item())
+        if isinstance(value, np.ndarray):
+            data = np.round(value, ROUND_DIGITS) if value.dtype.kind == "f" else value
+            return {"ndarray": list(value.shape), "dtype": value.dtype.str,
+                    "sha256": hashlib.sha256(np.ascontiguousarray(data).tobytes()).hexdigest()}
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+
+def scenario_key(name, arguments):
+    """Canonical sha256 of a function name and its (rounded) arguments."""
+    payload = json.dumps([name, _normalize(arguments)], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SimulationCache:
+    """Thread-safe bounded LRU cache with hit/miss counters."""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name, key):
+        with self._lock:
+            try:
+                value = self._entries[(name, key)]
+            except KeyError:
+                self.misses += 1
+                raise
+            self._entries.move_to_end((name, key))
+            self.hits += 1
+            return value
+
+    def put(self, name, key, value):
+        with self._lock:
+            self._entries[(name, key)] = value
+            self._entries.move_to_end((name, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, name=None):
+        """Drop every entry, or only the entries of one simulation function."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                for entry in [entry for entry in self._entries if entry[0] == name]:
+                    del self._entries[entry]
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# One cache per server process, shared by every Streamlit session
+SIMULATION_CACHE = SimulationCache()
+
+
+def cached_simulation(func=None, cache=None):
+    """
+    Memoize a pure simulation function in SIMULATION_CACHE (or `cache`).
+
+    Positional and keyword calls map to the same key because arguments are bound
+    to the signature with defaults applied. Results are deep-copied in and out so
+    callers can mutate what they get back. `func.cache_invalidate()` drops its entries.
+    """
+    if func is None:
+        return functools.partial(cached_simulation, cache=cache)
+
+    signature = inspect.signature(func)
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        store = SIMULATION_CACHE if cache is None else cache
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = scenario_key(name, bound.arguments)
+        try:
+            return copy.deepcopy(store.get(name, key))
+        except KeyError:
+            pass
+        result = func(*args, **kwargs)
+        store.put(name, key, copy.deepcopy(result))
+        return result
+
+    wrapper.cache_invalidate = lambda: (SIMULATION_CACHE if cache is None else cache).invalidate(name)
+    wrapper.uncached = func
+    return wrapper
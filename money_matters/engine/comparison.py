@@ -0,0 +1,75 @@
+# comparison.py
+# Year-by-year real estate vs. index fund FIRE contributions, computed as columns
+# NumPy is imported on first use so the engine package imports without it
+
+COMPARISON_COLUMNS = [
+    "Year",
+    "Real Estate (Annual)",
+    "Real Estate (Cumulative)",
+    "Index Fund (Annual)",
+    "Index Fund (Cumulative)",
+]
+
+
+def compare_fire_columns(re_history: list[dict], re_cashflow: list[float], eq_history: list[dict],
+                         real_estate_upfront: float, investment_years: int) -> dict:
+    """
+    Annual and cumulative contribution of each strategy as arrays keyed by COMPARISON_COLUMNS.
+    Cumulative real estate is equity plus the running sum of cash flow, net of the upfront
+    closing and renovation costs; annual values are the year-over-year diff of the cumulative
+    paths, so real estate's first year carries the upfront costs.
+    """
+    import numpy as np
+
+    num_years = min(investment_years, len(re_history), len(re_cashflow), len(eq_history))
+    years = np.array([row["year"] for row in re_history[:num_years]])
+    equity = np.array([row["equity"] for row in re_history[:num_years]], dtype=float)
+    cashflow = np.asarray(re_cashflow[:num_years], dtype=float)
+    portfolio = np.array([row["portfolio_value"] for row in eq_history[:num_years]], dtype=float)
+
+    re_cumulative = equity + np.cumsum(cashflow) - real_estate_upfront
+    return {
+        "Year": years,
+        "Real Estate (Annual)": np.diff(re_cumulative, prepend=0.0),
+        "Real Estate (Cumulative)": re_cumulative,
+        "Index Fund (Annual)": np.diff(portfolio, prepend=0.0),
+        "Index Fund (Cumulative)": portfolio,
+    }
+
+
+def compare_fire_paths(re_history: list[dict], re_cashflow: list[float], eq_history: list[dict],
+                       real_estate_upfront: float, investment_years: int) -> list[dict]:
+    """
+    Annual and cumulative contribution of each strategy, one row per year.
+    Real estate's first year nets out the upfront closing and renovation costs.
+    """
+    columns = compare_fire_columns(re_history, re_cashflow, eq_history, real_estate_upfront, investment_years)
+    return [dict(zip(COMPARISON_COLUMNS, row)) for row in zip(*(columns[name].tolist() for name in COMPARISON_COLUMNS))]
+
+
+def find_breakeven(years, re_cumulative, eq_cumulative):
+    """
+    First point where real estate pulls ahead of the index fund. The crossing is placed
+    between year-ends by linear interpolation of the gap, so it can fall partway through a
+    year. Returns {"year", "value", "index"} (index of the first year-end real estate leads)
+    or None when the index fund leads or ties throughout.
+    """
+    import numpy as np
+
+    years = np.asarray(years, dtype=float)
+    re_cumulative = np.asarray(re_cumulative, dtype=float)
+    gap = re_cumulative - np.asarray(eq_cumulative, dtype=float)
+    ahead = gap > 0
+    if not ahead.any():
+        return None
+
+    i = int(np.argmax(ahead))
+    if i == 0:
+        return {"year": float(years[0]), "value": float(re_cumulative[0]), "index": 0}
+    # gap[i - 1] <= 0 < gap[i], so the fraction lands in [0, 1)
+    t = gap[i - 1] / (gap[i - 1] - gap[i])
+    return {
+        "year": float(years[i - 1] + t * (years[i] - years[i - 1])),
+        "value": float(re_cumulative[i - 1] + t * (re_cumulative[i] - re_cumulative[i - 1])),
+        "index": i,
+    }
@@ -0,0 +1,365 @@
+# drawdown.py
+# Tax-aware retirement drawdown across taxable, tax-deferred and Roth buckets (no Streamlit required)
+# NumPy is imported inside the functions so pages can read the tables without loading it
+
+from functools import lru_cache
+
+FILING_STATUSES = {
+    "married_joint": "Married Filing Jointly",
+    "single": "Single",
+}
+
+# 2024 federal tables. Bracket edges are taxable income where each rate starts.
+TAX_TABLES = {
+    "married_joint": {
+        "standard_deduction": 29200,
+        "ordinary_edges": [0, 23200, 94300, 201050, 383900, 487450, 731200],
+        "ordinary_rates": [0.10, 0.12, 0.22, 0.24, 0.32, 0.35, 0.37],
+        "gains_edges": [0, 94050, 583750],
+        "gains_rates": [0.0, 0.15, 0.20],
+    },
+    "single": {
+        "standard_deduction": 14600,
+        "ordinary_edges": [0, 11600, 47150, 100525, 191950, 243725, 609350],
+        "ordinary_rates": [0.10, 0.12, 0.22, 0.24, 0.32, 0.35, 0.37],
+        "gains_edges": [0, 47025, 518900],
+        "gains_rates": [0.0, 0.15, 0.20],
+    },
+}
+
+# IRS Uniform Lifetime Table (2022+), distribution period by age; 120 and older use 2.0
+UNIFORM_LIFETIME_TABLE = {
+    72: 27.4, 73: 26.5, 74: 25.5, 75: 24.6, 76: 23.7, 77: 22.9, 78: 22.0, 79: 21.1,
+    80: 20.2, 81: 19.4, 82: 18.5, 83: 17.7, 84: 16.8, 85: 16.0, 86: 15.2, 87: 14.4,
+    88: 13.7, 89: 12.9, 90: 12.2, 91: 11.5, 92: 10.8, 93: 10.1, 94: 9.5, 95: 8.9,
+    96: 8.4, 97: 7.8, 98: 7.3, 99: 6.8, 100: 6.4, 101: 6.0, 102: 5.6, 103: 5.2,
+    104: 4.9, 105: 4.6, 106: 4.3, 107: 4.1, 108: 3.9, 109: 3.7, 110: 3.5, 111: 3.4,
+    112: 3.3, 113: 3.1, 114: 3.0, 115: 2.9, 116: 2.8, 117: 2.7, 118: 2.5, 119: 2.3,
+    120: 2.0,
+}
+
+# IRS Single Life Table (2022+), life expectancy by age, for 72(t) SEPP payments
+SINGLE_LIFE_TABLE = {
+    30: 55.3, 31: 54.4, 32: 53.4, 33: 52.5, 34: 51.5, 35: 50.5, 36: 49.6, 37: 48.6, 38: 47.7,
+    39: 46.7, 40: 45.7, 41: 44.8, 42: 43.8, 43: 42.9, 44: 41.9, 45: 41.0, 46: 40.0, 47: 39.0,
+    48: 38.1, 49: 37.1, 50: 36.2, 51: 35.3, 52: 34.3, 53: 33.4, 54: 32.5, 55: 31.6, 56: 30.6,
+    57: 29.8, 58: 28.9, 59: 28.0, 60: 27.1,
+}
+
+ORDERING_RULES = {
+    "conventional": "Taxable → Tax-Deferred → Roth",
+    "deferred_first": "Tax-Deferred → Taxable → Roth",
+    "bracket_fill": "Fill Low Bracket from Tax-Deferred, then Taxable → Tax-Deferred → Roth",
+}
+
+TAXABLE, DEFERRED, ROTH = 0, 1, 2
+
+# Last breakpoint for the piecewise-linear tax curves; np.interp is flat past it
+_CEILING = 1e12
+
+
+@lru_cache(maxsize=None)
+def _curves(filing_status):
+    # Piecewise-linear cumulative tax by taxable income, for np.interp
+    import numpy as np
+
+    table = TAX_TABLES[filing_status]
+    curves = {}
+    for kind in ("ordinary", "gains"):
+        edges = np.append(np.asarray(table[f"{kind}_edges"], dtype=float), _CEILING)
+        cumulative = np.concatenate([[0.0], np.cumsum(np.diff(edges) * np.asarray(table[f"{kind}_rates"]))])
+        curves[kind] = (edges, cumulative)
+    return curves
+
+
+def bracket_top(rate, filing_status="married_joint"):
+    """Taxable income where the bracket taxed at `rate` ends, in base-year dollars."""
+    table = TAX_TABLES[filing_status]
+    position = table["ordinary_rates"].index(rate)
+    edges = table["ordinary_edges"] + [_CEILING]
+    return edges[position + 1]
+
+
+def federal_tax(ordinary_income, capital_gains=0.0, filing_status="married_joint", price_index=1.0):
+    """
+    Federal income tax on ordinary income plus long-term gains, vectorized.
+
+    The standard deduction applies to ordinary income first, then to gains. Gains are
+    taxed at 0/15/20% stacked on top of ordinary taxable income. Brackets and the
+    deduction are indexed by `price_index` (cumulative inflation since the table year).
+    """
+    import numpy as np
+
+    curves = _curves(filing_status)
+    deduction = TAX_TABLES[filing_status]["standard_deduction"]
+
+    # Index brackets by working in base-year dollars
+    ordinary = np.asarray(ordinary_income, dtype=float) / price_index
+    gains = np.asarray(capital_gains, dtype=float) / price_index
+
+    taxable_ordinary = np.maximum(ordinary - deduction, 0.0)
+    taxable_gains = np.maximum(gains - np.maximum(deduction - ordinary, 0.0), 0.0)
+
+    ordinary_tax = np.interp(taxable_ordinary, *curves["ordinary"])
+    gains_tax = np.interp(taxable_ordinary + taxable_gains, *curves["gains"]) - np.interp(taxable_ordinary, *curves["gains"])
+    return (ordinary_tax + gains_tax) * price_index
+
+
+def gross_up_ordinary(net_amount, filing_status="married_joint"):
+    """
+    Tax-deferred withdrawal needed to net `net_amount` after federal tax, with no other income.
+    Net-of-tax is piecewise linear in the withdrawal, so the inverse is an exact np.interp.
+    """
+    import numpy as np
+
+    deduction = TAX_TABLES[filing_status]["standard_deduction"]
+    gross_points = np.concatenate([[0.0], deduction + _curves(filing_status)["ordinary"][0]])
+    net_points = gross_points - federal_tax(gross_points, filing_status=filing_status)
+    return np.interp(net_amount, net_points, gross_points)
+
+
+def rmd_divisor(age):
+    """Uniform Lifetime Table distribution period; ages under 72 return inf (no RMD)."""
+    import numpy as np
+
+    ages = np.array(list(UNIFORM_LIFETIME_TABLE), dtype=float)
+    periods = np.array(list(UNIFORM_LIFETIME_TABLE.values()))
+    age = np.floor(np.asarray(age, dtype=float))
+    return np.where(age < ages[0], np.inf, np.interp(age, ages, periods))
+
+
+def sepp_payment(balance, age, rate=0.05):
+    """
+    Fixed annual 72(t) payment under the amortization method: the balance paid off over the
+    single life expectancy at `age`, at up to 5% interest. Vectorized over balances.
+    """
+    import numpy as np
+
+    ages = np.array(list(SINGLE_LIFE_TABLE), dtype=float)
+    periods = np.interp(np.floor(age), ages, np.array(list(SINGLE_LIFE_TABLE.values())))
+    return np.asarray(balance, dtype=float) * rate / (1 - (1 + rate) ** -periods)
+
+
+def _paths(value, n_scenarios, n_years):
+    import numpy as np
+
+    return np.broadcast_to(np.asarray(value, dtype=float), (n_scenarios, n_years))
+
+
+def _order(ordering, early):
+    # Buckets drawn in turn; before access age, penalized tax-deferred money is the last resort
+    order = [DEFERRED, TAXABLE, ROTH] if ordering == "deferred_first" else [TAXABLE, DEFERRED, ROTH]
+    if early:
+        order = [TAXABLE, ROTH, DEFERRED]
+    return order
+
+
+def simulate_drawdown(start_age, taxable, taxable_basis, deferred, roth, roth_basis, annual_spending,
+                      returns, inflation, n_years=None, ordering="conventional", filing_status="married_joint",
+                      other_income=0.0, access_age=59.5, rmd_age=73, early_withdrawal_penalty=0.10,
+                      fill_bracket_rate=0.12, roth_conversions=0.0, conversion_seasoning=5,
+                      sepp_fraction=0.0, sepp_rate=0.05, max_iterations=25, tolerance=0.5):
+    """
+    Year-by-year decumulation for many scenarios at once.
+
+    Each year, spending (in today's dollars, grown with inflation) plus federal tax and any
+    early-withdrawal penalty is drawn at the start of the year, after required minimum
+    distributions, following `ordering`. "bracket_fill" also draws tax-deferred money up to
+    the top of the `fill_bracket_rate` bracket every year from access age on, whether or not
+    it is needed, and reinvests the excess in the taxable account. The gross withdrawal that covers its own tax is
+    found as a vectorized fixed point: gross = need + tax(gross), which converges because
+    the marginal tax-plus-penalty rate is under 100%. Balances then grow by that year's return.
+
+    - Taxable withdrawals realize gains pro rata to the account's unrealized gain share.
+    - Tax-deferred withdrawals are ordinary income and pay the penalty before `access_age`.
+    - Roth withdrawals are tax-free; before `access_age` only contributions (`roth_basis`) are available.
+    - `other_income` (taxable as ordinary income) offsets spending; surpluses go to the taxable account.
+    - `roth_conversions` (today's dollars per year) move tax-deferred money to Roth as ordinary
+      income; before `access_age` each conversion becomes spendable `conversion_seasoning` years later.
+    - `sepp_fraction` of the tax-deferred balance is split into a 72(t) account paying a fixed,
+      penalty-free sepp_payment until the later of five years and `access_age`.
+
+    `other_income` and `roth_conversions` may vary by scenario and year; `sepp_fraction` by scenario.
+
+    `returns` and `inflation` are scalars, (years,) or (scenarios, years) arrays, e.g. paths
+    from monte_carlo.draw_paths. Returns a dict of (scenarios, years[+1]) arrays in nominal
+    dollars plus `price_index` for converting to today's dollars.
+    """
+    import numpy as np
+
+    if ordering not in ORDERING_RULES:
+        raise ValueError(f"Unknown ordering rule '{ordering}'. Choose from: {', '.join(ORDERING_RULES)}")
+    if filing_status not in TAX_TABLES:
+        raise ValueError(f"Unknown filing status '{filing_status}'. Choose from: {', '.join(TAX_TABLES)}")
+
+    returns, inflation, other_income, roth_conversions = (
+        np.asarray(x, dtype=float) for x in (returns, inflation, other_income, roth_conversions)
+    )
+    sepp_fraction = np.asarray(sepp_fraction, dtype=float)
+    n_scenarios = max(
+        [x.shape[0] for x in (returns, inflation, other_income, roth_conversions) if x.ndim == 2] + [sepp_fraction.size]
+    )
+    if n_years is None:
+        n_years = max(returns.shape[-1] if returns.ndim else 1, inflation.shape[-1] if inflation.ndim else 1)
+    returns = _paths(returns, n_scenarios, n_years)
+    inflation = _paths(inflation, n_scenarios, n_years)
+    other_income = _paths(other_income, n_scenarios, n_years)
+    roth_conversions = _paths(roth_conversions, n_scenarios, n_years)
+
+    shape = (n_scenarios, n_years)
+    balance = np.zeros((3, n_scenarios))
+    balance[TAXABLE], balance[DEFERRED], balance[ROTH] = taxable, deferred, roth
+    basis = np.full(n_scenarios, float(taxable_basis))
+    contributions = np.full(n_scenarios, float(roth_basis))
+    price = np.ones(n_scenarios)
+
+    # 72(t) account, split off the tax-deferred balance and merged back once the SEPP ends
+    sepp_years = max(5, int(np.ceil(access_age - start_age))) if start_age < access_age else 0
+    sepp_balance = balance[DEFERRED] * np.broadcast_to(sepp_fraction, n_scenarios) if sepp_years else np.zeros(n_scenarios)
+    balance[DEFERRED] -= sepp_balance
+    sepp_annual = sepp_payment(sepp_balance, start_age, sepp_rate)
+
+    history = np.zeros((3, n_scenarios, n_years + 1))
+    history[:, :, 0] = balance
+    history[DEFERRED, :, 0] += sepp_balance
+    withdrawals = np.zeros((3,) + shape)
+    conversions = np.zeros(shape)
+    sepp = np.zeros(shape)
+    taxes = np.zeros(shape)
+    penalties = np.zeros(shape)
+    rmds = np.zeros(shape)
+    shortfall = np.zeros(shape)
+    price_index = np.ones((n_scenarios, n_years + 1))
+
+    fill_top = bracket_top(fill_bracket_rate, filing_status) + TAX_TABLES[filing_status]["standard_deduction"]
+
+    for t in range(n_years):
+        age = start_age + t
+        early = age < access_age
+        need = annual_spending * price
+        income = other_income[:, t] * price
+
+        if t == sepp_years:
+            balance[DEFERRED] += sepp_balance
+            sepp_balance = np.zeros(n_scenarios)
+        sepp_draw = np.minimum(sepp_annual, sepp_balance) if t < sepp_years else np.zeros(n_scenarios)
+        if early and t >= conversion_seasoning:
+            contributions = contributions + conversions[:, t - conversion_seasoning]
+
+        rmd = balance[DEFERRED] / rmd_divisor(age) if age >= rmd_age else np.zeros(n_scenarios)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gain_share = np.where(balance[TAXABLE] > 0, np.clip(1 - basis / balance[TAXABLE], 0, 1), 0.0)
+
+        available = balance.copy()
+        available[DEFERRED] -= rmd
+        if early:
+            available[ROTH] = np.minimum(contributions, balance[ROTH])
+        if ordering == "bracket_fill" and not early:
+            fill = np.minimum(np.maximum(fill_top * price - income - rmd, 0.0), available[DEFERRED])
+            available[DEFERRED] -= fill
+        else:
+            fill = np.zeros(n_scenarios)
+        converted = np.minimum(roth_conversions[:, t] * price, available[DEFERRED])
+        available[DEFERRED] -= converted
+        forced = rmd + fill + sepp_draw
+        order = _order(ordering, early)
+
+        tax = np.zeros(n_scenarios)
+        penalty = np.zeros(n_scenarios)
+        for _ in range(max_iterations):
+            remaining = np.maximum(need + tax + penalty - forced - income, 0.0)
+            take = np.zeros((3, n_scenarios))
+            for bucket in order:
+                take[bucket] = np.minimum(remaining, available[bucket])
+                remaining = remaining - take[bucket]
+
+            new_tax = federal_tax(forced + converted + take[DEFERRED] + income, take[TAXABLE] * gain_share, filing_status, price)
+            new_penalty = early_withdrawal_penalty * take[DEFERRED] if early else np.zeros(n_scenarios)
+            converged = np.max(np.abs(new_tax + new_penalty - tax - penalty), initial=0.0) < tolerance
+            tax, penalty = new_tax, new_penalty
+            if converged:
+                break
+
+        surplus = np.maximum(forced + income - need - tax - penalty, 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            basis_share = np.where(balance[TAXABLE] > 0, np.minimum(basis / balance[TAXABLE], 1), 0.0)
+        basis = basis - take[TAXABLE] * basis_share + surplus
+        contributions = np.maximum(contributions - take[ROTH], 0.0)
+
+        balance[TAXABLE] += surplus - take[TAXABLE]
+        balance[DEFERRED] -= rmd + fill + converted + take[DEFERRED]
+        balance[ROTH] += converted - take[ROTH]
+        sepp_balance = (sepp_balance - sepp_draw) * (1 + returns[:, t])
+        np.maximum(balance, 0.0, out=balance)
+        balance *= 1 + returns[:, t]
+        basis = np.minimum(basis, balance[TAXABLE])
+
+        withdrawals[:, :, t] = take
+        withdrawals[DEFERRED, :, t] += forced
+        taxes[:, t] = tax
+        penalties[:, t] = penalty
+        rmds[:, t] = rmd
+        conversions[:, t] = converted
+        sepp[:, t] = sepp_draw
+        shortfall[:, t] = remaining
+        history[:, :, t + 1] = balance
+        history[DEFERRED, :, t + 1] += sepp_balance
+        price = price * (1 + inflation[:, t])
+        price_index[:, t + 1] = price
+
+    short = shortfall > 0.5
+    first_short = short.argmax(axis=1)
+    depleted_year = np.where(short.any(axis=1), first_short, np.inf)
+    total = history.sum(axis=0)
+
+    return {
+        "taxable": history[TAXABLE],
+        "deferred": history[DEFERRED],
+        "roth": history[ROTH],
+        "total": total,
+        "withdrawals": {"taxable": withdrawals[TAXABLE], "deferred": withdrawals[DEFERRED], "roth": withdrawals[ROTH]},
+        "rmd": rmds,
+        "roth_conversions": conversions,
+        "sepp_payments": sepp,
+        "taxes": taxes,
+        "penalties": penalties,
+        "shortfall": shortfall,
+        "price_index": price_index,
+        "depleted_year": depleted_year,
+        "success": ~short.any(axis=1),
+        "lifetime_taxes": ((taxes + penalties) / price_index[:, :-1]).sum(axis=1),
+        "ending_balance_real": total[:, -1] / price_index[:, -1],
+    }
+
+
+def compare_orderings(start_age, taxable, taxable_basis, deferred, roth, roth_basis, annual_spending,
+                      returns, inflation, **kwargs):
+    """Run every ordering rule on the same paths; returns {rule: simulate_drawdown result}."""
+    return {
+        rule: simulate_drawdown(start_age, taxable, taxable_basis, deferred, roth, roth_basis, annual_spending,
+                                returns, inflation, ordering=rule, **kwargs)
+        for rule in ORDERING_RULES
+    }
+
+
+def tax_aware_access_factor(retirement_assets, base_assets, annual_spending, bridge_years,
+                            filing_status="married_joint", early_withdrawal_penalty=0.10):
+    """
+    Share of a tax-deferred balance that is spendable after federal tax, and after the
+    early-withdrawal penalty on whatever part of the bridge (`bridge_years` of spending
+    before access age) the other assets cannot cover. Vectorized; all amounts in today's dollars.
+    """
+    import numpy as np
+
+    retirement_assets, base_assets, annual_spending, bridge_years = (
+        np.asarray(x, dtype=float) for x in (retirement_assets, base_assets, annual_spending, bridge_years)
+    )
+    gross = gross_up_ordinary(annual_spending, filing_status)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        average_rate = np.where(gross > 0, 1 - annual_spending / gross, 0.0)
+        early_net = np.maximum(annual_spending * bridge_years - base_assets, 0.0)
+        early_gross = early_net / np.maximum(1 - average_rate - early_withdrawal_penalty, 1e-9)
+        early_share = np.where(retirement_assets > 0, np.minimum(early_gross / retirement_assets, 1.0), 0.0)
+    factor = np.clip(1 - average_rate - early_withdrawal_penalty * early_share, 0.0, 1.0)
+    return factor, average_rate, early_share
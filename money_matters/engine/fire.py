@@ -0,0 +1,462 @@
+# FIRE Progress Calculator
+# NumPy is imported inside the array functions so the engine package imports without it
+
+import datetime
+
+from .cache import cached_simulation
+from .periods import annual_totals, growth_factors, period_years, savings_growth_factor
+
+# Profiles per block in estimate_years_to_fi_batch; each block holds one (profiles, years) net worth grid
+SOLVER_BLOCK_PROFILES = 8192
+
+
+def calculate_fire_number(target_annual_expenses: float, withdrawal_rate: float = 0.04) -> float:
+    return target_annual_expenses / withdrawal_rate
+
+
+def projected_net_worth(current_net_worth, annual_savings, annual_return, years, merit_growth=0.0,
+                        periods_per_year=1):
+    """
+    Closed-form net worth after `years` of saving then compounding.
+    Savings grow by `merit_growth` each year. Accepts scalars or NumPy arrays.
+    With `periods_per_year` > 1, each year's savings are deposited in equal parts every
+    period; at year ends that only rescales the savings term (savings_growth_factor).
+    """
+    import numpy as np
+
+    net_worth, savings, rate, years, growth = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (current_net_worth, annual_savings, annual_return, years, merit_growth))
+    )
+    r = 1 + rate
+    compounded = r ** years
+
+    # Growing annuity: sum of g^k * r^(n-1-k) for k in 0..n-1 = r^(n-1) * (1 - q^n) / (1 - q)
+    # with q = g / r. Written with expm1 of log q so it stays exact as g approaches r (limit n).
+    log_q = np.log1p(growth) - np.log1p(rate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = r ** (years - 1) * np.where(log_q == 0, years, np.expm1(years * log_q) / np.expm1(log_q))
+
+    return net_worth * compounded + savings * savings_growth_factor(rate, periods_per_year) * annuity
+
+
+def estimate_years_to_fi_batch(current_net_worth, annual_savings, annual_return, fire_number,
+                               merit_growth=0.0, max_years=100, return_history=True, fractional=False):
+    """
+    Vectorized years-to-FI solver over whole arrays of profiles.
+
+    Evaluates projected_net_worth for every profile at every year end in closed form and
+    takes the first year each profile reaches its FIRE number. Profiles are solved in blocks
+    of SOLVER_BLOCK_PROFILES, so without history memory stays flat however many there are.
+    Returns (years, final_net_worth, history). History is a (profiles, max_years + 1)
+    array padded with NaN after each profile's FIRE year, or None if not requested.
+    With `fractional=True`, years are linearly interpolated within the crossing year.
+    Profiles that never get there stop at `max_years`.
+    """
+    import numpy as np
+
+    start, savings, rate, target, growth = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (current_net_worth, annual_savings, annual_return, fire_number, merit_growth))
+    )
+    shape = start.shape
+    start, savings, rate, target, growth = (x.reshape(-1, 1) for x in (start, savings, rate, target, growth))
+    n_profiles = start.shape[0]
+
+    years = np.empty(n_profiles, dtype=float if fractional else int)
+    final_net_worth = np.empty(n_profiles)
+    history = np.empty((n_profiles, max_years + 1)) if return_history else None
+    year_grid = np.arange(max_years + 1)
+
+    for lo in range(0, n_profiles, SOLVER_BLOCK_PROFILES):
+        block = slice(lo, lo + SOLVER_BLOCK_PROFILES)
+        rows = np.arange(start[block].shape[0])
+
+        # (block profiles, max_years + 1) net worth at every year end, year 0 included
+        path = projected_net_worth(start[block], savings[block], rate[block], year_grid, growth[block])
+        reached = path >= target[block]
+        first = reached.argmax(axis=1)
+        hit = reached[rows, first]
+        crossing = np.where(hit, first, max_years)
+        final_net_worth[block] = path[rows, crossing]
+
+        if fractional:
+            block_years = crossing.astype(float)
+            # Interpolate within the crossing year; profiles already at FI at year 0 stay at 0
+            inside = hit & (first > 0)
+            previous = path[rows[inside], first[inside] - 1]
+            reached_value = path[rows[inside], first[inside]]
+            block_years[inside] = first[inside] - 1 + (target[block][inside, 0] - previous) / (reached_value - previous)
+            years[block] = block_years
+        else:
+            years[block] = crossing
+
+        if history is not None:
+            history[block] = np.where(year_grid <= crossing[:, None], path, np.nan)
+
+    if history is not None:
+        history = history.reshape(shape + (max_years + 1,))
+    return years.reshape(shape), final_net_worth.reshape(shape), history
+
+
+def _period_path(current_net_worth, cashflow, growth):
+    # Add-then-grow each period in closed form: NW_m = G_m * (NW_0 + sum_{k<m} c_k / G_k)
+    import numpy as np
+
+    return growth * (current_net_worth + np.concatenate([[0.0], np.cumsum(cashflow / growth[:-1])]))
+
+
+@cached_simulation
+def estimate_years_to_fi(current_net_worth: float, annual_savings: float, annual_return: float, fire_number: float,
+                         merit_growth: float = 0.0, periods_per_year: int = 1,
+                         max_years: int = 100) -> tuple[float, float, list[float]]:
+    """
+    Years until net worth reaches `fire_number`, the net worth then, and the year-end history.
+    Monthly mode (`periods_per_year=12`) runs one cumulative pass over every month and
+    reports years to the month; the history ends with the crossing month.
+    """
+    if periods_per_year == 1:
+        years, net_worth, history = estimate_years_to_fi_batch(
+            current_net_worth, annual_savings, annual_return, fire_number, merit_growth, max_years=max_years
+        )
+        years = int(years)
+        return years, float(net_worth), history[: years + 1].tolist()
+
+    import numpy as np
+
+    growth = growth_factors(annual_return, max_years, periods_per_year)
+    deposits = annual_savings / periods_per_year * (1 + merit_growth) ** period_years(max_years, periods_per_year)
+    path = _period_path(current_net_worth, deposits, growth)
+
+    reached = np.flatnonzero(path >= fire_number)
+    period = int(reached[0]) if reached.size else path.size - 1
+    history = path[: period + 1 : periods_per_year].tolist()
+    if period % periods_per_year:
+        history.append(float(path[period]))
+    return period / periods_per_year, float(path[period]), history
+
+
+def get_effective_assets(user_age: float, liquid_assets: float, retirement_assets: float, fire_year: int,
+                         include_illiquid: bool = False, illiquid_assets: float = 0, access_age: float = 59.5,
+                         current_year: int | None = None, access_model: str = "haircut",
+                         annual_spending: float = 0.0, filing_status: str = "married_joint") -> tuple[float, str, dict]:
+    """
+    Assets that count toward FIRE in `fire_year`.
+
+    With the default "haircut" model, retirement accounts lose 10% of their value for every
+    year FIRE comes before `access_age`. The "tax_aware" model instead counts them net of
+    federal income tax on `annual_spending`, plus the early-withdrawal penalty on the part of
+    the bridge that other assets cannot cover (see drawdown.tax_aware_access_factor).
+    """
+    if current_year is None:
+        current_year = datetime.datetime.now().year
+    access_year = current_year + int(access_age - user_age)
+
+    base_assets = liquid_assets + (illiquid_assets if include_illiquid else 0)
+    years_to_access = max(access_year - fire_year, 0)
+
+    if access_model == "tax_aware":
+        from .drawdown import tax_aware_access_factor
+
+        factor, tax_rate, early_share = (
+            float(x) for x in tax_aware_access_factor(
+                retirement_assets, base_assets, annual_spending, years_to_access, filing_status
+            )
+        )
+        if retirement_assets <= 0:
+            message = "✅ No retirement-restricted assets to adjust for taxes or early access."
+        elif years_to_access == 0:
+            message = (
+                f"✅ Retirement assets will be fully accessible at FIRE year. After an estimated "
+                f"{tax_rate:.0%} average federal tax on withdrawals, about {factor:.0%} of them counts toward FIRE."
+            )
+        else:
+            message = (
+                f"🚧 You will reach FIRE {years_to_access} years before you can access retirement accounts penalty-free. "
+                f"Your other assets leave {early_share:.0%} of your retirement balance to be drawn early; after the 10% "
+                f"penalty on that share and an estimated {tax_rate:.0%} average federal tax, about {factor:.0%} of those assets counts toward FIRE."
+            )
+        return (
+            base_assets + retirement_assets * factor,
+            message,
+            {
+                "bridge_years": years_to_access,
+                "reduction_factor": factor,
+                "needs_bridge_strategy": years_to_access > 0,
+                "tax_rate": tax_rate,
+                "early_share": early_share,
+            }
+        )
+
+    if fire_year >= access_year:
+        return (
+            base_assets + retirement_assets,
+            "✅ Retirement assets will be fully accessible at FIRE year.",
+            {
+                "bridge_years": 0,
+                "reduction_factor": 1.0,
+                "needs_bridge_strategy": False
+            }
+        )
+    else:
+        reduction_factor = max(0, 1 - (years_to_access / 10))
+        partial_access = retirement_assets * reduction_factor
+        total_assets = base_assets + partial_access
+
+        if retirement_assets > 0:
+            message = (
+                f"🚧 You will reach FIRE {years_to_access} years before you can fully access retirement accounts. "
+                f"We estimate you'll be able to tap into about {reduction_factor:.0%} of those assets during this early phase."
+            )
+        else:
+            message = (
+                f"🚧 You will reach FIRE {years_to_access} years before traditional retirement age, but since you've allocated $0 to retirement-restricted accounts, there's no early access needed."
+            )
+
+        bridge_info = {
+            "bridge_years": years_to_access,
+            "reduction_factor": reduction_factor,
+            "needs_bridge_strategy": True
+        }
+
+        return total_assets, message, bridge_info
+
+
+def get_effective_assets_batch(user_age, liquid_assets, retirement_assets, fire_year, include_illiquid=False, illiquid_assets=0, access_age=59.5, current_year=None,
+                               access_model="haircut", annual_spending=0.0, filing_status="married_joint"):
+    """
+    Array version of get_effective_assets.
+    Returns (effective_assets, bridge_years, reduction_factor) with one entry per profile.
+    """
+    import numpy as np
+
+    if current_year is None:
+        current_year = datetime.datetime.now().year
+    user_age, liquid_assets, retirement_assets, fire_year, illiquid_assets = (
+        np.asarray(x, dtype=float) for x in (user_age, liquid_assets, retirement_assets, fire_year, illiquid_assets)
+    )
+    access_year = current_year + np.trunc(access_age - user_age)
+
+    base_assets = liquid_assets + np.where(include_illiquid, illiquid_assets, 0.0)
+
+    bridge_years = np.maximum(access_year - fire_year, 0)
+    if access_model == "tax_aware":
+        from .drawdown import tax_aware_access_factor
+
+        reduction_factor, _, _ = tax_aware_access_factor(
+            retirement_assets, base_assets, annual_spending, bridge_years, filing_status
+        )
+    else:
+        reduction_factor = np.maximum(0, 1 - bridge_years / 10)
+
+    return base_assets + retirement_assets * reduction_factor, bridge_years, reduction_factor
+
+
+@cached_simulation
+def solve_fire_year(user_age: float, liquid_assets: float, retirement_assets: float, annual_savings: float,
+                    annual_return: float, fire_expenses: float, withdrawal_rate: float,
+                    inflation_rate: float = 0.0, merit_growth: float = 0.0, include_illiquid: bool = False,
+                    illiquid_assets: float = 0, adjust_for_inflation: bool = True, current_year: int | None = None,
+                    max_years: int = 100, access_model: str = "haircut", filing_status: str = "married_joint",
+                    periods_per_year: int = 1) -> dict:
+    """
+    Find the self-consistent FIRE year by bisection.
+
+    A candidate horizon n is accepted when net worth projected from the assets accessible
+    in year n (bridge haircut or tax-aware access included) covers the goal for spending inflated over n years.
+    Per-year projections are built once for every horizon, so each probe is a lookup.
+    Assumes that once the projection catches the goal it stays ahead.
+    """
+    import numpy as np
+
+    if current_year is None:
+        current_year = datetime.datetime.now().year
+
+    # Single simulation pass: growth of $1 and of the savings stream for every horizon
+    horizons = np.arange(max_years + 1)
+    growth = (1 + annual_return) ** horizons
+    contributions = projected_net_worth(0.0, annual_savings, annual_return, horizons, merit_growth, periods_per_year)
+
+    probes = {}
+
+    def evaluate(n):
+        if n not in probes:
+            assets, message, bridge_info = get_effective_assets(
+                user_age, liquid_assets, retirement_assets, current_year + n,
+                include_illiquid=include_illiquid, illiquid_assets=illiquid_assets,
+                current_year=current_year, access_model=access_model,
+                annual_spending=fire_expenses, filing_status=filing_status
+            )
+            expenses = fire_expenses * ((1 + inflation_rate) ** n) if adjust_for_inflation else fire_expenses
+            goal = calculate_fire_number(expenses, withdrawal_rate)
+            net_worth = assets * growth[n] + contributions[n]
+            probes[n] = {
+                "reached": net_worth >= goal,
+                "effective_assets": assets,
+                "adjusted_expenses": expenses,
+                "fire_goal": goal,
+                "bridge_message": message,
+                "bridge_info": bridge_info,
+            }
+        return probes[n]
+
+    if evaluate(0)["reached"]:
+        years = 0
+    elif not evaluate(max_years)["reached"]:
+        years = max_years
+    else:
+        lo, hi = 0, max_years
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if evaluate(mid)["reached"]:
+                hi = mid
+            else:
+                lo = mid
+        years = hi
+
+    result = dict(evaluate(years))
+    del result["reached"]
+    history = result["effective_assets"] * growth[: years + 1] + contributions[: years + 1]
+    result.update({
+        "years_to_fi": years,
+        "fire_year": current_year + years,
+        "final_net_worth": float(history[-1]),
+        "net_worth_history": history.tolist(),
+        "iterations": len(probes),
+        "simulation_passes": 1,
+    })
+    return result
+
+
+@cached_simulation
+def project_lifetime(current_net_worth: float, annual_savings: float, annual_return: float, years_to_fi: int,
+                     fire_expenses: float, user_age: float, end_age: float = 95, inflation_rate: float = 0.0,
+                     merit_growth: float = 0.0, adjust_for_inflation: bool = True, social_security: float = 0.0,
+                     social_security_age: float = 67, pension: float = 0.0, pension_age: float = 65,
+                     periods_per_year: int = 1) -> dict:
+    """
+    Net worth from today through `end_age` in one array pass.
+
+    Each period's cash flow is savings until the FIRE year, then retirement income minus
+    spending, with annual amounts split evenly across `periods_per_year`. Spending and
+    Social Security (today's dollars) step up with inflation each year; the pension is a
+    flat amount from `pension_age`. With the same add-then-grow step as the accumulation
+    projection, NW_m = G_m * (NW_0 + sum_{k<m} c_k / G_k) where G is compounded growth, so
+    the whole path is a cumulative sum. The portfolio is depleted in the first retirement
+    period whose withdrawal exceeds the balance and stays at zero from then on.
+    Net worth is reported at year ends.
+    """
+    import numpy as np
+
+    n_years = max(int(np.ceil(end_age - user_age)), years_to_fi)
+    t = period_years(n_years, periods_per_year)
+    growth = growth_factors(annual_return, n_years, periods_per_year)
+    prices = (1 + inflation_rate) ** t
+    ages = user_age + t
+    retired = t >= years_to_fi
+
+    spending = np.where(retired, fire_expenses * (prices if adjust_for_inflation else 1.0), 0.0) / periods_per_year
+    income = np.where(retired & (ages >= social_security_age), social_security * prices, 0.0)
+    income += np.where(retired & (ages >= pension_age), pension, 0.0)
+    income /= periods_per_year
+    cashflow = np.where(retired, income - spending, annual_savings * (1 + merit_growth) ** t / periods_per_year)
+
+    net_worth = _period_path(current_net_worth, cashflow, growth)
+
+    short = retired & (net_worth[:-1] + cashflow < 0)
+    depleted = bool(short.any())
+    if depleted:
+        first = int(short.argmax())
+        net_worth[first + 1:] = 0.0
+
+    spending, income = (annual_totals(x, periods_per_year) for x in (spending, income))
+    return {
+        "ages": (user_age + np.arange(n_years + 1)).tolist(),
+        "net_worth": net_worth[::periods_per_year].tolist(),
+        "spending": spending.tolist(),
+        "retirement_income": income.tolist(),
+        "withdrawals": np.maximum(spending - income, 0.0).tolist(),
+        "fire_index": years_to_fi,
+        "depletion_age": float(user_age + first / periods_per_year) if depleted else None,
+        "ending_net_worth": float(net_worth[-1]),
+    }
+
+
+def solve_fire_year_batch(user_age, liquid_assets, retirement_assets, annual_savings, annual_return, fire_expenses, withdrawal_rate,
+                          inflation_rate=0.0, merit_growth=0.0, include_illiquid=False, illiquid_assets=0,
+                          adjust_for_inflation=True, current_year=None, max_years=100,
+                          access_model="haircut", filing_status="married_joint", periods_per_year=1):
+    """
+    Array version of solve_fire_year: bisects every profile's FIRE year in lockstep.
+    Returns a dict of arrays plus the number of bisection rounds taken.
+    """
+    import numpy as np
+
+    if current_year is None:
+        current_year = datetime.datetime.now().year
+    fire_expenses, withdrawal_rate, inflation_rate = (
+        np.asarray(x, dtype=float) for x in (fire_expenses, withdrawal_rate, inflation_rate)
+    )
+
+    def evaluate(n):
+        assets, bridge_years, _ = get_effective_assets_batch(
+            user_age, liquid_assets, retirement_assets, current_year + n,
+            include_illiquid=include_illiquid, illiquid_assets=illiquid_assets,
+            current_year=current_year, access_model=access_model,
+            annual_spending=fire_expenses, filing_status=filing_status
+        )
+        expenses = np.where(adjust_for_inflation, fire_expenses * (1 + inflation_rate) ** n, fire_expenses)
+        goal = calculate_fire_number(expenses, withdrawal_rate)
+        net_worth = projected_net_worth(assets, annual_savings, annual_return, n, merit_growth, periods_per_year)
+        return net_worth, goal, assets, expenses, bridge_years
+
+    net_worth, goal, *_ = evaluate(0)
+    reached_now = net_worth >= goal
+    net_worth, goal, *_ = evaluate(max_years)
+    never = net_worth < goal
+
+    lo = np.zeros(reached_now.shape, dtype=int)
+    hi = np.where(reached_now, 0, max_years)
+    searching = ~reached_now & ~never
+    iterations = 2
+
+    while True:
+        open_rows = searching & (hi - lo > 1)
+        if not open_rows.any():
+            break
+        mid = (lo + hi) // 2
+        net_worth, goal, *_ = evaluate(mid)
+        reached = net_worth >= goal
+        hi = np.where(open_rows & reached, mid, hi)
+        lo = np.where(open_rows & ~reached, mid, lo)
+        iterations += 1
+
+    years = hi
+    net_worth, goal, assets, expenses, bridge_years = evaluate(years)
+    return {
+        "years_to_fi": years,
+        "fire_year": current_year + years,
+        "fire_goal": goal,
+        "adjusted_expenses": expenses,
+        "effective_assets": assets,
+        "bridge_years": bridge_years,
+        "final_net_worth": net_worth,
+        "iterations": iterations,
+    }
+
+
+if __name__ == "__main__":
+    # Sample test values (replace these with user inputs later!)
+    current_net_worth = 100000   # dollars
+    annual_savings = 30000       # dollars
+    target_expenses = 40000      # dollars
+    withdrawal_rate = 0.04       # 4%
+    annual_return = 0.07         # 7% growth
+    merit_growth = 0.02  # For example, a 2% annual savings increase
+
+    # Run calculations
+    fire_goal = calculate_fire_number(target_expenses, withdrawal_rate)
+    years_to_fi, final_net_worth, net_worth_history = estimate_years_to_fi(current_net_worth, annual_savings, annual_return, fire_goal, merit_growth)
+
+    # Display results
+    print(f"FIRE goal: ${fire_goal:,.0f}")
+    print(f"Estimated years to FI: {years_to_fi} years")
+    print(f"Projected net worth at FI: ${final_net_worth:,.0f}")
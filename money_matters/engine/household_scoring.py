@@ -0,0 +1,79 @@
+# household_scoring.py
+# Headless batch scoring of many household profiles (no Streamlit required)
+
+import datetime
+
+import numpy as np
+
+from .fire import solve_fire_year_batch
+
+# Columns every profile batch must provide. Rates are decimals (0.07 = 7%), like the Core Tracker after conversion.
+REQUIRED_COLUMNS = [
+    "user_age",
+    "liquid_assets",
+    "retirement_assets",
+    "annual_savings",
+    "annual_return",
+    "inflation_rate",
+    "withdrawal_rate",
+    "fire_expenses",
+]
+
+# Optional columns and the value used when a batch leaves them out
+OPTIONAL_COLUMNS = {
+    "illiquid_assets": 0.0,
+    "include_illiquid": False,
+    "savings_growth": 0.0,
+    "adjust_fire_expenses_for_inflation": True,
+}
+
+
+def _column(profiles, name, size):
+    if name in profiles:
+        return np.asarray(profiles[name])
+    return np.full(size, OPTIONAL_COLUMNS[name])
+
+
+def score_households(profiles, current_year=None, max_years=100):
+    """
+    Score a batch of households with the same FIRE-year solver as the Core Tracker.
+
+    `profiles` is any mapping of column name -> array (a dict of NumPy arrays or a
+    pandas DataFrame both work). Returns a dict of arrays with one entry per household:
+    fire_goal, adjusted_expenses, years_to_fi, fire_year, fire_age, progress_pct,
+    bridge_years, effective_assets and final_net_worth.
+    """
+    missing = [name for name in REQUIRED_COLUMNS if name not in profiles]
+    if missing:
+        raise ValueError(f"Missing profile columns: {', '.join(missing)}")
+
+    if current_year is None:
+        current_year = datetime.datetime.now().year
+
+    cols = {name: np.asarray(profiles[name], dtype=float) for name in REQUIRED_COLUMNS}
+    size = cols["user_age"].shape[0]
+    illiquid_assets = _column(profiles, "illiquid_assets", size).astype(float)
+    include_illiquid = _column(profiles, "include_illiquid", size).astype(bool)
+    savings_growth = _column(profiles, "savings_growth", size).astype(float)
+    adjust_for_inflation = _column(profiles, "adjust_fire_expenses_for_inflation", size).astype(bool)
+
+    solved = solve_fire_year_batch(
+        cols["user_age"], cols["liquid_assets"], cols["retirement_assets"],
+        cols["annual_savings"], cols["annual_return"], cols["fire_expenses"], cols["withdrawal_rate"],
+        inflation_rate=cols["inflation_rate"], merit_growth=savings_growth,
+        include_illiquid=include_illiquid, illiquid_assets=illiquid_assets,
+        adjust_for_inflation=adjust_for_inflation, current_year=current_year, max_years=max_years
+    )
+    years_to_fi = solved["years_to_fi"]
+
+    return {
+        "fire_goal": solved["fire_goal"],
+        "adjusted_expenses": solved["adjusted_expenses"],
+        "years_to_fi": years_to_fi,
+        "fire_year": solved["fire_year"],
+        "fire_age": cols["user_age"] + years_to_fi,
+        "progress_pct": np.minimum(solved["effective_assets"] / solved["fire_goal"], 1.0),
+        "bridge_years": solved["bridge_years"],
+        "effective_assets": solved["effective_assets"],
+        "final_net_worth": solved["final_net_worth"],
+    }
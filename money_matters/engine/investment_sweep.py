@@ -0,0 +1,154 @@
+# investment_sweep.py
+# Broadcast sensitivity grid for the real estate vs. index fund comparison (no Streamlit required)
+
+import numpy as np
+
+from .amortization import amortization_schedule, monthly_payment
+from .periods import annual_totals, deflators, growth_factors, period_rate, period_years
+
+SWEEP_AXES = ["appreciation_rate", "mortgage_rate", "equity_return", "holding_period"]
+
+# Appreciation-rate chunks evaluated between progress reports
+PROGRESS_STEPS = 10
+
+
+def real_estate_contribution_grid(property_value, down_payment_pct, mortgage_years, annual_rent, annual_expenses,
+                                  rental_growth_rate, inflation_rate, adjust_for_inflation,
+                                  appreciation_rates, mortgage_rates, max_years,
+                                  closing_costs=0.0, renovation_costs=0.0, periods_per_year=1):
+    """
+    Real estate FIRE contribution for every appreciation x mortgage rate x hold length,
+    as an (appreciation, mortgage, max_years) array where [..., h - 1] is an h-year hold.
+    Same accounting as simulate_real_estate_fire_contribution: final equity plus
+    cumulative cash flow, minus closing and renovation costs. Rates are in percent.
+    """
+    appreciation_rates = np.asarray(appreciation_rates, dtype=float)
+    mortgage_rates = np.asarray(mortgage_rates, dtype=float)
+    years = np.arange(max_years)
+    deflator = deflators(inflation_rate / 100, max_years)[:-1] if adjust_for_inflation else np.ones(max_years)
+
+    loan_amount = property_value * (1 - down_payment_pct / 100)
+    loan_balance = amortization_schedule(loan_amount, mortgage_rates, mortgage_years, max_years, 0)["Ending Balance"]
+    if down_payment_pct == 100:
+        annual_debt_service = np.zeros(mortgage_rates.shape)
+    else:
+        annual_debt_service = monthly_payment(loan_amount, mortgage_rates, mortgage_years) * 12
+
+    property_value_path = property_value * (1 + appreciation_rates[:, None] / 100) ** years  # (A, T)
+    equity = (property_value_path[:, None, :] - loan_balance[None, :, :]) * deflator           # (A, M, T)
+
+    if periods_per_year == 1:
+        net_income = annual_rent * (1 + rental_growth_rate / 100) ** years - annual_expenses * (1 + inflation_rate / 100) ** years
+        cashflow = (net_income[None, :] - annual_debt_service[:, None]) * deflator              # (M, T)
+    else:
+        # Same as project_cashflow: each period deflated by its own price level, then summed per year
+        period_year = period_years(max_years, periods_per_year)
+        net_income = annual_rent * (1 + rental_growth_rate / 100) ** period_year - annual_expenses * (1 + inflation_rate / 100) ** period_year
+        period_deflator = deflators(inflation_rate / 100, max_years, periods_per_year)[:-1] if adjust_for_inflation else 1.0
+        cashflow = annual_totals((net_income[None, :] - annual_debt_service[:, None]) / periods_per_year * period_deflator, periods_per_year)
+
+    return equity + np.cumsum(cashflow, axis=-1)[None, :, :] - (closing_costs + renovation_costs)
+
+
+def index_fund_contribution_grid(index_investment, dividend_yield, reinvest_dividends, inflation_rate,
+                                 adjust_for_inflation, equity_returns, max_years, periods_per_year=1):
+    """
+    Index fund FIRE contribution for every equity return x hold length, as an
+    (equity_return, max_years) array. Same accounting as simulate_equity.
+    """
+    equity_returns = np.asarray(equity_returns, dtype=float)
+    growth = 1 + equity_returns[:, None] / 100
+    years = np.arange(1, max_years + 1)
+    deflator = deflators(inflation_rate / 100, max_years)[1:]
+    payout = dividend_yield / 100 / periods_per_year
+
+    if reinvest_dividends:
+        step = (1 + period_rate(equity_returns[:, None] / 100, periods_per_year)) * (1 + payout)
+        contribution = index_investment * step ** (years * periods_per_year)
+        return contribution * deflator if adjust_for_inflation else contribution
+
+    # Dividends are paid on each period's starting value and set aside
+    portfolio = index_investment * growth ** years
+    if periods_per_year == 1:
+        dividends = np.cumsum(portfolio / growth * payout, axis=-1)
+    else:
+        period_values = index_investment * growth_factors(equity_returns / 100, max_years, periods_per_year)[:, :-1]
+        dividends = np.cumsum(period_values * payout, axis=-1)[:, periods_per_year - 1::periods_per_year]
+    contribution = portfolio * deflator if adjust_for_inflation else portfolio
+    return contribution + dividends * deflator
+
+
+def breakeven_equity_returns(margin, equity_returns):
+    """
+    Equity return at which both strategies tie, linearly interpolated along the
+    equity-return axis (axis -2 of `margin`, which must be decreasing along it).
+    NaN where one strategy wins across the whole swept range.
+    """
+    equity_returns = np.asarray(equity_returns, dtype=float)
+    margin = np.moveaxis(margin, -2, -1)
+    ahead = (margin > 0).sum(axis=-1)
+    inside = (ahead > 0) & (ahead < equity_returns.size)
+
+    upper = np.clip(ahead, 1, equity_returns.size - 1)
+    before = np.take_along_axis(margin, (upper - 1)[..., None], axis=-1)[..., 0]
+    after = np.take_along_axis(margin, upper[..., None], axis=-1)[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = before / (before - after)
+    crossing = equity_returns[upper - 1] + share * (equity_returns[upper] - equity_returns[upper - 1])
+    return np.where(inside, crossing, np.nan)
+
+
+def sweep_investments(property_value, down_payment_pct, mortgage_years, annual_rent, annual_expenses,
+                      rental_growth_rate, inflation_rate, adjust_for_inflation,
+                      index_investment, dividend_yield, reinvest_dividends,
+                      appreciation_rates, mortgage_rates, equity_returns, holding_periods,
+                      closing_costs=0.0, renovation_costs=0.0, periods_per_year=1, progress=None):
+    """
+    Evaluate the full appreciation x mortgage rate x equity return x holding period grid.
+
+    Each strategy is computed once over its own axes and the comparison is a single
+    broadcast. Returns a dict with the axis values, real_estate (A, M, H),
+    index_fund (E, H), margin (A, M, E, H) = real estate minus index fund, and
+    breakeven_equity_return (A, M, H). If given, `progress(fraction, message)` is called
+    after each chunk of appreciation rates, which are independent of one another.
+    """
+    report = progress or (lambda fraction, message=None: None)
+    appreciation_rates = np.asarray(appreciation_rates, dtype=float)
+    mortgage_rates = np.asarray(mortgage_rates, dtype=float)
+    equity_returns = np.asarray(equity_returns, dtype=float)
+    holding_periods = np.asarray(holding_periods, dtype=int)
+    max_years = int(holding_periods.max())
+    picks = holding_periods - 1
+
+    report(0.0, f"Index fund across {equity_returns.size} returns")
+    index_fund = index_fund_contribution_grid(
+        index_investment, dividend_yield, reinvest_dividends, inflation_rate,
+        adjust_for_inflation, equity_returns, max_years, periods_per_year
+    )[..., picks]
+
+    shape = (appreciation_rates.size, mortgage_rates.size)
+    real_estate = np.empty(shape + (holding_periods.size,))
+    margin = np.empty(shape + index_fund.shape)
+    breakeven = np.empty(shape + (holding_periods.size,))
+    steps = 1 if progress is None else min(PROGRESS_STEPS, appreciation_rates.size)
+    for i, chunk in enumerate(np.array_split(np.arange(appreciation_rates.size), steps)):
+        rows = slice(chunk[0], chunk[-1] + 1)
+        report(0.05 + 0.95 * i / steps, f"Appreciation {appreciation_rates[rows][0]:.2f}%–{appreciation_rates[rows][-1]:.2f}%")
+        real_estate[rows] = real_estate_contribution_grid(
+            property_value, down_payment_pct, mortgage_years, annual_rent, annual_expenses,
+            rental_growth_rate, inflation_rate, adjust_for_inflation,
+            appreciation_rates[rows], mortgage_rates, max_years, closing_costs, renovation_costs, periods_per_year
+        )[..., picks]
+        np.subtract(real_estate[rows][:, :, None, :], index_fund[None, None, :, :], out=margin[rows])
+        breakeven[rows] = breakeven_equity_returns(margin[rows], equity_returns)
+
+    return {
+        "appreciation_rate": appreciation_rates,
+        "mortgage_rate": mortgage_rates,
+        "equity_return": equity_returns,
+        "holding_period": holding_periods,
+        "real_estate": real_estate,
+        "index_fund": index_fund,
+        "margin": margin,
+        "breakeven_equity_return": breakeven,
+    }
@@ -0,0 +1,261 @@
+# monte_carlo.py
+# Vectorized Monte Carlo engine for FIRE projections (no Streamlit required)
+
+import csv
+import os
+from functools import lru_cache
+
+import numpy as np
+
+HISTORICAL_RETURNS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "historical_returns.csv")
+
+RETURN_MODELS = ["normal", "lognormal", "bootstrap"]
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+# Path chunks simulated between progress reports (paths are independent, so results don't change)
+PROGRESS_STEPS = 10
+
+
+@lru_cache(maxsize=None)
+def _read_historical_returns(path):
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    return {
+        "year": np.array([int(row["year"]) for row in rows]),
+        "stock_return": np.array([float(row["stock_return"]) for row in rows]),
+        "bond_return": np.array([float(row["bond_return"]) for row in rows]),
+        "inflation": np.array([float(row["inflation"]) for row in rows]),
+    }
+
+
+def load_historical_returns(path=HISTORICAL_RETURNS_PATH):
+    """
+    Annual US stock (S&P 500 total return), 10-year Treasury and CPI inflation rates
+    as decimals, one entry per calendar year. Parsed once per process.
+    """
+    return {key: values.copy() for key, values in _read_historical_returns(path).items()}
+
+
+def draw_paths(n_paths, n_years, mean_return=0.07, volatility=0.15, mean_inflation=0.025,
+               inflation_volatility=0.01, method="lognormal", stock_allocation=1.0, seed=None):
+    """
+    Draw (n_paths, n_years) matrices of annual returns and inflation.
+
+    - normal: returns ~ N(mean_return, volatility)
+    - lognormal: growth factors are lognormal with the same arithmetic mean and volatility
+    - bootstrap: whole historical years are resampled, keeping each year's return and
+      inflation together; returns blend stocks and bonds by `stock_allocation`
+    The same seed always produces the same paths.
+    """
+    if method not in RETURN_MODELS:
+        raise ValueError(f"Unknown return model '{method}'. Choose from: {', '.join(RETURN_MODELS)}")
+
+    rng = np.random.default_rng(seed)
+    shape = (n_paths, n_years)
+
+    if method == "bootstrap":
+        history = _read_historical_returns(HISTORICAL_RETURNS_PATH)
+        picks = rng.integers(0, history["year"].size, size=shape)
+        blended = stock_allocation * history["stock_return"] + (1 - stock_allocation) * history["bond_return"]
+        return blended[picks], history["inflation"][picks]
+
+    if method == "lognormal":
+        sigma2 = np.log1p((volatility / (1 + mean_return)) ** 2)
+        mu = np.log1p(mean_return) - sigma2 / 2
+        returns = np.exp(rng.normal(mu, np.sqrt(sigma2), size=shape))
+        returns -= 1
+    else:
+        returns = rng.normal(mean_return, volatility, size=shape)
+
+    inflation = rng.normal(mean_inflation, inflation_volatility, size=shape)
+    return returns, inflation
+
+
+def simulate_paths(current_net_worth, annual_savings, fire_expenses, withdrawal_rate, returns, inflation,
+                   merit_growth=0.0, adjust_for_inflation=True):
+    """
+    Evaluate every return path at once.
+
+    Net worth follows the same save-then-compound step as estimate_years_to_fi, written
+    in cumulative-product form: NW_t = P_t * (NW_0 + sum_k S_k / P_k), where P_t is the
+    compounded growth through year t. Returns (years_to_fi, net_worth), where years are
+    inf for paths that never reach FIRE and net_worth is (n_paths, n_years + 1).
+    """
+    n_paths, n_years = returns.shape
+
+    # Compounded growth through each year; floor keeps a -100% year from dividing by zero
+    compounded = np.maximum(1 + returns, 1e-6)
+    np.cumprod(compounded, axis=1, out=compounded)
+
+    savings = annual_savings * (1 + merit_growth) ** np.arange(n_years)
+
+    # Each year's contribution discounted back by the growth compounded before it
+    discounted = np.empty_like(compounded)
+    discounted[:, 0] = savings[0]
+    np.divide(savings[1:], compounded[:, :-1], out=discounted[:, 1:])
+    np.cumsum(discounted, axis=1, out=discounted)
+    discounted += current_net_worth
+
+    net_worth = np.empty((n_paths, n_years + 1))
+    net_worth[:, 0] = current_net_worth
+    np.multiply(compounded, discounted, out=net_worth[:, 1:])
+    del compounded, discounted
+
+    goal = fire_expenses / withdrawal_rate
+    if adjust_for_inflation:
+        goal_path = np.empty((n_paths, n_years + 1))
+        goal_path[:, 0] = 1.0
+        np.cumprod(1 + inflation, axis=1, out=goal_path[:, 1:])
+        goal_path *= goal
+    else:
+        goal_path = goal
+
+    reached = net_worth >= goal_path
+    first = reached.argmax(axis=1)
+    years_to_fi = np.where(reached[np.arange(n_paths), first], first, np.inf)
+
+    return years_to_fi, net_worth
+
+
+def summarize_paths(years_to_fi, net_worth, percentiles=DEFAULT_PERCENTILES, target_years=None,
+                    net_worth_percentiles=None):
+    """
+    Success probability, years-to-FI percentiles and net worth fan-chart bands.
+    Success means reaching FIRE within the simulated horizon, or by `target_years` if given.
+    Bands already computed elsewhere can be passed as `net_worth_percentiles`.
+    """
+    n_years = net_worth.shape[1] - 1
+    if net_worth_percentiles is None:
+        # Year-major copy keeps each year's paths contiguous for the partial sorts
+        net_worth_percentiles = np.percentile(
+            np.ascontiguousarray(net_worth.T), percentiles, axis=1, overwrite_input=True
+        )
+    horizon = n_years if target_years is None else target_years
+
+    reached_by_year = np.bincount(
+        years_to_fi[np.isfinite(years_to_fi)].astype(int), minlength=n_years + 1
+    ).cumsum() / years_to_fi.size
+
+    return {
+        "success_probability": float(np.mean(years_to_fi <= horizon)),
+        "probability_by_year": reached_by_year,
+        "percentiles": list(percentiles),
+        # Paths that never reach FIRE are inf; inverted_cdf picks actual path outcomes instead of
+        # interpolating, so a percentile that lands among them is inf rather than NaN
+        "years_percentiles": dict(zip(percentiles, np.percentile(years_to_fi, percentiles, method="inverted_cdf"))),
+        "net_worth_percentiles": net_worth_percentiles,
+    }
+
+
+def run_monte_carlo(current_net_worth, annual_savings, fire_expenses, withdrawal_rate,
+                    n_paths=10000, n_years=60, mean_return=0.07, volatility=0.15,
+                    mean_inflation=0.025, inflation_volatility=0.01, method="lognormal",
+                    stock_allocation=1.0, merit_growth=0.0, adjust_for_inflation=True,
+                    target_years=None, seed=None, progress=None):
+    """
+    Draw paths, simulate them and summarize in one call.
+    If given, `progress(fraction, message)` is called between stages and after each chunk of
+    paths, so a background job can show progress and stop early.
+    """
+    report = progress or (lambda fraction, message=None: None)
+    report(0.0, f"Drawing {n_paths:,} {method} return paths")
+    returns, inflation = draw_paths(
+        n_paths, n_years, mean_return, volatility, mean_inflation, inflation_volatility,
+        method=method, stock_allocation=stock_allocation, seed=seed
+    )
+
+    if progress is None:
+        years_to_fi, net_worth = simulate_paths(
+            current_net_worth, annual_savings, fire_expenses, withdrawal_rate, returns, inflation,
+            merit_growth=merit_growth, adjust_for_inflation=adjust_for_inflation
+        )
+    else:
+        years_to_fi = np.empty(n_paths)
+        net_worth = np.empty((n_paths, n_years + 1))
+        step = -(-n_paths // PROGRESS_STEPS)
+        for start in range(0, n_paths, step):
+            report(0.1 + 0.75 * start / n_paths, f"Simulating paths {start + 1:,}–{min(start + step, n_paths):,} of {n_paths:,}")
+            rows = slice(start, start + step)
+            years_to_fi[rows], net_worth[rows] = simulate_paths(
+                current_net_worth, annual_savings, fire_expenses, withdrawal_rate, returns[rows], inflation[rows],
+                merit_growth=merit_growth, adjust_for_inflation=adjust_for_inflation
+            )
+    del returns, inflation
+
+    report(0.85, "Summarizing outcomes")
+    summary = summarize_paths(years_to_fi, net_worth, target_years=target_years)
+    summary["years_to_fi"] = years_to_fi
+    return summary
+
+
+# --- Multi-process engine ---
+
+# Paths per block in run_monte_carlo_parallel. Every block draws from its own child of the
+# seed, so a seed gives the same paths whatever the worker count.
+PARALLEL_BLOCK_PATHS = 4096
+
+# Below this many paths the process pool costs more than it saves
+PARALLEL_MIN_PATHS = 50_000
+
+
+def _simulate_block(arrays, start, stop, seeds, draw_kwargs, simulate_args, simulate_kwargs):
+    returns, inflation = draw_paths(stop - start, seed=seeds[start // PARALLEL_BLOCK_PATHS], **draw_kwargs)
+    arrays["years_to_fi"][start:stop], arrays["net_worth"][start:stop] = simulate_paths(
+        *simulate_args, returns, inflation, **simulate_kwargs
+    )
+
+
+def _percentile_block(arrays, start, stop, percentiles):
+    arrays["bands"][:, start:stop] = np.percentile(arrays["net_worth"][:, start:stop], percentiles, axis=0)
+
+
+def run_monte_carlo_parallel(current_net_worth, annual_savings, fire_expenses, withdrawal_rate,
+                             n_paths=10000, n_years=60, mean_return=0.07, volatility=0.15,
+                             mean_inflation=0.025, inflation_volatility=0.01, method="lognormal",
+                             stock_allocation=1.0, merit_growth=0.0, adjust_for_inflation=True,
+                             target_years=None, seed=None, n_workers=None, progress=None):
+    """
+    run_monte_carlo spread over a process pool, for path counts in the hundreds of thousands
+    and up. Blocks of paths are drawn and simulated in the workers straight into shared
+    memory, then the workers split the per-year percentiles. Same summary as
+    run_monte_carlo, but the paths come from per-block seed streams, so a seed's results
+    differ from the single-process engine's (while matching across worker counts).
+    """
+    from .parallel import SharedArrays, map_blocks
+
+    report = progress or (lambda fraction, message=None: None)
+    n_blocks = -(-n_paths // PARALLEL_BLOCK_PATHS)
+    seeds = np.random.SeedSequence(seed).spawn(n_blocks)
+    draw_kwargs = {
+        "n_years": n_years, "mean_return": mean_return, "volatility": volatility,
+        "mean_inflation": mean_inflation, "inflation_volatility": inflation_volatility,
+        "method": method, "stock_allocation": stock_allocation,
+    }
+    simulate_args = (current_net_worth, annual_savings, fire_expenses, withdrawal_rate)
+    simulate_kwargs = {"merit_growth": merit_growth, "adjust_for_inflation": adjust_for_inflation}
+    percentiles = list(DEFAULT_PERCENTILES)
+
+    with SharedArrays(
+        years_to_fi=((n_paths,), float),
+        net_worth=((n_paths, n_years + 1), float),
+        bands=((len(percentiles), n_years + 1), float),
+    ) as shared:
+        map_blocks(
+            _simulate_block, n_paths, shared, (seeds, draw_kwargs, simulate_args, simulate_kwargs),
+            n_workers=n_workers, block_size=PARALLEL_BLOCK_PATHS,
+            progress=lambda fraction, message=None: report(0.85 * fraction, message),
+            message=f"Simulated {{done:,}} of {{total:,}} blocks of {n_paths:,} paths"
+        )
+        map_blocks(
+            _percentile_block, n_years + 1, shared, (percentiles,), n_workers=n_workers, block_size=1,
+            progress=lambda fraction, message=None: report(0.85 + 0.15 * fraction, message),
+            message="Summarized {done} of {total} years"
+        )
+        years_to_fi = shared["years_to_fi"].copy()
+        summary = summarize_paths(
+            years_to_fi, shared["net_worth"], percentiles, target_years=target_years,
+            net_worth_percentiles=shared["bands"].copy()
+        )
+    summary["years_to_fi"] = years_to_fi
+    return summary
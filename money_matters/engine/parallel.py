@@ -0,0 +1,141 @@
+# parallel.py
+# Process-pool executor for large scenario batches and stochastic path blocks.
+# Outputs live in multiprocessing.shared_memory: the parent allocates them, each worker
+# attaches and fills its own rows, and only block bounds and small arguments are pickled.
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# fork is unsafe here: the Streamlit server and the job runner are multithreaded
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Blocks queued per worker when the caller doesn't fix a block size, so uneven blocks even out
+BLOCKS_PER_WORKER = 4
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def available_workers():
+    """CPU cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def get_pool(n_workers):
+    """Process pool with `n_workers` workers, started once and reused across calls."""
+    with _pools_lock:
+        pool = _pools.get(n_workers)
+        if pool is None:
+            context = multiprocessing.get_context(START_METHOD)
+            pool = _pools[n_workers] = ProcessPoolExecutor(max_workers=n_workers, mp_context=context)
+        return pool
+
+
+@atexit.register
+def shutdown_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(cancel_futures=True)
+        _pools.clear()
+
+
+class SharedArrays:
+    """
+    Named NumPy arrays backed by shared memory: SharedArrays(name=(shape, dtype), ...).
+    Use as a context manager; the memory is released on exit, so copy out anything that
+    has to outlive the block.
+    """
+
+    def __init__(self, **specs):
+        self.arrays = {}
+        self.specs = {}
+        self._segments = []
+        try:
+            for name, (shape, dtype) in specs.items():
+                dtype = np.dtype(dtype)
+                shape = tuple(int(n) for n in shape)
+                segment = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+                self._segments.append(segment)
+                self.arrays[name] = np.ndarray(shape, dtype, buffer=segment.buf)
+                self.specs[name] = (segment.name, shape, dtype.str)
+        except Exception:
+            self.close()
+            raise
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        # Views must go before their buffers can be closed
+        self.arrays.clear()
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments.clear()
+
+
+def _run_block(task, specs, start, stop, args):
+    segments = [shared_memory.SharedMemory(name=name) for name, _, _ in specs.values()]
+    arrays = {
+        key: np.ndarray(shape, dtype, buffer=segment.buf)
+        for (key, (_, shape, dtype)), segment in zip(specs.items(), segments)
+    }
+    try:
+        return task(arrays, start, stop, *args)
+    finally:
+        arrays.clear()
+        for segment in segments:
+            segment.close()
+
+
+def map_blocks(task, n_items, shared, args=(), n_workers=None, block_size=None, progress=None,
+               message="Processed {done:,} of {total:,} blocks"):
+    """
+    Split range(n_items) into contiguous blocks and call task(arrays, start, stop, *args) for
+    each on the process pool, where `arrays` are the `shared` SharedArrays attached in the
+    worker. `task` must be a module-level function; it fills its own slice of the arrays.
+    One worker runs the blocks in this process instead. `progress(fraction, message)` is
+    called after each block; if it raises, blocks not yet started are cancelled and the
+    exception propagates. Returns each block's return value, in block order.
+    """
+    n_workers = n_workers or available_workers()
+    block_size = block_size or max(-(-n_items // (n_workers * BLOCKS_PER_WORKER)), 1)
+    bounds = [(start, min(start + block_size, n_items)) for start in range(0, n_items, block_size)]
+    report = progress or (lambda fraction, message=None: None)
+    results = [None] * len(bounds)
+
+    if n_workers == 1:
+        for i, (start, stop) in enumerate(bounds):
+            results[i] = task(shared.arrays, start, stop, *args)
+            report((i + 1) / len(bounds), message.format(done=i + 1, total=len(bounds)))
+        return results
+
+    pool = get_pool(n_workers)
+    futures = {pool.submit(_run_block, task, shared.specs, start, stop, args): i for i, (start, stop) in enumerate(bounds)}
+    try:
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            report(done / len(bounds), message.format(done=done, total=len(bounds)))
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        # Workers may still be writing; wait before the caller releases the shared memory
+        for future in futures:
+            if not future.cancelled():
+                future.exception()
+        raise
+    return results
@@ -0,0 +1,77 @@
+# periods.py
+# Time-step helpers shared by the FIRE, real estate and investment engines.
+# Annual rates keep their meaning in every mode: a monthly step compounds at the rate
+# whose 12 steps equal the annual rate, and annual amounts are spread evenly over the year.
+
+import functools
+
+TIME_STEPS = {
+    "Annual": 1,
+    "Monthly": 12,
+}
+
+
+def period_rate(annual_rate, periods_per_year=1):
+    """Per-period rate with the same effective annual growth as `annual_rate` (decimal)."""
+    return (1 + annual_rate) ** (1 / periods_per_year) - 1
+
+
+def growth_factors(annual_rate, n_years, periods_per_year=1):
+    """
+    Compounded growth at the start of every period, G_0 = 1 through G_{n_years * periods},
+    built with one cumulative product over the precomputed per-period factors.
+    `annual_rate` may be an array; periods run along the last axis.
+    """
+    import numpy as np
+
+    rate = np.asarray(period_rate(np.asarray(annual_rate, dtype=float), periods_per_year))
+    steps = np.broadcast_to(1 + rate[..., None], rate.shape + (n_years * periods_per_year,))
+    return np.concatenate([np.ones(rate.shape + (1,)), np.cumprod(steps, axis=-1)], axis=-1)
+
+
+@functools.lru_cache(maxsize=128)
+def _deflators(annual_rate, n_years, periods_per_year):
+    factors = 1 / growth_factors(annual_rate, n_years, periods_per_year)
+    factors.setflags(write=False)
+    return factors
+
+
+def deflators(annual_rate, n_years, periods_per_year=1):
+    """
+    Today's-dollar value of $1 at the start of every period, 1 / G_0 through
+    1 / G_{n_years * periods}, for an annual inflation rate (decimal). Engines keep their
+    series nominal and multiply by a slice of this to get real dollars, so every module
+    deflates with the same numbers. Cached per (rate, length, step) and read-only.
+    """
+    return _deflators(round(float(annual_rate), 12), int(n_years), int(periods_per_year))
+
+
+def period_years(n_years, periods_per_year=1):
+    """Whole year each period falls in, for stepping annually indexed amounts."""
+    import numpy as np
+
+    return np.arange(n_years * periods_per_year) // periods_per_year
+
+
+def annual_totals(values, periods_per_year=1):
+    """Sum per-period values (periods on the last axis) into calendar-year totals."""
+    if periods_per_year == 1:
+        return values
+    return values.reshape(values.shape[:-1] + (-1, periods_per_year)).sum(axis=-1)
+
+
+def savings_growth_factor(annual_rate, periods_per_year=1):
+    """
+    Year-end value of $1 of annual savings deposited in equal parts at the start of each
+    period. Annually this is 1 + r; monthly deposits earn a little less, since later
+    deposits have less time to grow.
+    """
+    import numpy as np
+
+    rate = np.asarray(annual_rate, dtype=float)
+    if periods_per_year == 1:
+        return 1 + rate
+    step = period_rate(rate, periods_per_year)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = (1 + step) * rate / (periods_per_year * step)
+    return np.where(np.isclose(step, 0.0), 1.0, factor)
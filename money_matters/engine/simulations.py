@@ -0,0 +1,152 @@
+# simulations.py
+# Pure real estate and index fund projections shared by the planner pages.
+# Every input is an explicit argument (no page globals), so results can be memoized.
+# The memoized paths are nominal; the "today's dollars" views multiply them by the shared
+# deflator vector from periods.py, so flipping that toggle never reruns a simulation.
+
+from .amortization import amortization_schedule as _amortization_schedule, monthly_payment
+from .cache import cached_simulation
+from .periods import annual_totals, deflators, growth_factors, period_years
+
+amortization_schedule = cached_simulation(_amortization_schedule)
+
+
+# --- Nominal paths (memoized) ---
+
+@cached_simulation
+def property_equity_path(purchase_price: float, appreciation_rate: float, amort_schedule: dict) -> dict:
+    """Nominal property value, loan balance and equity at each year-end of the schedule."""
+    import numpy as np
+
+    loan_balance = np.asarray(amort_schedule["Ending Balance"], dtype=float)
+    value = purchase_price * growth_factors(appreciation_rate / 100, len(loan_balance) - 1)
+    return {"property_value": value, "loan_balance": loan_balance, "equity": value - loan_balance}
+
+
+@cached_simulation
+def cashflow_path(annual_rent: float, annual_expenses: float, rental_growth_rate: float, annual_debt_service: float,
+                  years_held: int, inflation_rate: float, periods_per_year: int = 1):
+    """
+    Nominal net rental cash flow for every period after expenses and debt service.
+    Rent and expenses step up once a year; expenses grow with inflation.
+    """
+    year = period_years(years_held, periods_per_year)
+    rent = annual_rent * (1 + rental_growth_rate / 100) ** year
+    expenses = annual_expenses * (1 + inflation_rate / 100) ** year
+    return (rent - expenses - annual_debt_service) / periods_per_year
+
+
+@cached_simulation
+def equity_path(initial_investment: float, years: int, equity_return: float, dividend_yield: float,
+                reinvest_dividends: bool, periods_per_year: int = 1) -> dict:
+    """
+    Nominal index fund value at every period start and the dividends paid each year.
+    Dividends are paid on each period's starting value, either reinvested or set aside;
+    the whole path is one cumulative product of per-period growth factors.
+    """
+    import numpy as np
+
+    price_growth = growth_factors(equity_return / 100, years, periods_per_year)
+    payout = dividend_yield / 100 / periods_per_year
+    if reinvest_dividends:
+        portfolio = initial_investment * price_growth * (1 + payout) ** np.arange(years * periods_per_year + 1)
+    else:
+        portfolio = initial_investment * price_growth
+    return {"portfolio": portfolio, "dividends": annual_totals(portfolio[:-1] * payout, periods_per_year)}
+
+
+# --- Nominal or real-dollar views ---
+
+def project_property_equity(purchase_price: float, appreciation_rate: float, amort_schedule: dict, inflation_rate: float,
+                            adjust_for_inflation: bool, start_year: int) -> list[dict]:
+    path = property_equity_path(purchase_price, appreciation_rate, amort_schedule)
+    n_years = len(path["equity"])
+    scale = deflators(inflation_rate / 100, n_years - 1) if adjust_for_inflation else 1.0
+    value, loan_balance, equity = (path[key] * scale for key in ("property_value", "loan_balance", "equity"))
+
+    return [
+        {
+            "year": start_year + i,
+            "property_value": float(value[i]),
+            "loan_balance": float(loan_balance[i]),
+            "equity": float(equity[i])
+        }
+        for i in range(n_years)
+    ]
+
+
+def project_cashflow(annual_rent: float, annual_expenses: float, rental_growth_rate: float, annual_debt_service: float,
+                     years_held: int, inflation_rate: float, adjust_for_inflation: bool,
+                     periods_per_year: int = 1) -> list[float]:
+    """
+    Yearly net rental cash flow after expenses and debt service.
+    In monthly mode each month's cash flow is deflated by that month's price level before
+    it is summed into its year.
+    """
+    cashflow = cashflow_path(annual_rent, annual_expenses, rental_growth_rate, annual_debt_service,
+                             years_held, inflation_rate, periods_per_year)
+    if adjust_for_inflation:
+        cashflow = cashflow * deflators(inflation_rate / 100, years_held, periods_per_year)[:-1]
+    return annual_totals(cashflow, periods_per_year).tolist()
+
+
+def simulate_real_estate_fire_contribution(
+    property_value: float, down_payment_pct: float, mortgage_rate: float, mortgage_years: int,
+    annual_rent: float, annual_expenses: float, rental_growth_rate: float,
+    appreciation_rate: float, investment_years: int, inflation_rate: float, adjust_for_inflation: bool,
+    closing_costs: float = 0.0, renovation_costs: float = 0.0, start_year: int = 0, periods_per_year: int = 1
+) -> tuple[float, list[dict], list[float]]:
+    loan_amount = property_value * (1 - down_payment_pct / 100)
+    annual_debt_service = 0 if down_payment_pct == 100 else monthly_payment(
+        loan_amount, mortgage_rate, mortgage_years
+    ) * 12
+
+    amort_schedule = amortization_schedule(
+        loan_amount, mortgage_rate, mortgage_years, investment_years, start_year
+    )
+
+    equity_records = project_property_equity(
+        property_value, appreciation_rate,
+        amort_schedule, inflation_rate,
+        adjust_for_inflation, start_year
+    )
+
+    cashflow_records = project_cashflow(
+        annual_rent, annual_expenses,
+        rental_growth_rate, annual_debt_service,
+        investment_years, inflation_rate, adjust_for_inflation, periods_per_year
+    )
+
+    fire_contribution = equity_records[-1]["equity"] + sum(cashflow_records) - (closing_costs + renovation_costs)
+    return float(fire_contribution), equity_records, cashflow_records
+
+
+def simulate_equity(
+    initial_investment: float, years: int, equity_return: float, dividend_yield: float, reinvest_dividends: bool,
+    inflation_rate: float = 0.0, adjust_for_inflation: bool = False, periods_per_year: int = 1
+) -> tuple[float, list[dict]]:
+    """
+    Index fund growth with dividends paid on each period's starting value, either reinvested
+    or set aside. Yearly values are deflated by that year's price level when
+    `adjust_for_inflation` is on.
+    """
+    path = equity_path(initial_investment, years, equity_return, dividend_yield, reinvest_dividends, periods_per_year)
+    portfolio, dividends = path["portfolio"], path["dividends"]
+    year_end = portfolio[periods_per_year::periods_per_year]
+    deflator = deflators(inflation_rate / 100, years)
+
+    if adjust_for_inflation:
+        values, paid = year_end * deflator[1:], dividends * deflator[1:]
+    else:
+        values, paid = year_end, dividends
+
+    growth_history = [
+        {"year": year, "portfolio_value": float(value), "dividends": float(dividend)}
+        for year, value, dividend in zip(range(1, years + 1), values, paid)
+    ]
+
+    # FIRE contribution (still based on adjusted final year value)
+    fire_contribution = portfolio[-1] * deflator[-1] if adjust_for_inflation else portfolio[-1]
+    fire_contribution += 0 if reinvest_dividends else dividends.sum() * deflator[-1]
+
+    return float(fire_contribution), growth_history
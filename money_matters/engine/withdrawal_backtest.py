@@ -0,0 +1,158 @@
+# withdrawal_backtest.py
+# Historical safe-withdrawal-rate backtests over every rolling start-year cohort
+# NumPy is imported on first use so the page can list the rules without loading it
+
+SPENDING_RULES = {
+    "constant_dollar": "Constant Dollar (inflation-adjusted)",
+    "constant_percent": "Constant Percent of Portfolio",
+    "guardrails": "Guardrails (Guyton-Klinger)",
+}
+
+
+
+def rate_grid():
+    """Candidate initial rates (1% to 10% in 0.05% steps) used when a rule has no closed-form answer."""
+    import numpy as np
+
+    return np.round(np.arange(0.01, 0.10001, 0.0005), 4)
+
+
+def _blended_history(stock_allocation):
+    from .monte_carlo import load_historical_returns
+
+    history = load_historical_returns()
+    returns = stock_allocation * history["stock_return"] + (1 - stock_allocation) * history["bond_return"]
+    return history["year"], returns, history["inflation"]
+
+
+def cohort_windows(horizon, stock_allocation=0.6):
+    """
+    Every complete `horizon`-year window of history as (start_years, returns, inflation),
+    where returns and inflation are (cohorts, horizon) sliding-window views.
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    years, returns, inflation = _blended_history(stock_allocation)
+    if horizon > years.size:
+        raise ValueError(f"Horizon of {horizon} years exceeds the {years.size} years of bundled history.")
+    windows = sliding_window_view(returns, horizon)
+    return years[: windows.shape[0]], windows, sliding_window_view(inflation, horizon)
+
+
+def max_sustainable_rates(returns, inflation):
+    """
+    Highest constant-dollar withdrawal rate each cohort survives, in closed form.
+
+    Spending W * I_t is withdrawn at the start of year t, so the balance is
+    B_t = P_t * (B_0 - W * sum_{k<t} I_k / P_k). The plan lasts the window when
+    W / B_0 <= 1 / sum_t I_t / P_t, with P the compounded growth and I the price index.
+    Windows that run past the end of history (NaN) come back as NaN.
+    """
+    import numpy as np
+
+    growth = np.ones(returns.shape)
+    np.cumprod(1 + returns[..., :-1], axis=-1, out=growth[..., 1:])
+    price = np.ones(inflation.shape)
+    np.cumprod(1 + inflation[..., :-1], axis=-1, out=price[..., 1:])
+    return 1 / np.cumsum(price / growth, axis=-1)
+
+
+def safe_withdrawal_grid(max_horizon=60, stock_allocation=0.6):
+    """
+    Max sustainable constant-dollar rate for every start year x retirement length in one pass.
+    Returns (start_years, horizons, rates) with rates shaped (cohorts, max_horizon) and
+    NaN where a cohort does not have enough history for that horizon.
+    """
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    years, returns, inflation = _blended_history(stock_allocation)
+    padding = np.full(max_horizon - 1, np.nan)
+    returns = sliding_window_view(np.concatenate([returns, padding]), max_horizon)
+    inflation = sliding_window_view(np.concatenate([inflation, padding]), max_horizon)
+    return years, np.arange(1, max_horizon + 1), max_sustainable_rates(returns, inflation)
+
+
+def _simulate_rule(rates, rule, returns, inflation, guardrail_band, guardrail_adjustment, spending_floor):
+    # Balances are normalized to a $1 starting portfolio; rows are candidate rates, columns are cohorts
+    import numpy as np
+
+    initial = np.asarray(rates, dtype=float)[:, None]
+    shape = (initial.shape[0], returns.shape[0])
+    balance = np.ones(shape)
+    spending = np.broadcast_to(initial, shape).copy()
+    price = np.ones(returns.shape[0])
+    failed = np.zeros(shape, dtype=bool)
+    min_spending = np.full(shape, np.inf)
+
+    for t in range(returns.shape[1]):
+        if rule == "constant_percent":
+            spending = initial * balance
+        elif rule == "guardrails":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                current_rate = np.where(balance > 0, spending / balance, np.inf)
+            spending = np.where(current_rate > initial * (1 + guardrail_band), spending * (1 - guardrail_adjustment), spending)
+            spending = np.where(current_rate < initial * (1 - guardrail_band), spending * (1 + guardrail_adjustment), spending)
+
+        withdrawal = np.minimum(spending, np.maximum(balance, 0))
+        real_ratio = withdrawal / price / initial
+        failed |= spending > balance + 1e-12
+        if spending_floor is not None:
+            failed |= real_ratio < spending_floor
+        np.minimum(min_spending, real_ratio, out=min_spending)
+
+        balance = (balance - withdrawal) * (1 + returns[:, t])
+        price = price * (1 + inflation[:, t])
+        if rule != "constant_percent":
+            spending = spending * (1 + inflation[:, t])
+
+    return ~failed, balance / price, min_spending
+
+
+def backtest_withdrawals(portfolio_value, withdrawal_rate, rule="constant_dollar", horizon=30, stock_allocation=0.6,
+                         guardrail_band=0.2, guardrail_adjustment=0.1, spending_floor=None):
+    """
+    Run every rolling historical cohort for one spending rule.
+
+    - constant_dollar: withdraw rate x starting portfolio, raised with inflation each year
+    - constant_percent: withdraw rate x current portfolio each year
+    - guardrails: inflation-adjusted spending, cut when the current rate drifts above
+      (1 + band) x initial rate and raised when it falls below (1 - band) x initial rate
+    A cohort fails when the portfolio cannot fund the rule's withdrawal, or when real
+    spending drops under `spending_floor` x initial spending if a floor is given.
+    Constant percent never depletes the portfolio, so without a floor nothing can fail and
+    `max_sustainable_rate` is None rather than the top of the rate grid.
+    Ending balances are in start-year dollars.
+    """
+    if rule not in SPENDING_RULES:
+        raise ValueError(f"Unknown spending rule '{rule}'. Choose from: {', '.join(SPENDING_RULES)}")
+
+    start_years, returns, inflation = cohort_windows(horizon, stock_allocation)
+    args = (rule, returns, inflation, guardrail_band, guardrail_adjustment, spending_floor)
+
+    survived, ending_balance, min_spending = _simulate_rule([withdrawal_rate], *args)
+
+    if rule == "constant_dollar":
+        cohort_max_rates = max_sustainable_rates(returns, inflation)[:, -1]
+        max_rate = float(cohort_max_rates.min())
+    elif rule == "constant_percent" and spending_floor is None:
+        # No failure criterion, so every rate on the grid would "survive"
+        cohort_max_rates = None
+        max_rate = None
+    else:
+        # No closed form: evaluate the whole rate grid against every cohort at once
+        rates = rate_grid()
+        grid_survived, _, _ = _simulate_rule(rates, *args)
+        all_survive = grid_survived.all(axis=1)
+        cohort_max_rates = None
+        max_rate = float(rates[all_survive].max()) if all_survive.any() else 0.0
+
+    return {
+        "start_years": start_years,
+        "survived": survived[0],
+        "ending_balance": ending_balance[0] * portfolio_value,
+        "min_spending_ratio": min_spending[0],
+        "survival_rate": float(survived[0].mean()),
+        "max_sustainable_rate": max_rate,
+        "cohort_max_rates": cohort_max_rates,
+    }
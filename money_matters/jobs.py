@@ -0,0 +1,151 @@
+# jobs.py
+# Background job runner for the heavy simulations (no Streamlit required).
+# Work runs on a shared thread pool (NumPy's kernels release the GIL) and callers get a Job
+# handle back at once, then poll its progress. Each owner (a browser session) has one slot
+# per job name: submitting new inputs to a busy slot cancels the old job, and submitting the
+# same inputs again returns the job that is already running or finished.
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .engine.cache import scenario_key
+
+DEFAULT_WORKERS = 4
+
+# Slots kept across every session before the least recently used are dropped
+MAX_SLOTS = 256
+
+JOB_STATES = ("queued", "running", "done", "failed", "cancelled")
+
+_job_ids = itertools.count(1)
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job, at its next progress report, once it has been cancelled."""
+
+
+class Job:
+    """Handle to one submitted job. Progress and state are written by the worker thread."""
+
+    def __init__(self, name, key):
+        self.id = next(_job_ids)
+        self.name = name
+        self.key = key
+        self.state = "queued"
+        self.progress = 0.0
+        self.message = "Waiting for a worker"
+        self.submitted_at = time.monotonic()
+        self.finished_at = None
+        self.future = None
+        self._cancel = threading.Event()
+
+    def report(self, fraction, message=None):
+        """Progress callback handed to the job function; also its cancellation checkpoint."""
+        if self._cancel.is_set():
+            raise JobCancelled(self.name)
+        self.progress = min(max(float(fraction), 0.0), 1.0)
+        if message is not None:
+            self.message = message
+
+    def cancel(self):
+        """Ask the job to stop. Queued jobs never start; running ones stop at their next report."""
+        self._cancel.set()
+        if self.future is not None and self.future.cancel():
+            self._finish("cancelled")
+
+    @property
+    def done(self):
+        return self.state in ("done", "failed", "cancelled")
+
+    @property
+    def elapsed(self):
+        return (self.finished_at or time.monotonic()) - self.submitted_at
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def error(self):
+        return self.future.exception() if self.state == "failed" else None
+
+    def _finish(self, state):
+        self.state = state
+        self.finished_at = time.monotonic()
+
+
+def _run(job, func, args, kwargs):
+    if job._cancel.is_set():
+        job._finish("cancelled")
+        return None
+    job.state = "running"
+    job.message = "Starting"
+    try:
+        result = func(*args, progress=job.report, **kwargs)
+    except JobCancelled:
+        job._finish("cancelled")
+        return None
+    except Exception:
+        job._finish("failed")
+        raise
+    job.progress = 1.0
+    job._finish("done")
+    return result
+
+
+class JobRunner:
+    """Thread pool plus one job slot per (owner, name), shared by every session."""
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, max_slots=MAX_SLOTS):
+        self.max_slots = max_slots
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="money-matters-job")
+        self._slots = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, owner, name, func, *args, **kwargs):
+        """
+        Start `func(*args, progress=..., **kwargs)` in the background and return its Job.
+        `func` reports through `progress(fraction, message)`. The same inputs return the
+        slot's current job unless it failed or was cancelled; new inputs supersede it.
+        """
+        key = scenario_key(f"{func.__module__}.{func.__qualname__}", {"args": list(args), "kwargs": kwargs})
+        with self._lock:
+            current = self._slots.get((owner, name))
+            if current is not None and current.key == key and current.state not in ("failed", "cancelled"):
+                self._slots.move_to_end((owner, name))
+                return current
+            if current is not None:
+                current.cancel()
+
+            job = Job(name, key)
+            job.future = self._executor.submit(_run, job, func, args, kwargs)
+            self._slots[(owner, name)] = job
+            while len(self._slots) > self.max_slots:
+                _, evicted = self._slots.popitem(last=False)
+                evicted.cancel()
+            return job
+
+    def get(self, owner, name):
+        with self._lock:
+            return self._slots.get((owner, name))
+
+    def cancel(self, owner, name):
+        job = self.get(owner, name)
+        if job is not None:
+            job.cancel()
+        return job
+
+    def discard(self, owner, name=None):
+        """Cancel and forget one slot, or every slot of `owner`."""
+        with self._lock:
+            slots = [slot for slot in self._slots if slot[0] == owner and (name is None or slot[1] == name)]
+            for slot in slots:
+                self._slots.pop(slot).cancel()
+
+    def __len__(self):
+        return len(self._slots)
+
+
+# One runner per server process
+JOB_RUNNER = JobRunner()
@@ -0,0 +1,108 @@
+# reactive.py
+# Versioned dependency graph for values derived from session inputs (no Streamlit required).
+# Every node declares its inputs: state keys or other nodes. An input's version bumps when its
+# value changes, and a node recomputes only when the version of one of its inputs has moved
+# since it last ran. A node's own version bumps only when its result actually changes, so an
+# unchanged intermediate value stops recomputation from spreading to the nodes below it.
+
+import copy
+from collections import deque
+
+# Runs kept in a session's recompute history
+HISTORY_SIZE = 20
+
+
+def _same(a, b):
+    try:
+        return type(a) is type(b) and bool(a == b)
+    except (TypeError, ValueError):
+        # Values without a plain truth-valued == (e.g. arrays) always count as changed
+        return False
+
+
+class DerivedGraph:
+    """Node declarations shared by every session: name -> (inputs, func)."""
+
+    def __init__(self):
+        self.nodes = {}
+
+    def node(self, *inputs, name=None):
+        """Register a function as a node computed from `inputs`, which it receives positionally."""
+        def register(func):
+            node_name = name or func.__name__
+            for dependency in inputs:
+                if dependency == node_name:
+                    raise ValueError(f"Node '{node_name}' can't depend on itself")
+            self.nodes[node_name] = (tuple(inputs), func)
+            return func
+        return register
+
+    def state(self):
+        return GraphState(self)
+
+
+class GraphState:
+    """One session's input snapshots, node results, versions and recompute counters."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.versions = {}
+        self._inputs = {}
+        self._results = {}
+        self.runs = 0
+        self.recomputed = set()
+        self.cached = set()
+        self.totals = {"recomputed": 0, "cached": 0}
+        self.history = deque(maxlen=HISTORY_SIZE)
+
+    def begin_run(self):
+        """Close the previous run's counters and start a new run."""
+        if self.runs:
+            self.history.append(self.run_stats())
+        self.runs += 1
+        self.recomputed = set()
+        self.cached = set()
+
+    def run_stats(self):
+        return {"run": self.runs, "recomputed": sorted(self.recomputed), "cached": sorted(self.cached - self.recomputed)}
+
+    def get(self, name, state):
+        """Current value of node `name`, with inputs read from the mapping `state`."""
+        return self._resolve(name, state)[1]
+
+    def invalidate(self, name=None):
+        """Forget one node's result, or every node's, so it recomputes on next use."""
+        if name is None:
+            self._results.clear()
+        else:
+            self._results.pop(name, None)
+
+    def _bump(self, name):
+        self.versions[name] = self.versions.get(name, 0) + 1
+        return self.versions[name]
+
+    def _resolve(self, name, state):
+        if name not in self.graph.nodes:
+            value = state.get(name)
+            if name not in self._inputs or not _same(self._inputs[name], value):
+                # Snapshot, so a dict edited in place still reads as a change next time
+                self._inputs[name] = copy.deepcopy(value)
+                self._bump(name)
+            return self.versions[name], value
+
+        inputs, func = self.graph.nodes[name]
+        resolved = [self._resolve(dependency, state) for dependency in inputs]
+        input_versions = tuple(version for version, _ in resolved)
+
+        previous = self._results.get(name)
+        if previous is not None and previous[0] == input_versions:
+            self.cached.add(name)
+            self.totals["cached"] += 1
+            return previous[1], previous[2]
+
+        value = func(*(value for _, value in resolved))
+        version = previous[1] if previous is not None and _same(previous[2], value) else self._bump(name)
+        self._results[name] = (input_versions, version, value)
+        self.recomputed.add(name)
+        self.totals["recomputed"] += 1
+        return version, value
@@ -0,0 +1,404 @@
+# transactions.py
+# Streaming bank / credit-card CSV import, categorized into the Lifestyle Budgeter's EXPENSE_CATEGORIES.
+# Rows are read one at a time and folded into per-category totals, so memory stays flat
+# however many transactions the file holds.
+
+import csv
+import datetime
+import re
+from array import array
+
+# Keywords (single tokens or short phrases) found in merchant descriptions, by category.
+# None marks money moving between your own accounts, which isn't spending.
+CATEGORY_KEYWORDS = {
+    "Housing": ("rent", "mortgage", "hoa", "property tax", "apartments", "landlord", "home depot", "lowes"),
+    "Utilities": ("electric", "energy", "water", "gas company", "pg&e", "con ed", "duke energy", "sewer",
+                  "trash", "waste management", "utility", "utilities"),
+    "Food": ("grocery", "groceries", "market", "safeway", "kroger", "whole foods", "trader joe", "aldi",
+             "publix", "wegmans", "costco", "restaurant", "cafe", "coffee", "starbucks", "doordash",
+             "grubhub", "uber eats", "chipotle", "mcdonald", "pizza", "bakery", "deli", "sushi", "bar"),
+    "Transportation": ("shell", "chevron", "exxon", "bp", "mobil", "fuel", "uber", "lyft", "parking",
+                       "toll", "transit", "metro", "auto", "car wash", "jiffy lube", "dmv"),
+    "Insurance": ("insurance", "geico", "state farm", "progressive", "allstate", "aetna", "cigna"),
+    "Phone/Internet": ("verizon", "at&t", "t-mobile", "comcast", "xfinity", "spectrum", "internet", "wireless"),
+    "Childcare": ("daycare", "childcare", "preschool", "babysitter", "nanny", "kindercare"),
+    "Health & Wellness": ("pharmacy", "cvs", "walgreens", "doctor", "dental", "clinic", "hospital",
+                          "gym", "fitness", "yoga", "peloton", "therapy", "medical"),
+    "Subscriptions": ("netflix", "spotify", "hulu", "disney+", "disney plus", "hbo", "apple.com", "icloud",
+                      "youtube", "patreon", "subscription", "membership", "prime video", "adobe"),
+    "Discretionary": ("cinema", "theater", "theatre", "concert", "ticketmaster", "steam", "playstation",
+                      "xbox", "nintendo", "golf", "bowling", "museum"),
+    "Shopping": ("amazon", "amzn", "target", "walmart", "best buy", "ikea", "etsy", "ebay", "macy",
+                 "nordstrom", "tj maxx", "old navy", "gap", "zara"),
+    "Personal Care": ("salon", "barber", "spa", "sephora", "ulta", "nail", "cosmetics"),
+    "Travel": ("airline", "airlines", "delta", "united", "southwest", "jetblue", "hotel", "marriott",
+               "hilton", "airbnb", "expedia", "booking.com", "hertz", "avis"),
+    "Giving": ("donation", "charity", "church", "gofundme", "red cross", "unicef", "tithe"),
+    "Investments": ("vanguard", "fidelity", "schwab", "brokerage", "401k", "ira", "robinhood", "betterment"),
+    "Education": ("tuition", "university", "college", "school", "coursera", "udemy", "textbook", "student loan"),
+    None: ("transfer", "payment thank you", "autopay", "credit card payment", "online payment", "zelle", "venmo"),
+}
+
+# Header names seen in bank exports, compared in lower case
+DATE_COLUMNS = ("date", "transaction date", "trans date", "posted date", "posting date")
+DESCRIPTION_COLUMNS = ("description", "merchant", "payee", "name", "memo", "details", "transaction description")
+AMOUNT_COLUMNS = ("amount", "transaction amount")
+DEBIT_COLUMNS = ("debit", "withdrawal", "withdrawals")
+CREDIT_COLUMNS = ("credit", "deposit", "deposits")
+
+SPENDING_SIGNS = ("auto", "negative", "positive")
+
+# Recurring charge cadences: (days between charges, allowed drift in days, fewest charges)
+CADENCES = {
+    "weekly": (7.0, 1.5, 4),
+    "monthly": (30.44, 4.0, 3),
+    "annual": (365.25, 12.0, 2),
+}
+CHARGES_PER_MONTH = {"weekly": 52 / 12, "monthly": 1.0, "annual": 1 / 12}
+
+# Categories whose budget comes from detected recurring charges when any are found.
+# Recurring charges from unrecognized merchants count as Subscriptions.
+RECURRING_CATEGORIES = ("Subscriptions", "Phone/Internet")
+
+# Tokens that don't identify a merchant ("POS PURCHASE NETFLIX.COM WWW" -> "netflix")
+MERCHANT_NOISE = {"pos", "purchase", "debit", "credit", "card", "recurring", "payment", "ach", "www", "com",
+                  "inc", "llc", "co", "sq", "tst", "paypal", "online", "bill", "autopay", "ca", "ny", "tx", "us", "usa"}
+
+_TOKEN = re.compile(r"[a-z0-9&+.]+")
+_HAS_DIGIT = re.compile(r"\d").search
+
+# Distinct descriptions remembered between rows; the memo is cleared when it fills up
+MEMO_SIZE = 20_000
+MAX_UNMATCHED = 200
+
+
+def _tokens(text):
+    return [token.strip(".") for token in _TOKEN.findall(text.lower())]
+
+
+def build_keyword_index(category_keywords=CATEGORY_KEYWORDS):
+    """
+    Precompile keywords into a token -> category hash plus a first-token -> [(phrase, category)]
+    table for multi-word keywords, so a description is categorized in one pass over its tokens.
+    """
+    single, phrases = {}, {}
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            words = tuple(_tokens(keyword))
+            if len(words) == 1:
+                single.setdefault(words[0], category)
+            elif words:
+                phrases.setdefault(words[0], []).append((words, category))
+    # Longer phrases win over shorter ones that share a first word
+    for candidates in phrases.values():
+        candidates.sort(key=lambda item: -len(item[0]))
+    return single, phrases
+
+
+KEYWORD_INDEX = build_keyword_index()
+
+_UNMATCHED = object()
+
+
+def categorize(description, index=KEYWORD_INDEX):
+    """
+    Budget category for a merchant description: the first keyword hit reading left to right,
+    phrases before single words. None for transfers, "Other" when nothing matches.
+    """
+    category = _match(_tokens(description), index)
+    return "Other" if category is _UNMATCHED else category
+
+
+def _match(tokens, index):
+    single, phrases = index
+    for i, token in enumerate(tokens):
+        for words, category in phrases.get(token, ()):
+            if tuple(tokens[i:i + len(words)]) == words:
+                return category
+        if token in single:
+            return single[token]
+        if "." in token:
+            # NETFLIX.COM, SQ.MERCHANT: try the part before the dot
+            head = token.split(".")[0]
+            if head in single:
+                return single[head]
+    return _UNMATCHED
+
+
+def _find_column(header, names):
+    for i, column in enumerate(header):
+        if column in names:
+            return i
+    return None
+
+
+def _parse_amount(text):
+    text = text.strip().replace("$", "").replace(",", "")
+    if not text:
+        return 0.0
+    if text.startswith("(") and text.endswith(")"):  # accounting negatives
+        return -float(text[1:-1])
+    return float(text)
+
+
+def _parse_date(text):
+    """Date from ISO, US (m/d/y) or d.m.y text."""
+    text = text.strip().split(" ")[0].split("T")[0]
+    if "-" in text:
+        year, month, day = text.split("-")[:3]
+    elif "/" in text:
+        month, day, year = text.split("/")[:3]
+    elif "." in text:
+        day, month, year = text.split(".")[:3]
+    else:
+        raise ValueError(f"Unrecognized date: {text!r}")
+    year = int(year)
+    return datetime.date(year + 2000 if year < 100 else year, int(month), int(day[:2]))
+
+
+def normalize_merchant(description):
+    """Merchant key for grouping charges: store numbers, phone numbers and payment noise dropped."""
+    return _merchant_key(_tokens(description))
+
+
+def _merchant_key(tokens):
+    words = [token.split(".")[0] for token in tokens if not _HAS_DIGIT(token)]
+    return " ".join([word for word in words if word and word not in MERCHANT_NOISE][:3])
+
+
+def find_recurring_charges(merchant_ids, days, amounts, as_of, amount_tolerance=0.25, min_share=0.75):
+    """
+    Recurring charges in columnar transaction history, with no pairwise comparisons.
+
+    `merchant_ids`, `days` (date ordinals) and `amounts` (positive spending) are parallel
+    arrays. One lexsort orders charges by merchant and day. Gaps between consecutive charges
+    of a merchant are then scored against each cadence in CADENCES, and per-merchant shares
+    come from bincount. A merchant is recurring at the cadence that fits at least `min_share`
+    of its gaps, when at least `min_share` of its charges are within `amount_tolerance` of
+    its median charge. A series is active if its next charge isn't overdue at `as_of`.
+    Returns {merchant_id: {"cadence", "amount", "monthly", "charges", "last_day", "active"}}.
+    """
+    import numpy as np
+
+    merchant_ids = np.asarray(merchant_ids, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    amounts = np.asarray(amounts, dtype=float)
+    if merchant_ids.size < 2:
+        return {}
+
+    order = np.lexsort((days, merchant_ids))
+    merchants, days, amounts = merchant_ids[order], days[order], amounts[order]
+    first = np.r_[True, merchants[1:] != merchants[:-1]]
+    group = np.cumsum(first) - 1
+    starts = np.flatnonzero(first)
+    n_groups = starts.size
+    charges = np.diff(np.r_[starts, merchants.size])
+
+    # Gap i sits between charge i and i+1 and belongs to the later charge's merchant
+    gaps = np.diff(days).astype(float)
+    same_merchant = ~first[1:]
+    gap_group = group[1:][same_merchant]
+    gaps = gaps[same_merchant]
+    n_gaps = charges - 1
+
+    best_share = np.zeros(n_groups)
+    best_cadence = np.full(n_groups, -1)
+    for c, (period, drift, min_charges) in enumerate(CADENCES.values()):
+        hits = np.bincount(gap_group, weights=np.abs(gaps - period) <= drift, minlength=n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            share = np.where(charges >= min_charges, hits / n_gaps, 0.0)
+        better = share > best_share
+        best_share[better], best_cadence[better] = share[better], c
+
+    # Median charge per merchant from a second sort, by merchant then amount
+    by_amount = np.lexsort((amounts, merchants))
+    median = amounts[by_amount][starts + (charges - 1) // 2]
+    close = np.abs(amounts - median[group]) <= amount_tolerance * np.abs(median[group])
+    amount_share = np.bincount(group, weights=close, minlength=n_groups) / charges
+
+    recurring = np.flatnonzero((best_share >= min_share) & (amount_share >= min_share))
+    last_day = days[starts + charges - 1]
+    names = list(CADENCES)
+    found = {}
+    for g in recurring:
+        cadence = names[best_cadence[g]]
+        period, drift, _ = CADENCES[cadence]
+        found[int(merchants[starts[g]])] = {
+            "cadence": cadence,
+            "amount": float(median[g]),
+            "monthly": float(median[g]) * CHARGES_PER_MONTH[cadence],
+            "charges": int(charges[g]),
+            "last_day": int(last_day[g]),
+            "active": bool(as_of - last_day[g] <= period + 2 * drift),
+        }
+    return found
+
+
+def import_transactions(lines, spending_sign="auto", categories=None, detect_recurring=False, index=KEYWORD_INDEX):
+    """
+    Categorize a bank CSV (any iterable of text lines, e.g. an open file) into monthly averages.
+
+    The header row locates the date, description and amount columns (or separate debit and
+    credit columns). Spending and refunds are told apart by sign: "negative" or "positive"
+    when the bank is known, "auto" to treat whichever sign most rows have as spending.
+    Each category's total is spread over the calendar months the file spans; `categories`
+    defaults to every keyword category plus "Other".
+
+    With `detect_recurring`, each charge's merchant, day and amount are also kept in compact
+    columnar arrays for find_recurring_charges. RECURRING_CATEGORIES are then budgeted
+    at the monthly cost of their active recurring charges.
+    """
+    if categories is None:
+        categories = [category for category in CATEGORY_KEYWORDS if category] + ["Other"]
+    if spending_sign not in SPENDING_SIGNS:
+        raise ValueError(f"spending_sign must be one of {SPENDING_SIGNS}")
+
+    reader = csv.reader(lines)
+    header = [column.strip().lower() for column in next(reader, [])]
+    date_col = _find_column(header, DATE_COLUMNS)
+    description_col = _find_column(header, DESCRIPTION_COLUMNS)
+    amount_col = _find_column(header, AMOUNT_COLUMNS)
+    debit_col, credit_col = _find_column(header, DEBIT_COLUMNS), _find_column(header, CREDIT_COLUMNS)
+    if date_col is None or description_col is None or (amount_col is None and debit_col is None):
+        raise ValueError("Couldn't find date, description and amount columns in the CSV header.")
+
+    # Totals by sign, so the spending sign can be decided after one pass
+    totals = {-1: {}, 1: {}}
+    counts = {-1: {}, 1: {}}
+    memo, date_memo = {}, {}
+    unmatched = {}
+    merchant_ids, merchant_categories, merchant_names = {}, [], []
+    charge_merchants, charge_days, charge_amounts = array("l"), array("l"), array("d")
+    first_month = last_month = None
+    rows = skipped = 0
+
+    for row in reader:
+        if not row:
+            continue
+        rows += 1
+        try:
+            date_text = row[date_col]
+            parsed = date_memo.get(date_text)
+            if parsed is None:
+                date = _parse_date(date_text)
+                parsed = date_memo[date_text] = ((date.year, date.month), date.toordinal())
+            month, day = parsed
+            if amount_col is not None:
+                amount = _parse_amount(row[amount_col])
+            else:
+                # Debits are spending whichever way the bank signs them
+                debit = abs(_parse_amount(row[debit_col])) if row[debit_col].strip() else 0.0
+                credit = abs(_parse_amount(row[credit_col])) if credit_col is not None and row[credit_col].strip() else 0.0
+                amount = credit - debit
+            description = row[description_col]
+        except (IndexError, ValueError):
+            skipped += 1
+            continue
+
+        if first_month is None or month < first_month:
+            first_month = month
+        if last_month is None or month > last_month:
+            last_month = month
+        if amount == 0:
+            continue
+
+        known = memo.get(description)
+        if known is None:
+            tokens = _tokens(description)
+            category = _match(tokens, index)
+            is_unmatched = category is _UNMATCHED
+            if is_unmatched:
+                category = "Other"
+            merchant = None
+            if detect_recurring and category is not None:
+                name = _merchant_key(tokens)
+                merchant = merchant_ids.get(name)
+                if merchant is None:
+                    merchant = merchant_ids[name] = len(merchant_names)
+                    merchant_names.append(name)
+                    merchant_categories.append(category)
+            if len(memo) >= MEMO_SIZE:
+                memo.clear()
+            known = memo[description] = (category, merchant, is_unmatched)
+        category, merchant, is_unmatched = known
+        if category is None:
+            continue
+        if is_unmatched and (len(unmatched) < MAX_UNMATCHED or description in unmatched):
+            # Counted on every row, so the report ranks the most frequent unmatched descriptions
+            unmatched[description] = unmatched.get(description, 0) + 1
+        if merchant is not None:
+            charge_merchants.append(merchant)
+            charge_days.append(day)
+            charge_amounts.append(amount)
+
+        sign = -1 if amount < 0 else 1
+        totals[sign][category] = totals[sign].get(category, 0.0) + abs(amount)
+        counts[sign][category] = counts[sign].get(category, 0) + 1
+
+    if amount_col is None or spending_sign == "negative":
+        spending = -1  # debit columns were already turned into negative amounts
+    elif spending_sign == "positive":
+        spending = 1
+    else:
+        spending = -1 if sum(counts[-1].values()) >= sum(counts[1].values()) else 1
+    refunds = -spending
+
+    n_months = 0
+    if first_month is not None:
+        n_months = (last_month[0] - first_month[0]) * 12 + last_month[1] - first_month[1] + 1
+
+    monthly = {}
+    for category in categories:
+        net = totals[spending].get(category, 0.0) - totals[refunds].get(category, 0.0)
+        monthly[category] = max(net, 0.0) / n_months if n_months else 0.0
+
+    recurring = []
+    if detect_recurring and charge_amounts:
+        recurring = _budget_recurring(monthly, charge_merchants, charge_days, charge_amounts, spending,
+                                      merchant_names, merchant_categories, n_months)
+
+    return {
+        "monthly": monthly,
+        "transactions": {category: counts[spending].get(category, 0) for category in categories},
+        "months": n_months,
+        "first_month": first_month,
+        "last_month": last_month,
+        "rows": rows,
+        "skipped": skipped,
+        "spending_sign": "negative" if spending == -1 else "positive",
+        "unmatched": sorted(unmatched.items(), key=lambda item: -item[1])[:20],
+        "recurring": recurring,
+    }
+
+
+def _budget_recurring(monthly, charge_merchants, charge_days, charge_amounts, spending,
+                      merchant_names, merchant_categories, n_months):
+    # Fill RECURRING_CATEGORIES in `monthly` from detected recurring charges; returns the charges
+    import numpy as np
+
+    merchants = np.frombuffer(charge_merchants, dtype=np.dtype(charge_merchants.typecode))
+    days = np.frombuffer(charge_days, dtype=np.dtype(charge_days.typecode))
+    amounts = np.frombuffer(charge_amounts, dtype=float) * spending
+    purchases = amounts > 0
+
+    found = find_recurring_charges(merchants[purchases], days[purchases], amounts[purchases], days.max())
+    spent = np.bincount(merchants[purchases], weights=amounts[purchases], minlength=len(merchant_names))
+
+    recurring, budgets = [], {}
+    for merchant, charge in found.items():
+        category = merchant_categories[merchant]
+        if category == "Other" and charge["active"]:
+            # An unrecognized merchant still billing on a schedule is most likely a subscription
+            category = "Subscriptions"
+            if "Other" in monthly:
+                monthly["Other"] = max(monthly["Other"] - float(spent[merchant]) / n_months, 0.0)
+        charge.update(merchant=merchant_names[merchant], category=category,
+                      last_date=datetime.date.fromordinal(charge.pop("last_day")))
+        recurring.append(charge)
+        if charge["active"] and category in RECURRING_CATEGORIES:
+            budgets[category] = budgets.get(category, 0.0) + charge["monthly"]
+
+    for category, amount in budgets.items():
+        if category in monthly:
+            monthly[category] = amount
+    return sorted(recurring, key=lambda charge: -charge["monthly"])
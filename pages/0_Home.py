@@ -1,5 +1,6 @@
 # pages/0_Home.py
 import streamlit as st
+from ui_helpers import logo_thumbnail
 
 st.set_page_config(page_title="Studio Home", page_icon="💰")
 
@@ -9,7 +10,7 @@ with col1:
     st.title("💰 Money Matters Studio")
     st.caption("Your one-stop shop for tools to master money now, so money doesn’t have to matter later.")
 with col2:
-    st.image("logo.png", width=100)
+    st.image(logo_thumbnail(), width=100)
 
 st.markdown("""
 ---
@@ -22,7 +23,7 @@ st.markdown("""
 |--------|------------------|------------|
 | [🔥 **FIRE Tracker**](https://money-matters-studio.streamlit.app/Core_Tracker) | Estimate time to FIRE from savings, expenses, and returns | ✅ Live |
 | [🎒 **Lifestyle Budgeter**](https://money-matters-studio.streamlit.app/Lifestyle_Budgeter) | Build your ideal FIRE lifestyle and optimize spending | 🧪 Beta |
-| 📤 **Withdrawal Designer** | Design a tax-aware, sustainable withdrawal strategy post-FIRE | 🛠️ Coming Soon |
+| [📤 **Withdrawal Designer**](https://money-matters-studio.streamlit.app/Withdrawal_Strategy) | Backtest withdrawal rates and spending rules against market history since 1928 | 🧪 Beta |
 
 ---
 
@@ -52,8 +53,8 @@ st.caption("Model rental income, property appreciation, and mortgage payoff over
 st.page_link("pages/6_Investment_Analyzer.py", label="📊 Investment Analyzer")
 st.caption("Compare real estate vs. index fund strategies using synced assumptions from other tools.")
 
-st.page_link("pages/2_Advanced_Planner.py", label="🧠 Advanced Planner (Coming Soon)")
-st.caption("Eventually, combine all tools to build a master forecast that reflects your full FIRE strategy.")
+st.page_link("pages/2_Advanced_Planner.py", label="🧠 Advanced Planner")
+st.caption("Plan tax-aware withdrawals across taxable, tax-deferred and Roth accounts.")
 
 st.markdown("---")
 st.markdown(
@@ -1,12 +1,11 @@
-import plotly.graph_objects as go
 import streamlit as st
-from calculate_fi_progress import calculate_fire_number, estimate_years_to_fi
-import pandas as pd
+from money_matters.engine import project_lifetime
+from derived_values import derived
 import datetime
+import math
 this_year = datetime.datetime.now().year
-from style_utils import inject_tab_style, inject_button_style
-inject_tab_style()
-inject_button_style()
+from style_utils import inject_page_style
+inject_page_style()
 from session_defaults import DEFAULTS
 from input_utils import synced_number_input
 from utils_session import initialize_state_once
@@ -43,9 +42,9 @@ with st.expander("💡 What Is FIRE and How Does This Tool Help?", expanded=Fals
     ---
     🔍 **Note on Traditional Retirement Income**
 
-    This FIRE Tracker focuses on assets you can access before traditional retirement age (e.g. brokerage accounts & Roth contributions). It does **NOT** include income from Social Security, pensions, or annuities, which typically begin at age 62 or later.
+    This FIRE Tracker focuses on assets you can access before traditional retirement age (e.g. brokerage accounts & Roth contributions). Social Security and pension income are optional and only reduce withdrawals once they start, typically at age 62 or later.
 
-    For full retirement modeling, check out our **Advanced Planner**. (Coming Soon!)
+    For account-by-account withdrawals, taxes and RMDs, check out our **Advanced Planner**.
     """)
 
 
@@ -105,8 +104,8 @@ else:
 # Total accessible funds for early retirement
 early_access_assets = liquid_assets
 # Full net worth (includes restricted retirement accounts)
-current_net_worth = liquid_assets + illiquid_assets if include_illiquid else liquid_assets
-total_net_worth = early_access_assets + retirement_assets + illiquid_assets
+current_net_worth = derived("current_net_worth")
+total_net_worth = derived("total_net_worth")
 
 # Annual Savings
 annual_savings = st.number_input(
@@ -140,6 +139,10 @@ st.session_state["fire_expenses"] = fire_expenses
 from shared_components import inflation_picker
 inflation_rate = inflation_picker()
 
+# Simulation time step from Shared Component
+from shared_components import time_step_picker
+periods_per_year = time_step_picker()
+
 # Withdrawl Scenario
 from shared_components import withdrawal_picker
 
@@ -152,94 +155,188 @@ adjust_fire_expenses_for_inflation = st.checkbox(
 )
 st.session_state["adjust_fire_expenses_for_inflation"] = adjust_fire_expenses_for_inflation
 
-# --- CONVERSION ---
-inflation_rate /= 100
-
-def get_effective_assets(user_age, liquid_assets, retirement_assets, fire_year, include_illiquid=False, illiquid_assets=0, access_age=59.5):
-    import datetime
-
-    current_year = datetime.datetime.now().year
-    access_year = current_year + int(access_age - user_age)
-
-    base_assets = liquid_assets + (illiquid_assets if include_illiquid else 0)
+# --- LIFETIME OPTIONS ---
+with st.expander("🧓 Retirement Income & Lifespan (Optional)", expanded=False):
+    plan_end_age = st.number_input(
+        "⏳ Plan Through Age",
+        min_value=int(user_age) + 1,
+        max_value=110,
+        value=max(int(st.session_state.get("plan_end_age", 95)), int(user_age) + 1),
+        help="The projection keeps going after FIRE, drawing down your portfolio until this age."
+    )
+    st.session_state["plan_end_age"] = plan_end_age
+
+    ss_col1, ss_col2 = st.columns(2)
+    with ss_col1:
+        social_security_income = st.number_input(
+            "🏛️ Social Security ($/yr, today's dollars)",
+            min_value=0,
+            value=int(st.session_state.get("social_security_income", 0)),
+            step=1000,
+            help="Your estimated benefit from ssa.gov. Grows with inflation once it starts."
+        )
+        st.session_state["social_security_income"] = social_security_income
+    with ss_col2:
+        social_security_age = st.slider(
+            "↳ Claiming Age",
+            min_value=62,
+            max_value=70,
+            value=st.session_state.get("social_security_age", 67)
+        )
+        st.session_state["social_security_age"] = social_security_age
+
+    pension_col1, pension_col2 = st.columns(2)
+    with pension_col1:
+        pension_income = st.number_input(
+            "💼 Pension or Annuity ($/yr)",
+            min_value=0,
+            value=int(st.session_state.get("pension_income", 0)),
+            step=1000,
+            help="A fixed yearly amount, not adjusted for inflation."
+        )
+        st.session_state["pension_income"] = pension_income
+    with pension_col2:
+        pension_age = st.slider(
+            "↳ Pension Start Age",
+            min_value=50,
+            max_value=75,
+            value=st.session_state.get("pension_age", 65)
+        )
+        st.session_state["pension_age"] = pension_age
+
+# --- MONTE CARLO OPTIONS ---
+MC_METHODS = {
+    "Lognormal": "lognormal",
+    "Normal": "normal",
+    "Historical Bootstrap (1928–2024)": "bootstrap"
+}
+
+with st.expander("🎲 Monte Carlo Mode (Optional)", expanded=False):
+    mc_enabled = st.checkbox(
+        "Simulate market ups and downs",
+        value=st.session_state.get("mc_enabled", False),
+        help="Runs thousands of randomized return and inflation paths to show how likely you are to reach FIRE on time."
+    )
+    st.session_state["mc_enabled"] = mc_enabled
 
-    if fire_year >= access_year:
-        return (
-            base_assets + retirement_assets,
-            "✅ Retirement assets will be fully accessible at FIRE year.",
-            {
-                "bridge_years": 0,
-                "reduction_factor": 1.0,
-                "needs_bridge_strategy": False
-            }
+    mc_method = st.selectbox(
+        "📉 Return Model",
+        options=list(MC_METHODS.keys()),
+        index=list(MC_METHODS.keys()).index(st.session_state.get("mc_method", "Lognormal")),
+        help="Lognormal and Normal draw returns around your expected return. Historical Bootstrap replays random years of US stock, bond and inflation history."
+    )
+    st.session_state["mc_method"] = mc_method
+
+    if MC_METHODS[mc_method] == "bootstrap":
+        mc_stock_allocation = st.slider(
+            "📊 Stock Allocation (%)",
+            min_value=0,
+            max_value=100,
+            value=st.session_state.get("mc_stock_allocation", 100),
+            step=5,
+            help="Share of the portfolio in US stocks; the rest follows 10-year Treasury returns."
         )
+        st.session_state["mc_stock_allocation"] = mc_stock_allocation
     else:
-        years_to_access = access_year - fire_year
-        reduction_factor = max(0, 1 - (years_to_access / 10))
-        partial_access = retirement_assets * reduction_factor
-        total_assets = base_assets + partial_access
-
-        if retirement_assets > 0:
-            message = (
-                f"🚧 You will reach FIRE {years_to_access} years before you can fully access retirement accounts. "
-                f"We estimate you'll be able to tap into about {reduction_factor:.0%} of those assets during this early phase."
-            )
-        else:
-            message = (
-                f"🚧 You will reach FIRE {years_to_access} years before traditional retirement age, but since you've allocated $0 to retirement-restricted accounts, there's no early access needed."
-            )
+        mc_volatility = st.number_input(
+            "🌊 Annual Return Volatility (%)",
+            min_value=0.0,
+            max_value=40.0,
+            value=st.session_state.get("mc_volatility", 15.0),
+            step=0.5,
+            help="Standard deviation of yearly returns. A broad stock index has historically been around 15–20%."
+        )
+        st.session_state["mc_volatility"] = mc_volatility
+
+        mc_inflation_volatility = st.number_input(
+            "🌡️ Annual Inflation Volatility (%)",
+            min_value=0.0,
+            max_value=5.0,
+            value=st.session_state.get("mc_inflation_volatility", 1.0),
+            step=0.1,
+            help="Standard deviation of yearly inflation around your inflation scenario."
+        )
+        st.session_state["mc_inflation_volatility"] = mc_inflation_volatility
 
-        bridge_info = {
-            "bridge_years": years_to_access,
-            "reduction_factor": reduction_factor,
-            "needs_bridge_strategy": True
-        }
+    mc_paths = st.select_slider(
+        "🧵 Number of Simulated Paths",
+        options=[1000, 5000, 10000, 50000, 100000],
+        value=st.session_state.get("mc_paths", 10000),
+        help="More paths give smoother estimates and take slightly longer."
+    )
+    st.session_state["mc_paths"] = mc_paths
+
+    mc_seed = st.number_input(
+        "🎯 Random Seed",
+        min_value=0,
+        value=st.session_state.get("mc_seed", 42),
+        step=1,
+        help="The same seed always reproduces the same simulated paths."
+    )
+    st.session_state["mc_seed"] = mc_seed
 
-        return total_assets, message, bridge_info
+# --- TAX-AWARE ACCESS OPTIONS ---
+from money_matters.engine.drawdown import FILING_STATUSES
 
+with st.expander("🧾 Tax-Aware Retirement Access (Optional)", expanded=False):
+    tax_aware_access = st.checkbox(
+        "Count retirement accounts after taxes and early-withdrawal penalties",
+        value=st.session_state.get("tax_aware_access", False),
+        help="Replaces the simple early-access haircut with federal income tax on your FIRE spending and the 10% penalty on whatever your other assets can't cover before 59½."
+    )
+    st.session_state["tax_aware_access"] = tax_aware_access
+
+    status_labels = list(FILING_STATUSES.values())
+    status_keys = list(FILING_STATUSES.keys())
+    filing_label = st.selectbox(
+        "👥 Filing Status",
+        options=status_labels,
+        index=status_keys.index(st.session_state.get("filing_status", "married_joint")),
+        disabled=not tax_aware_access,
+        help="Uses 2024 federal brackets and standard deduction."
+    )
+    filing_status = status_keys[status_labels.index(filing_label)]
+    st.session_state["filing_status"] = filing_status
 
+# --- CONVERSION ---
+inflation_rate /= 100
 
 # --- CALCULATION BLOCK ---
+# Results stay up after the first run, so Monte Carlo jobs can finish in the background
 if st.button("👉 >> Calculate Years to FIRE >>"):
+    st.session_state["calculation_run"] = True
 
-    # Step 1: FIRE Goal (Base)
-    fire_goal_base = calculate_fire_number(fire_expenses, withdrawal_rate)
-    this_year = datetime.datetime.now().year
-    retirement_accessible = float(user_age) >= 59.5
-
-    # Step 1.5: Get effective assets before estimation
-    adjusted_expenses = fire_expenses * ((1 + inflation_rate) ** 1) if adjust_fire_expenses_for_inflation else fire_expenses  # Temporary 1-year inflation buffer for first pass
-    fire_goal_base = calculate_fire_number(adjusted_expenses, withdrawal_rate)
-    fire_year_guess = this_year + 1  # Temporary guess for bridge years
-
-    effective_fire_assets, _, _ = get_effective_assets(
-        user_age, liquid_assets, retirement_assets, fire_year_guess,
-        include_illiquid=include_illiquid, illiquid_assets=illiquid_assets
-    )
-
-    # Step 2: First Estimation — FIRE Year
-    temp_years_to_fi, _, _ = estimate_years_to_fi(effective_fire_assets, annual_savings, annual_return, fire_goal_base)
-    fire_year = this_year + temp_years_to_fi
-
-    # Step 3: Inflation Adjustment
-    adjusted_expenses = fire_expenses * ((1 + inflation_rate) ** temp_years_to_fi) if adjust_fire_expenses_for_inflation else fire_expenses
-    fire_goal = calculate_fire_number(adjusted_expenses, withdrawal_rate)
-
-    # Step 4: Get Effective FIRE Assets & Bridge Message
-    effective_fire_assets, bridge_message, bridge_info = get_effective_assets(
-        user_age, liquid_assets, retirement_assets, fire_year,
-        include_illiquid=include_illiquid, illiquid_assets=illiquid_assets
-    )
+if st.session_state.get("calculation_run"):
+    import plotly.graph_objects as go  # Loaded only once there is a chart to draw
 
-    # Step 5: Final Estimation
-    years_to_fi, final_net_worth, net_worth_history = estimate_years_to_fi(
-    effective_fire_assets, annual_savings, annual_return, fire_goal
-    )
+    # Step 1: Solve for the FIRE year where inflated goal, retirement access and projection agree
+    # (derived from the session inputs above; re-solved only when one of them changes)
+    this_year = datetime.datetime.now().year
+    solution = derived("fire_solution")
+
+    # Step 2: Unpack the converged results
+    years_to_fi = solution["years_to_fi"]
+    fire_goal = derived("fire_goal")
+    adjusted_expenses = derived("adjusted_expenses")
+    effective_fire_assets = solution["effective_assets"]
+    bridge_message = solution["bridge_message"]
+    bridge_info = solution["bridge_info"]
+    final_net_worth = solution["final_net_worth"]
     fire_year = this_year + years_to_fi
     fire_age = user_age + years_to_fi
     progress_pct = min(effective_fire_assets / fire_goal, 1.0)
 
-    # Step 6: Sync Outputs
+    # Accumulation and drawdown in one pass, through the plan end age
+    lifetime = project_lifetime(
+        effective_fire_assets, annual_savings, annual_return, years_to_fi, fire_expenses, user_age,
+        end_age=plan_end_age, inflation_rate=inflation_rate, merit_growth=savings_growth,
+        adjust_for_inflation=adjust_fire_expenses_for_inflation,
+        social_security=social_security_income, social_security_age=social_security_age,
+        pension=pension_income, pension_age=pension_age, periods_per_year=periods_per_year
+    )
+    st.session_state["lifetime_projection"] = lifetime
+
+    # Step 3: Sync Outputs
     st.session_state["fire_goal"] = fire_goal
     st.session_state["adjusted_expenses"] = adjusted_expenses
     st.session_state["years_to_fi"] = years_to_fi
@@ -248,11 +345,10 @@ if st.button("👉 >> Calculate Years to FIRE >>"):
     st.session_state["fire_age"] = fire_age
     st.session_state["progress_pct"] = progress_pct
     st.session_state["progress_basis"] = "Liquid" if not include_illiquid else "Total"
-    st.session_state["calculation_run"] = True
 
     st.markdown("---")
 
-    # Step 7: Headline
+    # Step 4: Headline
     if progress_pct >= 1.0:
         headline = "🎉 FIRE Achieved · You’re Financially Independent!"
     elif progress_pct >= 0.75:
@@ -270,7 +366,7 @@ if st.button("👉 >> Calculate Years to FIRE >>"):
     </h3>
     """, unsafe_allow_html=True)
 
-    # Step 8: Progress Bar
+    # Step 5: Progress Bar
     st.markdown(f"""
     <style>
     .bar-container {{
@@ -326,30 +422,162 @@ if st.button("👉 >> Calculate Years to FIRE >>"):
     | **Net Worth at FIRE** | ${final_net_worth:,.0f} | Projected total assets by the time you reach financial independence |
     | **Net Worth Today** | ${total_net_worth:,.0f} | Combined value of all assets today |
     """)
+    st.caption(f"🧮 FIRE year converged in {solution['iterations']} solver steps from a single projection pass.")
     
     st.success(bridge_message)
-    if "🚧" in bridge_message and retirement_assets > 0 and progress_pct < 1.0:
-        st.info("💡 To retire earlier, consider increasing liquid savings or exploring Roth IRA conversion ladders, SEPP withdrawals, or taxable asset growth. Find out more in the Advanced Planner (coming soon).")
+    if bridge_info["needs_bridge_strategy"] and retirement_assets > 0 and fire_age < 59.5:
+        from money_matters.engine import projected_net_worth
+        from money_matters.engine.bridge import optimize_bridge
+
+        # Balances at FIRE in today's dollars; the liquid side is the projection minus the counted retirement share
+        growth = (1 + annual_return) ** years_to_fi
+        deflator = (1 + inflation_rate) ** years_to_fi
+        deferred_at_fire = retirement_assets * growth / deflator
+        taxable_at_fire = max(final_net_worth / deflator - deferred_at_fire * bridge_info["reduction_factor"], 0.0)
+        basis_at_fire = min(
+            (current_net_worth + float(projected_net_worth(0.0, annual_savings, 0.0, years_to_fi, savings_growth))) / deflator,
+            taxable_at_fire
+        )
 
-    st.markdown("---")
+        bridge = optimize_bridge(
+            fire_age, taxable_at_fire, basis_at_fire, deferred_at_fire, 0.0, 0.0, fire_expenses,
+            annual_return, inflation_rate, end_age=plan_end_age, filing_status=filing_status
+        )
+        st.session_state["bridge_plan"] = bridge
+        best, baseline = bridge["best"], bridge["baseline"]
+
+        def _strategy_cells(policy):
+            conversion = f"${policy['annual_conversion']:,.0f}/yr" if policy["annual_conversion"] else "None"
+            sepp = f"{policy['sepp_fraction']:.0%} of 401k/IRA → ${policy['sepp_payment']:,.0f}/yr" if policy["sepp_fraction"] else "None"
+            funded = "✅ Yes" if policy["bridge_funded"] else f"❌ ${policy['bridge_shortfall']:,.0f} short or penalized"
+            return f"{conversion} | {sepp} | {funded} | ${policy['lifetime_cost']:,.0f}"
+
+        st.markdown(f"""
+        ### 🪜 Bridge Strategy: Roth Ladder + 72(t) SEPP
+
+        | 🧭 Plan | 🔁 Roth Conversions | 📆 SEPP Withdrawals | 🌉 Bridge Funded | 🧾 Lifetime Tax Cost |
+        |---------|---------------------|---------------------|------------------|----------------------|
+        | **Withdraw as needed** | {_strategy_cells(baseline)} |
+        | **Optimized** | {_strategy_cells(best)} |
+        """)
+        st.caption(
+            f"📘 Searched {bridge['lifetime_cost'].size} conversion and SEPP combinations over the {bridge['bridge_years']}-year bridge to age 59½. "
+            "Conversions run each year until 59½ and become spendable five years later; SEPP payments are fixed and penalty-free. "
+            f"Lifetime tax cost covers federal tax and penalties through age {plan_end_age}, tax left in retirement accounts, and any spending the plan can't fund, in today's dollars. "
+            "Model account-by-account withdrawals in the Advanced Planner."
+        )
+
+    # Monte Carlo results, simulated on a background worker. Changing any input while a run
+    # is in flight cancels it and starts over with the new inputs.
+    mc_results = None
+    if mc_enabled:
+        from money_matters.engine.monte_carlo import PARALLEL_MIN_PATHS, run_monte_carlo, run_monte_carlo_parallel
+        from money_matters.engine.parallel import available_workers
+        from shared_components import job_progress, submit_job
+
+        # Large runs are split across every core in worker processes
+        use_processes = mc_paths >= PARALLEL_MIN_PATHS and available_workers() > 1
+        mc_horizon = st.session_state.get("mc_years", 60)
+        mc_job = submit_job(
+            "monte_carlo", run_monte_carlo_parallel if use_processes else run_monte_carlo,
+            effective_fire_assets, annual_savings, fire_expenses, withdrawal_rate,
+            n_paths=mc_paths,
+            n_years=mc_horizon,
+            mean_return=annual_return,
+            volatility=st.session_state.get("mc_volatility", 15.0) / 100,
+            mean_inflation=inflation_rate,
+            inflation_volatility=st.session_state.get("mc_inflation_volatility", 1.0) / 100,
+            method=MC_METHODS[mc_method],
+            stock_allocation=st.session_state.get("mc_stock_allocation", 100) / 100,
+            merit_growth=savings_growth,
+            adjust_for_inflation=adjust_fire_expenses_for_inflation,
+            target_years=years_to_fi,
+            seed=int(mc_seed)
+        )
+        if not mc_job.done:
+            job_progress("monte_carlo", f"🎲 Simulating {mc_paths:,} market paths...")
+        elif mc_job.state == "failed":
+            st.error(f"⚠️ The Monte Carlo run failed: {mc_job.error()}")
+        elif mc_job.state == "done":
+            mc_results = mc_job.result()
+            st.session_state["mc_results"] = mc_results
+
+    if mc_results is not None:
+        st.markdown("### 🎲 Monte Carlo Outlook")
+
+        mc_col1, mc_col2 = st.columns(2)
+        mc_col1.metric(
+            f"🎯 Chance of FIRE by {fire_year}",
+            f"{mc_results['success_probability']:.0%}",
+            help="Share of simulated paths that reach your FIRE goal by your projected FIRE year."
+        )
+        mc_col2.metric(
+            f"🧭 Chance of FIRE Within {mc_horizon} Years",
+            f"{mc_results['probability_by_year'][-1]:.0%}",
+            help="Share of simulated paths that reach your FIRE goal at any point in the simulated horizon."
+        )
+
+        def _format_years(value):
+            return f"{value:.0f} years" if math.isfinite(value) else f"Not within {mc_horizon} years"
+
+        years_pct = mc_results["years_percentiles"]
+        st.markdown(f"""
+        | 🎲 Outcome | ⏳ Years to FIRE | 🧭 What It Means |
+        |------------|------------------|------------------|
+        | **Lucky (10th percentile)** | {_format_years(years_pct[10])} | Strong markets early on |
+        | **Typical (median)** | {_format_years(years_pct[50])} | Half of paths get there by this point |
+        | **Unlucky (90th percentile)** | {_format_years(years_pct[90])} | Weak or volatile markets |
+        """)
+
+        mc_years = [this_year + i for i in range(mc_horizon + 1)]
+        bands = dict(zip(mc_results["percentiles"], mc_results["net_worth_percentiles"]))
+
+        mc_fig = go.Figure()
+        mc_fig.add_trace(go.Scatter(x=mc_years, y=bands[90], line=dict(width=0), showlegend=False, hoverinfo="skip"))
+        mc_fig.add_trace(go.Scatter(x=mc_years, y=bands[10], fill="tonexty", fillcolor="rgba(76,175,80,0.15)", line=dict(width=0), name="10th–90th percentile", hoverinfo="skip"))
+        mc_fig.add_trace(go.Scatter(x=mc_years, y=bands[75], line=dict(width=0), showlegend=False, hoverinfo="skip"))
+        mc_fig.add_trace(go.Scatter(x=mc_years, y=bands[25], fill="tonexty", fillcolor="rgba(76,175,80,0.3)", line=dict(width=0), name="25th–75th percentile", hoverinfo="skip"))
+        mc_fig.add_trace(go.Scatter(x=mc_years, y=bands[50], line=dict(color="green"), name="Median", hovertemplate="$%{y:,.0f} median net worth<br>in %{x}"))
+        mc_fig.add_hline(y=fire_goal, line_dash="dash", line_color="gray", annotation_text="🎯 FIRE Goal", annotation_position="top left")
+        mc_fig.update_layout(
+            title="🎲 Range of Net Worth Outcomes",
+            xaxis_title="Calendar Year",
+            yaxis_title="Projected Net Worth",
+            template="plotly_white",
+            legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5)
+        )
+        st.plotly_chart(mc_fig, use_container_width=True)
+        st.caption(f"📘 {mc_paths:,} simulated paths ({mc_method.lower()} returns, seed {int(mc_seed)}). Shaded bands show where most outcomes land.")
+
+        st.markdown("---")
 
 # Net worth chart
 
     import datetime
     this_year = datetime.datetime.now().year
-    year_list = [this_year + i for i in range(len(net_worth_history))]
+    lifetime_history = lifetime["net_worth"]
+    year_list = [this_year + i for i in range(len(lifetime_history))]
     fire_year = this_year + years_to_fi
+    depletion_age = lifetime["depletion_age"]
 
     fig = go.Figure()
 
-    # Main Net Worth Line
+    # Main Net Worth Line: accumulation, then drawdown
     fig.add_trace(go.Scatter(
-        x=year_list,
-        y=net_worth_history,
+        x=year_list[:years_to_fi + 1],
+        y=lifetime_history[:years_to_fi + 1],
         mode='lines+markers',
         fill='tozeroy',
         name='Net Worth'
     ))
+    fig.add_trace(go.Scatter(
+        x=year_list[years_to_fi:],
+        y=lifetime_history[years_to_fi:],
+        mode='lines',
+        fill='tozeroy',
+        line=dict(color="#4B8BBE"),
+        name='Drawdown'
+    ))
 
     # 📍 "Today" marker
     fig.add_vline(
@@ -397,9 +625,29 @@ if st.button("👉 >> Calculate Years to FIRE >>"):
         line_width=0
     )
 
+    # 🧓 Retirement income and depletion markers
+    if social_security_income > 0 and user_age < social_security_age <= plan_end_age:
+        fig.add_vline(
+            x=this_year + social_security_age - user_age,
+            line_dash="dot",
+            line_color="#4B8BBE",
+            annotation_text=f"🏛️ Social Security ({social_security_age})",
+            annotation_position="bottom right",
+            annotation_font_size=11
+        )
+    if depletion_age is not None:
+        fig.add_vline(
+            x=this_year + depletion_age - user_age,
+            line_dash="dash",
+            line_color="#B00020",
+            annotation_text=f"⚠️ Money runs out (age {depletion_age:.0f})",
+            annotation_position="top right",
+            annotation_font_size=11
+        )
+
     fig.add_annotation(
         x=this_year + (fire_year - this_year) / 2,
-        y=max(net_worth_history)*0.95,
+        y=max(lifetime_history)*0.95,
         text="Pre-FIRE accumulation phase",
         showarrow=False,
         font=dict(size=11, color="#555"),
@@ -419,17 +667,21 @@ if st.button("👉 >> Calculate Years to FIRE >>"):
 
     st.plotly_chart(fig, use_container_width=True)
 
+    if depletion_age is None:
+        st.success(f"🧓 Your portfolio lasts through age {plan_end_age}, ending with about ${lifetime['ending_net_worth']:,.0f}.")
+    else:
+        st.warning(f"⚠️ At this spending level your portfolio runs out at age {depletion_age:.0f}, {plan_end_age - depletion_age:.0f} years before your plan ends at {plan_end_age}.")
 
-    st.markdown("""
+    st.markdown(f"""
     <div style='font-size: 0.85em; color: #6c757d; font-style: italic; line-height: 1.5; margin-top: 2em;'>
-    <b>Note:</b> This tool uses a phased drawdown strategy to reflect how asset accessibility changes across retirement stages, assuming ~30 years of withdrawals.</br></br>
+    <b>Note:</b> This tool uses a phased drawdown strategy to reflect how asset accessibility changes across retirement stages, projecting withdrawals through age {plan_end_age}.</br></br>
     <ul style='margin-left: 1.5em;'>
     <li>Retiring in your 30s or 40s? You may need a higher FIRE number to support a longer lifespan.</li>
     <li>Limited access to pre-tax accounts (401(k), IRA) before age ~59 can shift your timeline.</li>
     <li>Strong savings and growth can produce similar timelines across different life stages.</li>
-    <li><b>Traditional retirement income</b> like Social Security or pensions is not included here, but it can significantly reduce portfolio drawdowns after age 62.</li>
+    <li><b>Traditional retirement income</b> like Social Security or pensions can significantly reduce portfolio drawdowns after age 62. Add yours under Retirement Income & Lifespan.</li>
     </ul>
-    Want to go deeper into withdrawal strategies and tax planning? The <b>Advanced Planner</b> is on the way.
+    Want to go deeper into withdrawal strategies and tax planning? Try the <b>Advanced Planner</b>.
     </div>
     """, unsafe_allow_html=True)
 
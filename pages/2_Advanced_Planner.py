@@ -2,22 +2,308 @@ import streamlit as st
 from navigation import studio_nav
 import datetime
 this_year = datetime.datetime.now().year  # Needed for some default fields
+from style_utils import inject_page_style
+inject_page_style()
 from session_defaults import DEFAULTS
 from utils_session import initialize_state_once
 initialize_state_once(DEFAULTS)  # ✅ now has the required argument
+from money_matters.engine.drawdown import FILING_STATUSES, ORDERING_RULES
 
 def clear_session_state():
     for key in st.session_state.keys():
         del st.session_state[key]
 
-
+col1, col2, col3 = st.columns([6, 1, 1])
+with col3:
+    if st.button("🔄 Reset", help="Reset Session Inputs"):
+        clear_session_state()
+        st.rerun()
 
 st.set_page_config(page_title="Advanced Planner", page_icon="🧠")
 
 studio_nav()
 
-st.markdown("## 🛠️ Coming Soon to Money Matters Studio")
-st.success(
-    "This page is part of an upcoming feature designed to help you plan with even more clarity and confidence. Stay tuned!",
-    icon="📈"
-)
\ No newline at end of file
+st.title("🧠 Advanced Planner")
+st.caption("Plan your retirement drawdown across taxable, tax-deferred and Roth accounts.")
+
+with st.expander("💡 Why Does Account Type Matter?", expanded=False):
+    st.markdown("""
+Every dollar you spend in retirement comes out of an account with its own tax rules:
+
+- **Taxable (brokerage):** only the gains are taxed, often at 0% or 15% long-term capital gains rates.
+- **Tax-Deferred (401k, traditional IRA):** every dollar is ordinary income, a 10% penalty applies before age 59½, and **Required Minimum Distributions** start at 73.
+- **Roth:** withdrawals are tax-free after 59½; before that, only your contributions come out penalty-free.
+
+This tool helps you answer:
+<blockquote style='color: #B00020; font-style: italic; font-size: 16px;'>“Which account should I draw from first, and how much will taxes cost me over retirement?”</blockquote>
+
+Each year the planner withdraws enough to cover your spending **plus** the federal tax those withdrawals trigger, following the ordering rule you pick.
+""", unsafe_allow_html=True)
+
+st.header("📥 Input Your Plan")
+
+user_age = st.session_state.get("user_age", 35)
+
+# Seed from the Tracker's FIRE age only if it actually reached FIRE (otherwise fire_age is the horizon cap)
+fire_reached = st.session_state.get("final_net_worth", 0) >= st.session_state.get("fire_goal", float("inf"))
+default_start_age = st.session_state.get("fire_age", max(user_age, 50)) if fire_reached else max(user_age, 50)
+start_age = st.number_input(
+    "🎂 Age When Withdrawals Begin",
+    min_value=18,
+    max_value=90,
+    value=min(max(int(st.session_state.get("drawdown_start_age", default_start_age)), 18), 90),
+    help="Defaults to your FIRE age from the FIRE Tracker."
+)
+st.session_state["drawdown_start_age"] = start_age
+
+end_age = st.slider(
+    "⏳ Plan Through Age",
+    min_value=start_age + 5,
+    max_value=110,
+    value=max(st.session_state.get("plan_end_age", 95), start_age + 5),
+    help="How long the money needs to last."
+)
+st.session_state["plan_end_age"] = end_age
+
+st.subheader("🏦 Account Balances at Retirement")
+
+taxable_balance = st.number_input(
+    "💰 Taxable Brokerage & Cash ($)",
+    min_value=0,
+    value=int(st.session_state.get("drawdown_taxable", st.session_state.get("liquid_assets", 300000))),
+    step=10000,
+    help="Defaults to your liquid assets from the FIRE Tracker."
+)
+st.session_state["drawdown_taxable"] = taxable_balance
+
+taxable_basis_pct = st.slider(
+    "↳ Cost Basis (% of Taxable Balance)",
+    min_value=0,
+    max_value=100,
+    value=st.session_state.get("drawdown_taxable_basis_pct", 60),
+    step=5,
+    help="What you originally paid in. Only the rest is a capital gain when you sell."
+)
+st.session_state["drawdown_taxable_basis_pct"] = taxable_basis_pct
+
+deferred_balance = st.number_input(
+    "🏛️ Tax-Deferred: 401(k), Traditional IRA ($)",
+    min_value=0,
+    value=int(st.session_state.get("drawdown_deferred", st.session_state.get("retirement_assets", 400000))),
+    step=10000,
+    help="Defaults to your retirement-constrained assets from the FIRE Tracker."
+)
+st.session_state["drawdown_deferred"] = deferred_balance
+
+roth_balance = st.number_input(
+    "🌱 Roth IRA / Roth 401(k) ($)",
+    min_value=0,
+    value=int(st.session_state.get("drawdown_roth", 0)),
+    step=10000
+)
+st.session_state["drawdown_roth"] = roth_balance
+
+roth_basis = st.number_input(
+    "↳ Roth Contributions ($)",
+    min_value=0,
+    max_value=int(roth_balance),
+    value=min(int(st.session_state.get("drawdown_roth_basis", 0)), int(roth_balance)),
+    step=1000,
+    help="Direct contributions can be withdrawn tax- and penalty-free at any age."
+)
+st.session_state["drawdown_roth_basis"] = roth_basis
+
+st.subheader("🧾 Spending & Taxes")
+
+annual_spending = st.number_input(
+    "🔥 Annual Spending (Today's Dollars)",
+    min_value=0,
+    value=int(st.session_state.get("fire_expenses", 80000)),
+    step=1000,
+    help="Shared with the FIRE Tracker. Grows with inflation every year."
+)
+st.session_state["fire_expenses"] = annual_spending
+
+status_labels = list(FILING_STATUSES.values())
+status_keys = list(FILING_STATUSES.keys())
+filing_label = st.selectbox(
+    "👥 Filing Status",
+    options=status_labels,
+    index=status_keys.index(st.session_state.get("filing_status", "married_joint")),
+    help="Uses 2024 federal brackets and standard deduction, indexed to inflation."
+)
+filing_status = status_keys[status_labels.index(filing_label)]
+st.session_state["filing_status"] = filing_status
+
+rule_labels = list(ORDERING_RULES.values())
+rule_keys = list(ORDERING_RULES.keys())
+ordering_label = st.selectbox(
+    "🧮 Withdrawal Order",
+    options=rule_labels,
+    index=rule_keys.index(st.session_state.get("drawdown_ordering", "conventional")),
+    help="Conventional spends taxable money first and lets tax-advantaged accounts grow. Bracket Fill draws tax-deferred money up to the top of a low bracket every year to shrink future RMDs."
+)
+ordering = rule_keys[rule_labels.index(ordering_label)]
+st.session_state["drawdown_ordering"] = ordering
+
+if ordering == "bracket_fill":
+    _, input_col = st.columns([0.05, 0.95])
+    with input_col:
+        fill_bracket_rate = st.select_slider(
+            "↳ Fill Up To Bracket",
+            options=[0.10, 0.12, 0.22, 0.24],
+            value=st.session_state.get("drawdown_fill_bracket", 0.12),
+            format_func=lambda rate: f"{rate:.0%}"
+        )
+        st.session_state["drawdown_fill_bracket"] = fill_bracket_rate
+else:
+    fill_bracket_rate = st.session_state.get("drawdown_fill_bracket", 0.12)
+
+from shared_components import return_picker
+annual_return, return_label = return_picker()
+
+from shared_components import inflation_picker
+inflation_rate = inflation_picker() / 100
+
+with st.expander("🎲 Monte Carlo Mode (Optional)", expanded=False):
+    drawdown_mc = st.checkbox(
+        "Simulate market ups and downs",
+        value=st.session_state.get("drawdown_mc", False),
+        help="Runs the drawdown on thousands of randomized return and inflation paths."
+    )
+    st.session_state["drawdown_mc"] = drawdown_mc
+
+    mc_volatility = st.number_input(
+        "🌊 Annual Return Volatility (%)",
+        min_value=0.0,
+        max_value=40.0,
+        value=st.session_state.get("mc_volatility", 15.0),
+        step=0.5
+    )
+    st.session_state["mc_volatility"] = mc_volatility
+
+    mc_paths = st.select_slider(
+        "🧵 Number of Simulated Paths",
+        options=[1000, 5000, 10000, 50000],
+        value=min(st.session_state.get("mc_paths", 10000), 50000)
+    )
+    st.session_state["mc_paths"] = mc_paths
+
+if st.button("👉 >> Run Drawdown Plan >>"):
+    # NumPy and plotly load only once a plan actually runs
+    import numpy as np
+    import plotly.graph_objects as go
+    from money_matters.engine.drawdown import compare_orderings
+
+    st.markdown("---")
+
+    n_years = end_age - start_age
+    if drawdown_mc:
+        from money_matters.engine.monte_carlo import draw_paths
+
+        returns, inflation = draw_paths(
+            mc_paths, n_years, annual_return, mc_volatility / 100, inflation_rate,
+            st.session_state.get("mc_inflation_volatility", 1.0) / 100,
+            method="lognormal", seed=int(st.session_state.get("mc_seed", 42))
+        )
+    else:
+        returns, inflation = annual_return, inflation_rate
+
+    plans = compare_orderings(
+        start_age, taxable_balance, taxable_balance * taxable_basis_pct / 100,
+        deferred_balance, roth_balance, roth_basis, annual_spending,
+        returns, inflation, n_years=n_years, filing_status=filing_status,
+        fill_bracket_rate=fill_bracket_rate
+    )
+    plan = plans[ordering]
+    st.session_state["drawdown_results"] = plan
+
+    success_rate = plan["success"].mean()
+    median_path = int(np.argsort(plan["ending_balance_real"])[len(plan["ending_balance_real"]) // 2])
+    depleted = plan["depleted_year"][median_path]
+
+    if success_rate == 1.0:
+        headline = f"🎉 Your money lasts through age {end_age}"
+    elif drawdown_mc:
+        headline = f"{'🟢' if success_rate >= 0.9 else '🟡' if success_rate >= 0.75 else '🔴'} Your money lasts through age {end_age} in {success_rate:.0%} of simulated paths"
+    else:
+        headline = f"🔴 Your money runs out at age {start_age + int(depleted)}"
+
+    st.markdown(f"""
+    <h3 style='margin-top:0; color:#4a6572; font-weight:600;'>
+    {headline}
+    </h3>
+    """, unsafe_allow_html=True)
+
+    deflator = plan["price_index"][median_path]
+    lifetime_taxes = plan["lifetime_taxes"][median_path]
+    total_rmd = (plan["rmd"][median_path] / deflator[:-1]).sum()
+    peak_tax = (plan["taxes"][median_path] / deflator[:-1]).max()
+
+    st.markdown(f"""
+    ### 🧾 Drawdown Summary{" (Median Path)" if drawdown_mc else ""}
+
+    | 📁 Metric | 📊 Your Result | 💡 What It Means |
+    |-----------|----------------|------------------|
+    | **Lifetime Federal Tax** | ${lifetime_taxes:,.0f} | Income tax plus any early-withdrawal penalties, in today's dollars |
+    | **Peak Annual Tax** | ${peak_tax:,.0f} | Your most expensive tax year, in today's dollars |
+    | **Required Minimum Distributions** | ${total_rmd:,.0f} | Total the IRS makes you withdraw from tax-deferred accounts after 73 |
+    | **Balance at Age {end_age}** | ${plan['ending_balance_real'][median_path]:,.0f} | What's left for heirs or a longer life, in today's dollars |
+    """)
+
+    # Balances by account (median path, today's dollars)
+    ages = np.arange(start_age, end_age + 1)
+    fig = go.Figure()
+    for key, label, color in [("taxable", "Taxable", "#4B8BBE"), ("deferred", "Tax-Deferred", "goldenrod"), ("roth", "Roth", "green")]:
+        fig.add_trace(go.Scatter(
+            x=ages,
+            y=plan[key][median_path] / deflator,
+            name=label,
+            stackgroup="balances",
+            line=dict(color=color),
+            hovertemplate=f"{label}<br>Age %{{x}}: $%{{y:,.0f}}<extra></extra>"
+        ))
+    fig.update_layout(
+        title="🏦 Account Balances Over Retirement",
+        xaxis_title="Age",
+        yaxis_title="Balance (Today's Dollars)",
+        template="plotly_white"
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Taxes by year
+    tax_fig = go.Figure()
+    tax_fig.add_trace(go.Bar(
+        x=ages[:-1],
+        y=(plan["taxes"][median_path] + plan["penalties"][median_path]) / deflator[:-1],
+        marker_color="#B00020",
+        hovertemplate="Age %{x}: $%{y:,.0f}<extra></extra>"
+    ))
+    tax_fig.update_layout(
+        title="🧾 Federal Tax by Year",
+        xaxis_title="Age",
+        yaxis_title="Tax (Today's Dollars)",
+        template="plotly_white",
+        showlegend=False
+    )
+    st.plotly_chart(tax_fig, use_container_width=True)
+
+    # Every ordering rule on the same paths
+    st.markdown("### ⚖️ How the Withdrawal Orders Compare")
+    rows = "\n".join(
+        f"    | {'**' if rule == ordering else ''}{ORDERING_RULES[rule]}{'**' if rule == ordering else ''} "
+        f"| {result['success'].mean():.0%} | ${np.median(result['lifetime_taxes']):,.0f} | ${np.median(result['ending_balance_real']):,.0f} |"
+        for rule, result in plans.items()
+    )
+    st.markdown(f"""
+    | 🧮 Withdrawal Order | ✅ Lasts Through {end_age} | 🧾 Lifetime Tax | 💼 Balance at {end_age} |
+    |---------------------|----------------------------|-----------------|--------------------------|
+{rows}
+    """)
+    st.caption("📘 Medians across all paths, in today's dollars." if drawdown_mc else "📘 In today's dollars.")
+
+    st.markdown("""
+    <div style='font-size: 0.85em; color: #6c757d; font-style: italic; line-height: 1.5; margin-top: 2em;'>
+    <b>Note:</b> Taxes use 2024 federal brackets, the standard deduction and long-term capital gains rates, indexed to inflation. Withdrawals are taken at the start of each year. State taxes, Social Security, Roth conversions and dividend taxes are not included. Taxable withdrawals realize gains in proportion to your unrealized gains. This is an educational estimate, not tax advice.
+    </div>
+    """, unsafe_allow_html=True)
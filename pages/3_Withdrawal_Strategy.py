@@ -2,20 +2,212 @@ import streamlit as st
 from navigation import studio_nav
 import datetime
 this_year = datetime.datetime.now().year  # Needed for some default fields
+from style_utils import inject_page_style
+inject_page_style()
 from session_defaults import DEFAULTS
 from utils_session import initialize_state_once
 initialize_state_once(DEFAULTS)  # ✅ now has the required argument
+from money_matters.engine.withdrawal_backtest import SPENDING_RULES
 
 def clear_session_state():
     for key in st.session_state.keys():
         del st.session_state[key]
 
+col1, col2, col3 = st.columns([6, 1, 1])
+with col3:
+    if st.button("🔄 Reset", help="Reset Session Inputs"):
+        clear_session_state()
+        st.rerun()
+
 st.set_page_config(page_title="Withdrawal Designer", page_icon="📤")
 
 studio_nav()
 
-st.markdown("## 🛠️ Coming Soon to Money Matters Studio")
-st.success(
-    "This page is part of an upcoming feature designed to help you plan with even more clarity and confidence. Stay tuned!",
-    icon="📈"
+st.title("📤 Withdrawal Designer")
+st.caption("Stress-test your withdrawal plan against every stretch of market history since 1928.")
+
+with st.expander("💡 How Does a Withdrawal Backtest Work?", expanded=False):
+    st.markdown("""
+A **withdrawal backtest** replays your retirement plan starting in every historical year, using the actual stock, bond and inflation returns that followed.
+
+This tool helps you answer:
+<blockquote style='color: #B00020; font-style: italic; font-size: 16px;'>“If I had retired in any year since 1928, would my money have lasted?”</blockquote>
+
+Each start year is a **cohort**. The **survival rate** is the share of cohorts whose portfolio lasted the full retirement, and the **maximum sustainable withdrawal rate** is the highest starting rate that every cohort survived.
+""", unsafe_allow_html=True)
+
+st.header("📥 Input Your Plan")
+
+portfolio_value = st.number_input(
+    "💼 Portfolio at Retirement ($)",
+    min_value=0,
+    value=int(st.session_state.get("withdrawal_portfolio", st.session_state.get("fire_goal", 1000000))),
+    step=10000,
+    help="Investable assets you'll draw from. Defaults to your FIRE goal from the FIRE Tracker."
+)
+st.session_state["withdrawal_portfolio"] = portfolio_value
+
+# Withdrawal Scenario
+from shared_components import withdrawal_picker
+withdrawal_rate, withdrawal_scenario = withdrawal_picker()
+
+rule_labels = list(SPENDING_RULES.values())
+rule_keys = list(SPENDING_RULES.keys())
+spending_rule_label = st.selectbox(
+    "🧮 Spending Rule",
+    options=rule_labels,
+    index=rule_keys.index(st.session_state.get("withdrawal_rule", "constant_dollar")),
+    help="Constant Dollar keeps real spending steady. Constant Percent spends a fixed share of whatever the portfolio is worth. Guardrails trims or raises spending when your withdrawal rate drifts too far."
 )
+spending_rule = rule_keys[rule_labels.index(spending_rule_label)]
+st.session_state["withdrawal_rule"] = spending_rule
+
+if spending_rule == "guardrails":
+    _, input_col = st.columns([0.05, 0.95])
+    with input_col:
+        guardrail_band = st.slider(
+            "↳ Guardrail Band (%)",
+            min_value=5,
+            max_value=50,
+            value=st.session_state.get("guardrail_band", 20),
+            step=5,
+            help="How far your current withdrawal rate may drift from the starting rate before spending is adjusted."
+        )
+        st.session_state["guardrail_band"] = guardrail_band
+
+        guardrail_adjustment = st.slider(
+            "↳ Spending Adjustment (%)",
+            min_value=5,
+            max_value=25,
+            value=st.session_state.get("guardrail_adjustment", 10),
+            step=1,
+            help="How much spending is cut or raised when a guardrail is hit."
+        )
+        st.session_state["guardrail_adjustment"] = guardrail_adjustment
+else:
+    guardrail_band = st.session_state.get("guardrail_band", 20)
+    guardrail_adjustment = st.session_state.get("guardrail_adjustment", 10)
+
+retirement_years = st.slider(
+    "⏳ Retirement Length (Years)",
+    min_value=10,
+    max_value=60,
+    value=st.session_state.get("withdrawal_years", 30),
+    help="How many years the portfolio needs to last. Early retirees often plan for 40–50 years."
+)
+st.session_state["withdrawal_years"] = retirement_years
+
+stock_allocation = st.slider(
+    "📊 Stock Allocation (%)",
+    min_value=0,
+    max_value=100,
+    value=st.session_state.get("withdrawal_stock_allocation", 60),
+    step=5,
+    help="Share of the portfolio in US stocks (S&P 500). The rest follows 10-year US Treasury returns. Rebalanced yearly."
+)
+st.session_state["withdrawal_stock_allocation"] = stock_allocation
+
+if st.button("👉 >> Run Withdrawal Backtest >>"):
+    # NumPy and plotly load only once a backtest actually runs
+    import numpy as np
+    import plotly.graph_objects as go
+    from money_matters.engine.withdrawal_backtest import backtest_withdrawals, safe_withdrawal_grid
+
+    st.markdown("---")
+
+    results = backtest_withdrawals(
+        portfolio_value, withdrawal_rate,
+        rule=spending_rule,
+        horizon=retirement_years,
+        stock_allocation=stock_allocation / 100,
+        guardrail_band=guardrail_band / 100,
+        guardrail_adjustment=guardrail_adjustment / 100
+    )
+    start_years = results["start_years"]
+    survival_rate = results["survival_rate"]
+    max_rate = results["max_sustainable_rate"]
+    worst_cohort = start_years[results["ending_balance"].argmin()]
+
+    if survival_rate == 1.0:
+        headline = f"🎉 Your plan survived all {len(start_years)} historical retirements"
+    elif survival_rate >= 0.9:
+        headline = f"🟢 Your plan survived {survival_rate:.0%} of historical retirements"
+    elif survival_rate >= 0.75:
+        headline = f"🟡 Your plan survived {survival_rate:.0%} of historical retirements"
+    else:
+        headline = f"🔴 Your plan survived only {survival_rate:.0%} of historical retirements"
+
+    st.markdown(f"""
+    <h3 style='margin-top:0; color:#4a6572; font-weight:600;'>
+    {headline}
+    </h3>
+    """, unsafe_allow_html=True)
+
+    if max_rate is None:
+        max_rate_text = "N/A (no depletion)"
+        max_rate_meaning = "A fixed percentage of the balance never runs out, but spending swings with the market"
+    else:
+        max_rate_text = f"{max_rate:.2%}"
+        max_rate_meaning = f"The highest starting rate that lasted {retirement_years} years in every cohort"
+
+    st.markdown(f"""
+    ### 📤 Withdrawal Backtest Summary
+
+    | 📁 Metric | 📊 Your Result | 💡 What It Means |
+    |-----------|----------------|------------------|
+    | **First-Year Withdrawal** | ${portfolio_value * withdrawal_rate:,.0f} | {withdrawal_rate:.2%} of your starting portfolio |
+    | **Survival Rate** | {survival_rate:.0%} | Share of start years since {start_years[0]} where the money lasted {retirement_years} years |
+    | **Max Sustainable Rate** | {max_rate_text} | {max_rate_meaning} |
+    | **Lowest Real Spending** | {results['min_spending_ratio'].min():.0%} of year one | Deepest spending cut any cohort had to live with |
+    | **Toughest Start Year** | {worst_cohort} | The cohort with the smallest ending balance |
+    """)
+
+    # Ending balance by cohort
+    colors = np.where(results["survived"], "green", "#B00020")
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=start_years,
+        y=results["ending_balance"],
+        marker_color=colors,
+        hovertemplate="Retire in %{x}<br>$%{y:,.0f} left (start-year dollars)<extra></extra>"
+    ))
+    fig.update_layout(
+        title=f"💼 Ending Balance After {retirement_years} Years by Retirement Year",
+        xaxis_title="Retirement Start Year",
+        yaxis_title="Ending Balance (Start-Year Dollars)",
+        template="plotly_white",
+        showlegend=False
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption("🟩 Survived · 🟥 Ran short. Balances are shown in start-year dollars.")
+
+    # Safe withdrawal rate by retirement length
+    _, horizons, grid = safe_withdrawal_grid(60, stock_allocation / 100)
+    safemax = np.nanmin(grid, axis=0)
+
+    swr_fig = go.Figure()
+    swr_fig.add_trace(go.Scatter(
+        x=horizons,
+        y=safemax * 100,
+        mode="lines",
+        name="Max Sustainable Rate",
+        line=dict(color="goldenrod"),
+        hovertemplate="%{y:.2f}% for %{x} years<extra></extra>"
+    ))
+    swr_fig.add_hline(y=withdrawal_rate * 100, line_dash="dash", line_color="gray", annotation_text=f"Your rate ({withdrawal_rate:.2%})")
+    swr_fig.add_vline(x=retirement_years, line_dash="dot", line_color="#999999")
+    swr_fig.update_layout(
+        title="📉 Historically Safe Withdrawal Rate by Retirement Length",
+        xaxis_title="Retirement Length (Years)",
+        yaxis_title="Max Sustainable Rate (%)",
+        template="plotly_white",
+        showlegend=False
+    )
+    st.plotly_chart(swr_fig, use_container_width=True)
+    st.caption("📘 Constant-dollar spending, worst historical cohort for each retirement length.")
+
+    st.markdown("""
+    <div style='font-size: 0.85em; color: #6c757d; font-style: italic; line-height: 1.5; margin-top: 2em;'>
+    <b>Note:</b> Backtests use annual S&P 500 total returns, 10-year US Treasury returns and CPI inflation since 1928. Withdrawals are taken at the start of each year and the portfolio is rebalanced annually. Taxes and fees are not included, and the future may look different from the past.
+    </div>
+    """, unsafe_allow_html=True)
@@ -2,20 +2,22 @@ import streamlit as st
 from navigation import studio_nav
 if "show_summary" not in st.session_state:
     st.session_state["show_summary"] = False
-from style_utils import inject_tab_style, inject_button_style
+from style_utils import inject_page_style
 
-inject_tab_style()
-inject_button_style()
+inject_page_style()
 from input_utils import synced_number_input
 from budget_summary_analysis import render_budget_analysis
 from session_defaults import init_session_state
 from lifestyle_profiles import (
-    BASE_EXPENSES_BY_HOUSEHOLD,
-    LOCATION_MULTIPLIERS,
     EXPENSE_CATEGORIES,
     HOUSEHOLD_TYPES,
     LOCATION_TIERS,
-    CATEGORY_HELP
+    LIFESTYLE_TEMPLATES,
+    CATEGORY_HELP,
+    HOUSEHOLD_INDEX,
+    apply_template,
+    template_tensor,
+    template_totals
 )
 
 # --- Initialize Session State ---
@@ -45,24 +47,23 @@ def apply_expense_template():
     if st.session_state.get("expenses_customized", False):
         return  # Skip template application if user has customized expenses
 
-    household_type = st.session_state.get("household_type")
-    budget_template = st.session_state.get("budget_template")
-    location_tier = st.session_state.get("location_tier")
-
-    base_profiles = BASE_EXPENSES_BY_HOUSEHOLD.get(household_type, {})
-    base_template = base_profiles.get(budget_template, {})
+    selection = (
+        st.session_state.get("household_type"),
+        st.session_state.get("budget_template"),
+        st.session_state.get("location_tier")
+    )
+    if st.session_state.get("applied_template") == selection:
+        return  # Same lifestyle as last run; expenses are already in place
 
-    multiplier = LOCATION_MULTIPLIERS.get(location_tier, 1.0)
-    adjusted_template = {
-        category: int(round(base_template.get(category, 0) * multiplier))
-        for category in EXPENSE_CATEGORIES
-    }
+    adjusted_template = apply_template(*selection)
 
     st.session_state["expense_template"] = adjusted_template
     st.session_state["expense_categories"] = EXPENSE_CATEGORIES
 
     for category, value in adjusted_template.items():
         st.session_state[f"{category}_expense"] = value
+        st.session_state.pop(f"{category}_expense_input", None)  # inputs show the new template
+    st.session_state["applied_template"] = selection
 
 # --- Expense Input UI ---
 def render_expense_inputs():
@@ -125,6 +126,88 @@ def render_expense_inputs():
         st.session_state["show_summary"] = True
 
 
+# --- Bank Transaction Import ---
+SPENDING_SIGN_LABELS = {
+    "Detect automatically": "auto",
+    "Purchases are negative": "negative",
+    "Purchases are positive": "positive",
+}
+
+def render_transaction_import():
+    with st.expander("🏦 Import bank or credit card transactions (CSV)", expanded=False):
+        st.caption(
+            "Upload a CSV export with date, description and amount (or debit/credit) columns. "
+            "Each transaction is matched to a budget category by merchant keywords, then averaged per month."
+        )
+        uploaded = st.file_uploader("Transactions CSV", type="csv", key="transactions_csv")
+        sign_label = st.radio("Amount sign", list(SPENDING_SIGN_LABELS), horizontal=True, key="transactions_sign")
+        if uploaded is None:
+            return
+
+        # Parse once per file and sign choice, not on every rerun
+        import_key = (uploaded.file_id, sign_label)
+        imported = st.session_state.get("transaction_import")
+        if imported is None or imported["key"] != import_key:
+            import io
+            from money_matters.transactions import import_transactions
+
+            uploaded.seek(0)
+            lines = io.TextIOWrapper(uploaded, encoding="utf-8-sig", errors="replace", newline="")
+            try:
+                result = import_transactions(lines, SPENDING_SIGN_LABELS[sign_label], EXPENSE_CATEGORIES, detect_recurring=True)
+            except ValueError as error:
+                st.error(f"⚠️ {error}")
+                return
+            finally:
+                lines.detach()
+            imported = {"key": import_key, "result": result}
+            st.session_state["transaction_import"] = imported
+
+        result = imported["result"]
+        if not result["months"]:
+            st.warning("No transactions found in this file.")
+            return
+
+        st.markdown(
+            f"**{result['rows']:,} transactions** over **{result['months']} months** "
+            f"(purchases read as {result['spending_sign']} amounts"
+            + (f", {result['skipped']:,} unreadable rows skipped" if result["skipped"] else "") + ")."
+        )
+        st.markdown(
+            "| Category | Monthly Average | Transactions |\n|----------|-----------------|--------------|\n"
+            + "\n".join(
+                f"| {CATEGORY_LABELS.get(category, category)} | ${amount:,.0f} | {result['transactions'][category]:,} |"
+                for category, amount in result["monthly"].items() if amount
+            )
+        )
+        active = [charge for charge in result["recurring"] if charge["active"]]
+        if active:
+            st.markdown(
+                "**🔁 Recurring Charges**\n\n"
+                "| Merchant | Billed | Amount | Per Month | Category |\n|----------|--------|--------|-----------|----------|\n"
+                + "\n".join(
+                    f"| {charge['merchant'].title()} | {charge['cadence'].title()} | ${charge['amount']:,.2f} | "
+                    f"${charge['monthly']:,.2f} | {CATEGORY_LABELS.get(charge['category'], charge['category'])} |"
+                    for charge in active
+                )
+            )
+            st.caption(
+                "📘 Subscriptions and Phone/Internet are set from recurring charges still being billed. "
+                "Unrecognized merchants billing on a schedule count as subscriptions."
+            )
+        if result["unmatched"]:
+            st.caption("❓ Counted as Other: " + ", ".join(description for description, _ in result["unmatched"][:8]))
+
+        if st.button("📥 Use these averages as my monthly expenses"):
+            template = {category: int(round(amount)) for category, amount in result["monthly"].items()}
+            st.session_state["expense_template"] = template
+            st.session_state["expense_categories"] = EXPENSE_CATEGORIES
+            for category, value in template.items():
+                st.session_state[f"{category}_expense"] = value
+                st.session_state.pop(f"{category}_expense_input", None)  # let the inputs pick up the new value
+            st.session_state["expenses_customized"] = True
+            st.rerun()
+
 # --- FIRE Input UI ---
 def render_fire_inputs():
     st.subheader("🔥 FIRE Inputs")
@@ -183,19 +266,15 @@ def render_lifestyle_selector():
         st.session_state["location_tier"] = location_tier
 
     with col3:
-        lifestyle_options = [
-            "🧘‍♀️ Lean & Serene ($)",
-            "🏡 Suburban Comfort ($$)",
-            "🏙️ Urban Explorer ($$$)",
-            "🎨 Creative Nomad ($$$)",
-            "✈️ Jetsetter ($$$$)"
-        ]
+        # Monthly total of every template for this household and location, from one tensor slice
+        totals = dict(zip(LIFESTYLE_TEMPLATES, template_totals(household_type, location_tier)))
         budget_template = st.selectbox(
             "🧬 Lifestyle Template",
-            options=lifestyle_options,
-            index=lifestyle_options.index(
+            options=LIFESTYLE_TEMPLATES,
+            index=LIFESTYLE_TEMPLATES.index(
                 st.session_state.get("budget_template", "🏡 Suburban Comfort ($$)")
             ),
+            format_func=lambda template: f"{template} · ${totals[template]:,.0f}/mo",
             help="Choose a lifestyle profile to pre-fill your expense categories. You can customize them in the next tab.",
             disabled=disabled
         )
@@ -212,6 +291,97 @@ def render_lifestyle_selector():
             del st.session_state[key]
         st.rerun()
 
+# --- Lifestyle x Location FIRE Matrix ---
+# Same horizon as the FIRE Tracker's solve_fire_year
+MATRIX_MAX_YEARS = 100
+
+def render_fire_matrix():
+    import datetime
+    import numpy as np
+    import plotly.graph_objects as go
+    from money_matters.engine.fire import solve_fire_year_batch
+    from money_matters.engine.periods import TIME_STEPS
+
+    st.markdown("### 🗺️ Lifestyle × Location FIRE Matrix")
+    household_type = st.session_state.get("household_type", HOUSEHOLD_TYPES[0])
+    annual_income = st.session_state.get("annual_income", 0)
+    annual_savings = st.session_state.get("annual_savings", 0)
+    user_age = st.session_state.get("user_age", 35)
+
+    savings_mode = st.radio(
+        "💵 Savings in each scenario",
+        ["Income left after lifestyle spending", "My savings target"],
+        horizontal=True,
+        key="fire_matrix_savings_mode",
+        help="Geographic arbitrage usually means the same income goes further, so by default each cell saves what its lifestyle leaves over."
+    )
+
+    # Annual spending for every template x tier of this household: one tensor slice
+    spending = template_tensor()[HOUSEHOLD_INDEX[household_type]].sum(axis=-1) * 12
+    if savings_mode == "My savings target":
+        savings = np.full(spending.shape, float(annual_savings))
+    else:
+        savings = np.maximum(annual_income - spending, 0.0)
+
+    # Same assumptions as the FIRE Tracker, solved for all cells in one batched call
+    solved = solve_fire_year_batch(
+        user_age, st.session_state.get("liquid_assets", 0), st.session_state.get("retirement_assets", 0),
+        savings.ravel(), st.session_state.get("expected_return_percent", 7.0) / 100, spending.ravel(),
+        st.session_state.get("withdrawal_rate", 3.5) / 100,
+        inflation_rate=st.session_state.get("inflation_rate", 2.5) / 100,
+        merit_growth=st.session_state.get("growth_growth_rate", 0.0) / 100,
+        include_illiquid=st.session_state.get("include_illiquid", False),
+        illiquid_assets=st.session_state.get("illiquid_assets", 0),
+        adjust_for_inflation=st.session_state.get("adjust_fire_expenses_for_inflation", True),
+        current_year=datetime.datetime.now().year, max_years=MATRIX_MAX_YEARS,
+        access_model="tax_aware" if st.session_state.get("tax_aware_access") else "haircut",
+        filing_status=st.session_state.get("filing_status", "married_joint"),
+        periods_per_year=TIME_STEPS.get(st.session_state.get("time_step", "Annual"), 1)
+    )
+    years = solved["years_to_fi"].reshape(spending.shape).astype(float)
+    reached = (solved["final_net_worth"] >= solved["fire_goal"]).reshape(spending.shape)
+    years[~reached] = np.nan
+
+    labels = np.where(
+        reached,
+        np.char.add(np.char.add(np.nan_to_num(years).astype(int).astype(str), " yrs · age "),
+                    (user_age + np.nan_to_num(years)).astype(int).astype(str)),
+        f"> {MATRIX_MAX_YEARS} yrs"
+    )
+    spend_labels = np.vectorize(lambda x: f"${x:,.0f}/yr")(spending)
+
+    fig = go.Figure(go.Heatmap(
+        z=years,
+        x=LOCATION_TIERS,
+        y=LIFESTYLE_TEMPLATES,
+        text=labels,
+        customdata=spend_labels,
+        texttemplate="%{text}",
+        hovertemplate="%{y}<br>%{x}<br>%{text}<br>Spending %{customdata}<extra></extra>",
+        colorscale="RdYlGn_r",
+        colorbar=dict(title="Years to FIRE")
+    ))
+    current = (st.session_state.get("budget_template"), st.session_state.get("location_tier"))
+    if current[0] in LIFESTYLE_TEMPLATES and current[1] in LOCATION_TIERS:
+        fig.add_trace(go.Scatter(
+            x=[current[1]], y=[current[0]], mode="markers", name="Your selection",
+            marker=dict(symbol="square-open", size=60, color="black", line=dict(width=3)),
+            hoverinfo="skip", showlegend=False
+        ))
+    fig.update_layout(
+        title=f"⏳ Years to FIRE · {household_type}",
+        xaxis_title="Location Tier",
+        yaxis=dict(title="", autorange="reversed"),
+        template="plotly_white",
+        height=460,
+        margin=dict(l=20, r=20, t=50, b=20)
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(
+        f"📘 {years.size} lifestyle and location combinations solved together with your FIRE Tracker assets, "
+        "return, withdrawal, inflation and retirement-access assumptions. Spending comes from each lifestyle template scaled by location."
+    )
+
 # --- Main App ---
 def run_lifestyle_budgeter():
     
@@ -252,12 +422,14 @@ def run_lifestyle_budgeter():
         apply_expense_template()
 
     with tabs[1]:
+        render_transaction_import()
         render_expense_inputs()
 
 
     if st.session_state.get("show_summary", False):
         st.markdown("---")
         render_budget_analysis()
+        render_fire_matrix()
 
         # -- User notes optional --
         # user_notes = st.text_area("📝 Add notes about this budget session (optional)", placeholder="Reflections, goals, or context...")
@@ -1,15 +1,12 @@
 import streamlit as st
-import numpy as np
-import pandas as pd
-import plotly.graph_objects as go
-import numpy_financial as npf
 import datetime
 this_year = datetime.datetime.now().year
-from style_utils import inject_tab_style, inject_button_style
-inject_tab_style()
-inject_button_style()
+from style_utils import inject_page_style
+inject_page_style()
 from session_defaults import DEFAULTS
 from utils_session import initialize_state_once
+from money_matters.engine import amortization_schedule, project_cashflow, project_property_equity
+from derived_values import derived
 initialize_state_once(DEFAULTS)  # ✅ now has the required argument
 def clear_session_state():
     for key in st.session_state.keys():
@@ -93,10 +90,10 @@ with st.expander("🧰 Additional Property Expenses", expanded=True):
     st.session_state["renovation_costs"] = renovation_costs
 
 # 👉 Insert this block BELOW the inputs
-down_payment = purchase_price * (down_payment_pct / 100)
+down_payment = derived("down_payment")
 
 # 🧮 New addition!
-property_initial_investment = down_payment + closing_costs + renovation_costs
+property_initial_investment = derived("property_initial_investment")
 
 st.markdown(f"💵 **Total Initial Investment:** ${property_initial_investment:,.0f}")
 
@@ -205,6 +202,10 @@ with st.expander("🔧 Customize Your Assumptions", expanded=True):
     from shared_components import inflation_picker
     inflation_rate = inflation_picker()
 
+    # Simulation time step from Shared Component
+    from shared_components import time_step_picker
+    periods_per_year = time_step_picker()
+
     # Withdrawl Scenario
     from shared_components import withdrawal_picker
     withdrawal_rate, withdrawal_scenario = withdrawal_picker()
@@ -225,99 +226,31 @@ adjust_for_inflation = st.checkbox(
 #     </ul>
 #     """, unsafe_allow_html=True)
 
-# --- Core Calculators ---
-def amortization_schedule(loan_amount, annual_interest_rate, loan_term_years, years_held, start_year):
-    monthly_rate = annual_interest_rate / 12 / 100
-    num_payments = loan_term_years * 12
-    monthly_payment = npf.pmt(monthly_rate, num_payments, -loan_amount)  # ✅ this is missing
-
-    schedule = []
-    balance = loan_amount
-
-    for i in range(years_held):
-        year = start_year + i
-        interest_paid = 0
-        principal_paid = 0
-        for _ in range(12):
-            interest = balance * monthly_rate
-            principal = monthly_payment - interest
-            balance -= principal
-            interest_paid += interest
-            principal_paid += principal
-        schedule.append({
-            "Year": year,
-            "Beginning Balance": schedule[-1]["Ending Balance"] if schedule else loan_amount,
-            "Principal Paid": principal_paid,
-            "Interest Paid": interest_paid,
-            "Ending Balance": balance
-        })
-
-    return pd.DataFrame(schedule)
-
-def project_property_equity(purchase_price, appreciation_rate, loan_amount, annual_interest_rate, loan_term, years_held, start_year, inflation_rate=0.0, adjust_for_inflation=False):
-    amort_df = amortization_schedule(loan_amount, annual_interest_rate, loan_term, years_held, start_year)
-    equity_records = []
-
-    for i, row in amort_df.iterrows():
-        year = row["Year"]
-        value = purchase_price * ((1 + appreciation_rate / 100) ** i)
-        equity = value - row["Ending Balance"]
-
-        if adjust_for_inflation:
-            inflation_factor = (1 + inflation_rate / 100) ** i
-            value /= inflation_factor
-            equity /= inflation_factor
-
-        equity_records.append({
-            "Year": year,
-            "Estimated Property Value": value,
-            "Loan Balance": row["Ending Balance"],
-            "Equity": equity
-        })
-    return pd.DataFrame(equity_records)
-
-
 fire_expenses = st.session_state["fire_expenses"]
 
-def project_cashflow(annual_rent, annual_expenses, rental_growth_rate, annual_debt_service, years_out, inflation_rate, adjust_for_inflation):
-    cashflow_records = []
-    for i in range(years_out):
-        rent = annual_rent * ((1 + rental_growth_rate / 100) ** i)
-        expenses = annual_expenses * ((1 + inflation_rate / 100) ** i)
-        net_income = rent - expenses
-        cashflow = net_income - annual_debt_service
-
-        if adjust_for_inflation:
-            inflation_factor = (1 + inflation_rate / 100) ** i
-            cashflow /= inflation_factor
-
-        cashflow_records.append(cashflow)
-
-    return cashflow_records
-
 # --- Results Section ---
 
 if st.button("👉 >> Run Property Model >>"):
     st.session_state["run_model"] = True
 
 if st.session_state["run_model"]:
+    # pandas and plotly load only once the model runs
+    import pandas as pd
+    import plotly.graph_objects as go
+
     st.markdown("---")
     # Your existing calculations and display code here
-    inflation_factor = (1 + inflation_rate / 100) ** years_held
-    loan_amount = purchase_price * (1 - down_payment_pct / 100)
+    loan_amount = derived("loan_amount")
     down_payment = purchase_price - loan_amount
 
     # 🔢 Compute amortized annual mortgage payment
-    monthly_rate = interest_rate / 12 / 100
-    num_payments = loan_term * 12
-    monthly_payment = npf.pmt(monthly_rate, num_payments, -loan_amount)
-    annual_debt_service = monthly_payment * 12
+    annual_debt_service = derived("annual_debt_service")
 
-    gross_yield = (annual_rent / purchase_price) * 100
+    gross_yield = derived("gross_yield")
     cashflow_list = project_cashflow(
         annual_rent, annual_expenses, rental_growth_rate,
         annual_debt_service, years_held,
-        inflation_rate, adjust_for_inflation
+        inflation_rate, adjust_for_inflation, periods_per_year
     )
 
     cashflow_total = sum(cashflow_list)
@@ -325,30 +258,27 @@ if st.session_state["run_model"]:
     annual_cash_flow_year_1 = cashflow_list[0]  # First year of projected cash flow
     cash_on_cash = (annual_cash_flow_year_1 / property_initial_investment) * 100 if property_initial_investment else 0
     
-    # --- Generate equity_df first ---
+    # --- Equity & Cash Flow Calculation ---
     amort_schedule = amortization_schedule(
         loan_amount, interest_rate, loan_term, years_held, purchase_year
     )
 
     equity_records = project_property_equity(
-        purchase_price,
-        appreciation_rate,
-        amort_schedule,
-        inflation_rate,
-        adjust_for_inflation,
-        years_held,
-        start_year=purchase_year
-    )
-
-    equity_df = pd.DataFrame(equity_records)
-
-    # --- Equity & Cash Flow Calculation ---
-    equity_df = project_property_equity(
         purchase_price, appreciation_rate,
-        loan_amount, interest_rate,
-        loan_term, years_held, purchase_year,
-        inflation_rate, adjust_for_inflation
+        amort_schedule, inflation_rate,
+        adjust_for_inflation, purchase_year
     )
+    st.session_state["real_estate_results"] = {
+        "amortization": amort_schedule,
+        "equity": equity_records,
+        "cashflow": cashflow_list,
+    }
+    equity_df = pd.DataFrame(equity_records).rename(columns={
+        "year": "Year",
+        "property_value": "Estimated Property Value",
+        "loan_balance": "Loan Balance",
+        "equity": "Equity"
+    })
 
     years_out = years_held
     projected_equity = equity_df["Equity"].iloc[-1]
@@ -462,26 +392,13 @@ if st.session_state["run_model"]:
     # Update the global session value if changed
     st.session_state["inflation_rate"] = inflation_rate
 
-    # --- Adjust data if needed ---
-    equity_df = equity_df.copy()
-
-    if adjust_for_inflation:
-        equity_df["Inflation Factor"] = [
-            (1 + inflation_rate / 100) ** (year - equity_df["Year"].iloc[0]) for year in equity_df["Year"]
-        ]
-        equity_df["Plot Property Value"] = equity_df["Estimated Property Value"] / equity_df["Inflation Factor"]
-        equity_df["Plot Loan Balance"] = equity_df["Loan Balance"] / equity_df["Inflation Factor"]
-        equity_df["Plot Equity"] = equity_df["Equity"]
-    else:
-        equity_df["Plot Property Value"] = equity_df["Estimated Property Value"]
-        equity_df["Plot Loan Balance"] = equity_df["Loan Balance"]
-        equity_df["Plot Equity"] = equity_df["Equity"]
-
     # --- Plot ---
+    # The engine already returns today's dollars when the toggle is on, deflated with the
+    # same vector as the cash flow, so the chart plots its columns as they are
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=equity_df["Year"], y=equity_df["Plot Property Value"], name="Property Value", line=dict(color="green"), hovertemplate="$%{y:,.0f} market value<br>in %{x}"))
-    fig.add_trace(go.Scatter(x=equity_df["Year"], y=equity_df["Plot Loan Balance"], name="Loan Balance", line=dict(color="red", dash="dot"), hovertemplate="$%{y:,.0f} loan balance<br>in %{x}"))
-    fig.add_trace(go.Scatter(x=equity_df["Year"], y=equity_df["Plot Equity"], name="Net Equity", line=dict(color="blue"), hovertemplate="$%{y:,.0f} equity<br>in %{x}"))
+    fig.add_trace(go.Scatter(x=equity_df["Year"], y=equity_df["Estimated Property Value"], name="Property Value", line=dict(color="green"), hovertemplate="$%{y:,.0f} market value<br>in %{x}"))
+    fig.add_trace(go.Scatter(x=equity_df["Year"], y=equity_df["Loan Balance"], name="Loan Balance", line=dict(color="red", dash="dot"), hovertemplate="$%{y:,.0f} loan balance<br>in %{x}"))
+    fig.add_trace(go.Scatter(x=equity_df["Year"], y=equity_df["Equity"], name="Net Equity", line=dict(color="blue"), hovertemplate="$%{y:,.0f} equity<br>in %{x}"))
     fig.update_layout(template="plotly_white", xaxis_title="Year", yaxis_title="Dollar Value ($)", title="Appreciation & Equity Projection" + (" (Real Dollars)" if adjust_for_inflation else " (Nominal Dollars)"))
 
     st.plotly_chart(fig, use_container_width=True)
@@ -1,14 +1,12 @@
 import streamlit as st
-import numpy_financial as npf
-import pandas as pd
-import plotly.graph_objects as go
 import datetime
 this_year = datetime.datetime.now().year
-from style_utils import inject_tab_style, inject_button_style
-inject_tab_style()
-inject_button_style()
+from style_utils import inject_page_style
+inject_page_style()
 from session_defaults import DEFAULTS
 from utils_session import initialize_state_once
+from money_matters.engine import simulate_real_estate_fire_contribution, simulate_equity
+from money_matters.engine.comparison import compare_fire_columns, find_breakeven
 initialize_state_once(DEFAULTS)  # ✅ now has the required argument
 def clear_session_state():
     for key in st.session_state.keys():
@@ -213,6 +211,10 @@ with tab1:
     # Inflation Input from Shared Component
     from shared_components import inflation_picker
     inflation_rate = inflation_picker()
+
+    # Simulation time step from Shared Component
+    from shared_components import time_step_picker
+    periods_per_year = time_step_picker()
     #st.caption(f"📘 We'll adjust values for inflation using an estimated {inflation_rate:.1f}% annually.")
 
 with tab2:
@@ -280,141 +282,15 @@ adjust_for_inflation = st.checkbox(
 #     </ul>
 #     """, unsafe_allow_html=True)
 
-# --- 🚀 Simulation Logic Functions ---
-
-def simulate_real_estate_fire_contribution(
-    property_value, down_payment_pct, mortgage_rate, mortgage_years,
-    annual_rent, annual_expenses, rental_growth_rate,
-    appreciation_rate, investment_years, inflation_rate, adjust_for_inflation, 
-    closing_costs=0.0, renovation_costs=0.0, start_year=purchase_year
-):
-    loan_amount = property_value * (1 - down_payment_pct / 100)
-    annual_debt_service = 0 if down_payment_pct == 100 else npf.pmt(
-        mortgage_rate / 100 / 12, mortgage_years * 12, -loan_amount
-    ) * 12
-
-    amort_schedule = amortization_schedule(
-        loan_amount, mortgage_rate, mortgage_years, investment_years, start_year
-    )
-
-    equity_records = project_property_equity(
-        property_value, appreciation_rate,
-        amort_schedule, inflation_rate,
-        adjust_for_inflation, start_year
-    )
-
-    cashflow_records = project_cashflow(
-        annual_rent, annual_expenses,
-        rental_growth_rate, annual_debt_service,
-        investment_years, inflation_rate, adjust_for_inflation
-    )
-
-    fire_contribution = equity_records[-1]["equity"] + sum(cashflow_records) - (closing_costs + renovation_costs)
-    return fire_contribution, equity_records, cashflow_records
-
-def simulate_equity(
-    initial_investment, years, equity_return, dividend_yield, reinvest_dividends, inflation_rate=0.0, adjust_for_inflation=False
-):
-    portfolio_value = initial_investment
-    dividends_total = 0
-    growth_history = []
-
-    for year in range(1, years + 1):
-        dividends = portfolio_value * (dividend_yield / 100)
-        if reinvest_dividends:
-            portfolio_value += dividends
-        else:
-            dividends_total += dividends
+# Add run trigger; results stay up afterwards so the today's-dollars toggle just re-reads the cached paths
+if st.button("👉 >> Run Investment Analyzer >>"):
+    st.session_state["run_investment_analyzer"] = True
 
-        portfolio_value *= (1 + equity_return / 100)
+if st.session_state.get("run_investment_analyzer"):
+    # pandas and plotly load only once the comparison runs
+    import pandas as pd
+    import plotly.graph_objects as go
 
-        # Adjust this year’s values if inflation toggle is on
-        if adjust_for_inflation:
-            inflation_factor = (1 + inflation_rate / 100) ** year
-            adjusted_value = portfolio_value / inflation_factor
-            adjusted_dividends = dividends / inflation_factor
-        else:
-            adjusted_value = portfolio_value
-            adjusted_dividends = dividends
-
-        growth_history.append({
-            "year": year,
-            "portfolio_value": adjusted_value,
-            "dividends": adjusted_dividends
-        })
-
-    # FIRE contribution (still based on adjusted final year value)
-    fire_contribution = portfolio_value / ((1 + inflation_rate / 100) ** years) if adjust_for_inflation else portfolio_value
-    fire_contribution += 0 if reinvest_dividends else dividends_total / ((1 + inflation_rate / 100) ** years)
-
-    return fire_contribution, growth_history
-
-
-# --- Real Estate Planner functions ---
-
-def amortization_schedule(loan_amount, annual_interest_rate, loan_term_years, years_held, start_year):
-    monthly_rate = annual_interest_rate / 12 / 100
-    num_payments = loan_term_years * 12
-    monthly_payment = npf.pmt(monthly_rate, num_payments, -loan_amount)
-    schedule = []
-    balance = loan_amount
-
-    for i in range(years_held):
-        year = start_year + i
-        interest_paid = 0
-        principal_paid = 0
-        for _ in range(12):
-            interest = balance * monthly_rate
-            principal = monthly_payment - interest
-            balance -= principal
-            interest_paid += interest
-            principal_paid += principal
-        schedule.append({
-            "Year": year,
-            "Beginning Balance": schedule[-1]["Ending Balance"] if schedule else loan_amount,
-            "Principal Paid": principal_paid,
-            "Interest Paid": interest_paid,
-            "Ending Balance": balance
-        })
-
-    return schedule
-
-def project_property_equity(purchase_price, appreciation_rate, amort_schedule, inflation_rate, adjust_for_inflation, start_year):
-    equity_records = []
-    for i, row in enumerate(amort_schedule):
-        year = start_year + i  # 🔄 Use explicit year tracking
-        value = purchase_price * ((1 + appreciation_rate / 100) ** i)
-        equity = value - row["Ending Balance"]
-
-        if adjust_for_inflation:
-            inflation_factor = (1 + inflation_rate / 100) ** i
-            value /= inflation_factor
-            equity /= inflation_factor
-
-        equity_records.append({
-            "year": year,
-            "property_value": value,
-            "loan_balance": row["Ending Balance"],
-            "equity": equity
-        })
-    return equity_records
-
-def project_cashflow(annual_rent, annual_expenses, rental_growth_rate, annual_debt_service, years_held, inflation_rate, adjust_for_inflation):
-    cashflow_records = []
-    for i in range(years_held):
-        rent = annual_rent * ((1 + rental_growth_rate / 100) ** i)
-        expenses = annual_expenses * ((1 + inflation_rate / 100) ** i)
-        net_income = rent - expenses
-        cashflow = net_income - annual_debt_service
-        if adjust_for_inflation:
-            inflation_factor = (1 + inflation_rate / 100) ** i
-            cashflow /= inflation_factor
-        cashflow_records.append(cashflow)
-    return cashflow_records
-
-# Add run trigger
-if st.button("👉 >> Run Investment Analyzer >>"):
-    
     st.markdown("---")
 
     # --- Run Simulations ---
@@ -433,7 +309,9 @@ if st.button("👉 >> Run Investment Analyzer >>"):
         #2.5,  # inflation_rate (you can expose this too)
         adjust_for_inflation,
         closing_costs,
-        renovation_costs
+        renovation_costs,
+        start_year=purchase_year,
+        periods_per_year=periods_per_year
     )
     equity_df = pd.DataFrame(re_history)  # re_history = equity_records
 
@@ -445,45 +323,17 @@ if st.button("👉 >> Run Investment Analyzer >>"):
         dividend_yield,
         reinvest_dividends,
         inflation_rate,
-        adjust_for_inflation
+        adjust_for_inflation,
+        periods_per_year
     )
 
     real_estate_upfront = closing_costs + renovation_costs
-    fire_yearly = []
-    re_cash_cumulative = 0
-
-    num_years = min(investment_years, len(re_history), len(re_cashflow), len(eq_history))
-    for i in range(num_years):
-        year = re_history[i]["year"]
-
-        # Real Estate
-        re_equity = re_history[i]["equity"]
-        re_cash = re_cashflow[i]
-        re_cash_cumulative += re_cash
-
-        if i == 0:
-            re_annual = re_equity + re_cash - real_estate_upfront
-        else:
-            re_annual = (re_equity - re_history[i-1]["equity"]) + re_cash
+    fire_columns = compare_fire_columns(re_history, re_cashflow, eq_history, real_estate_upfront, investment_years)
+    st.session_state["investment_comparison"] = fire_columns
 
-        re_cumulative = re_equity + re_cash_cumulative - real_estate_upfront
-
-        # Index Fund
-        eq_current = eq_history[i]["portfolio_value"]
-        eq_previous = eq_history[i-1]["portfolio_value"] if i > 0 else 0
-        eq_annual = eq_current - eq_previous
-        eq_cumulative = eq_current
-
-        fire_yearly.append({
-            "Year": year,
-            "Real Estate (Annual)": re_annual,
-            "Real Estate (Cumulative)": re_cumulative,
-            "Index Fund (Annual)": eq_annual,
-            "Index Fund (Cumulative)": eq_cumulative
-        })
-
-
-    fire_df = pd.DataFrame(fire_yearly)
+    fire_df = pd.DataFrame(fire_columns)
+    re_cumulative = fire_columns["Real Estate (Cumulative)"]
+    eq_cumulative = fire_columns["Index Fund (Cumulative)"]
 
     # # Display Results side by side
 
@@ -579,21 +429,15 @@ if st.button("👉 >> Run Investment Analyzer >>"):
         margin=dict(t=60, b=100)
     )
 
-    # Initialize breakeven year
-    breakeven_year = None
-
-    for i in range(len(fire_df)):
-        re_value = fire_df["Real Estate (Cumulative)"].iloc[i]
-        eq_value = fire_df["Index Fund (Cumulative)"].iloc[i]
-        if re_value > eq_value:
-            breakeven_year = fire_df["Year"].iloc[i]
-            break
+    # Where real estate first pulls ahead, interpolated between year-ends
+    breakeven_point = find_breakeven(fire_columns["Year"], re_cumulative, eq_cumulative)
+    breakeven_year = round(breakeven_point["year"], 1) if breakeven_point else None
 
-    if breakeven_year:
+    if breakeven_point:
         comparison_fig.add_annotation(
-            x=breakeven_year,
-            y=fire_df.loc[fire_df["Year"] == breakeven_year, "Real Estate (Cumulative)"].values[0],
-            text=f"🏁 Breakeven in {breakeven_year}",
+            x=breakeven_point["year"],
+            y=breakeven_point["value"],
+            text=f"🏁 Breakeven ≈ {breakeven_year:g}",
             showarrow=True,
             arrowhead=2,
             ax=30,
@@ -616,9 +460,9 @@ if st.button("👉 >> Run Investment Analyzer >>"):
             bordercolor="darkgreen"
         )
 
-    final_year = fire_df["Year"].iloc[-1]
-    final_re = fire_df["Real Estate (Cumulative)"].iloc[-1]
-    final_eq = fire_df["Index Fund (Cumulative)"].iloc[-1]
+    final_year = fire_columns["Year"][-1]
+    final_re = re_cumulative[-1]
+    final_eq = eq_cumulative[-1]
 
     winner_text = (
         "🏆 Real Estate wins long-term" if final_re > final_eq
@@ -642,12 +486,12 @@ if st.button("👉 >> Run Investment Analyzer >>"):
     # Pre-format values
     re_total = f"${final_re:,.0f}"
     eq_total = f"${final_eq:,.0f}"
-    breakeven = str(breakeven_year)
+    breakeven = f"{breakeven_year:g}" if breakeven_point else "None"
 
     # Generate summary paragraph with HTML tags
-    if breakeven_year:
+    if breakeven_point:
         summary = (
-            f"<p>Over the modeled period, the real estate strategy begins to outperform index investing starting in <strong>{breakeven}</strong>, "
+            f"<p>Over the modeled period, the real estate strategy begins to outperform index investing around <strong>{breakeven}</strong>, "
             f"ultimately contributing <strong>{re_total}</strong> toward your financial independence journey. "
             f"This includes both rental income and equity growth, net of upfront costs. "
             f"The index fund strategy, while steadier, finishes with a total contribution of <strong>{eq_total}</strong>, "
@@ -668,59 +512,33 @@ if st.button("👉 >> Run Investment Analyzer >>"):
 
     with st.expander("📊 Year-by-Year FIRE Contribution Comparison", expanded=False):
 
-        # YoY Table
-
-        # Reset index and drop the "Year" column (assuming it's the index)
-        fire_df_display = fire_df.reset_index(drop=True)
-
-        # Or if "Year" becomes a column after reset and you want to drop it:
-        # fire_df_display = fire_df.reset_index().drop(columns=["Year"])
-
-        # Highlight function stays the same
-        def highlight_winner(row):
-            re_value = row["Real Estate (Cumulative)"]
-            eq_value = row["Index Fund (Cumulative)"]
-            styles = [""] * len(row)
-            if eq_value > re_value:
-                styles[row.index.get_loc("Index Fund (Cumulative)")] = "background-color: lightgreen"
-            elif re_value > eq_value:
-                styles[row.index.get_loc("Real Estate (Cumulative)")] = "background-color: lightyellow"
-            return styles
-
-        # Apply formatting and highlighting to modified DataFrame
-        styled_df = fire_df_display.style \
-            .format({
-                "Real Estate (Annual)": "${:,.0f}",
-                "Real Estate (Cumulative)": "${:,.0f}",
-                "Index Fund (Annual)": "${:,.0f}",
-                "Index Fund (Cumulative)": "${:,.0f}"
-            }) \
-            .apply(highlight_winner, axis=1)
-
-        # Display without the index column
+        # YoY Table: the leader is one vectorized column instead of per-row styling
+        import numpy as np
+
+        real_estate_ahead = re_cumulative > eq_cumulative
+        index_fund_ahead = eq_cumulative > re_cumulative
+        fire_df["Leader"] = np.where(real_estate_ahead, "🟨 Real Estate", np.where(index_fund_ahead, "🟩 Index Fund", "⚖️ Even"))
+
+        money = st.column_config.NumberColumn(format="$%,.0f")
         st.subheader("📊 Year-by-Year FIRE Contributions")
         st.caption("💡 Year 0 reflects the upfront investment costs for the real estate strategy, resulting in a lower starting point.")
-        st.dataframe(styled_df, hide_index=True)
+        st.dataframe(
+            fire_df,
+            hide_index=True,
+            column_config={
+                "Year": st.column_config.NumberColumn(format="%d"),
+                "Real Estate (Annual)": money,
+                "Real Estate (Cumulative)": money,
+                "Index Fund (Annual)": money,
+                "Index Fund (Cumulative)": money,
+            }
+        )
 
 
         # --- 🔍 Strategic Insight Summary ---
 
-        # Analyze which strategy leads each year
-        real_estate_wins = []
-        index_fund_wins = []
-
-        for row in fire_yearly:
-            year = row["Year"]
-            re_cum = row["Real Estate (Cumulative)"]
-            eq_cum = row["Index Fund (Cumulative)"]
-
-            if re_cum > eq_cum:
-                real_estate_wins.append(year)
-            elif eq_cum > re_cum:
-                index_fund_wins.append(year)
-
         # Final winner
-        if fire_yearly[-1]["Real Estate (Cumulative)"] > fire_yearly[-1]["Index Fund (Cumulative)"]:
+        if final_re > final_eq:
             final_winner = "🏘️ Real estate"
         else:
             final_winner = "📈 Index fund"
@@ -735,12 +553,12 @@ if st.button("👉 >> Run Investment Analyzer >>"):
         - Your **index fund investment** is projected to grow to **${eq_contribution:,.0f}** through compound returns and dividends.
 
         In the year-by-year comparison table:
-        - 🟨 **Real estate outpaces index fund** in {len(real_estate_wins)} of {investment_years} years.
-        - 🟩 **Index fund leads** in {len(index_fund_wins)} years.
+        - 🟨 **Real estate outpaces index fund** in {int(real_estate_ahead.sum())} of {investment_years} years.
+        - 🟩 **Index fund leads** in {int(index_fund_ahead.sum())} years.
 
         Final outcome: **{final_winner}** is the stronger FIRE contributor over the full investment horizon.
 
-        The table highlights:
+        The Leader column marks:
         - 🟨 Years where real estate is ahead
         - 🟩 Years where index fund is ahead
         """)
@@ -776,4 +594,179 @@ if st.button("👉 >> Run Investment Analyzer >>"):
         # - Your **index fund investment** is projected to grow to **${eq_contribution:,.0f}** through compound returns and dividends.
 
         # {"The break-even point occurs in Year " + str(break_even_year) + ", when the index fund overtakes the property in total contribution." if break_even_year else "Real estate remains dominant over the full investment horizon."}
-        # """)
\ No newline at end of file
+        # """)
+
+# --- 🧪 Sensitivity Sweep ---
+
+st.markdown("---")
+
+with st.expander("🧪 Sensitivity Sweep: Which Strategy Wins Across Assumptions?", expanded=False):
+    st.caption("Re-runs the comparison above across a whole grid of appreciation rates, mortgage rates, equity returns and holding periods. Your other inputs (price, rent, expenses, dividends, inflation) stay fixed.")
+
+    sweep_appreciation = st.slider(
+        "🏠 Appreciation Range (%)",
+        min_value=0.0,
+        max_value=10.0,
+        value=st.session_state.get("sweep_appreciation", (0.0, 6.0)),
+        step=0.25,
+        help="Property appreciation rates to test, in 0.25% steps."
+    )
+    st.session_state["sweep_appreciation"] = sweep_appreciation
+
+    sweep_mortgage = st.slider(
+        "🏦 Mortgage Rate Range (%)",
+        min_value=0.0,
+        max_value=12.0,
+        value=st.session_state.get("sweep_mortgage", (3.0, 8.0)),
+        step=0.25,
+        disabled=down_payment_pct == 100,
+        help="Mortgage interest rates to test, in 0.25% steps. Not used for an all-cash purchase."
+    )
+    st.session_state["sweep_mortgage"] = sweep_mortgage
+
+    sweep_equity = st.slider(
+        "📈 Equity Return Range (%)",
+        min_value=0.0,
+        max_value=15.0,
+        value=st.session_state.get("sweep_equity", (4.0, 10.0)),
+        step=0.25,
+        help="Annual index fund returns to test, in 0.25% steps."
+    )
+    st.session_state["sweep_equity"] = sweep_equity
+
+    sweep_years = st.slider(
+        "📅 Holding Period Range (Years)",
+        min_value=1,
+        max_value=50,
+        value=st.session_state.get("sweep_years", (5, 30)),
+        help="Every holding period in this range is tested."
+    )
+    st.session_state["sweep_years"] = sweep_years
+
+    from shared_components import current_job, job_progress, submit_job
+
+    def submit_sweep():
+        import numpy as np
+        from money_matters.engine.investment_sweep import sweep_investments
+
+        def sweep_range(bounds, step=0.25):
+            return np.arange(bounds[0], bounds[1] + step / 2, step)
+
+        return submit_job(
+            "investment_sweep", sweep_investments,
+            property_value, down_payment_pct,
+            mortgage_years if down_payment_pct != 100 else 1,
+            annual_rent, annual_expenses, rental_growth_rate,
+            inflation_rate, adjust_for_inflation,
+            index_investment, dividend_yield, reinvest_dividends,
+            appreciation_rates=sweep_range(sweep_appreciation),
+            mortgage_rates=sweep_range(sweep_mortgage) if down_payment_pct != 100 else np.array([0.0]),
+            equity_returns=sweep_range(sweep_equity),
+            holding_periods=np.arange(sweep_years[0], sweep_years[1] + 1),
+            closing_costs=closing_costs,
+            renovation_costs=renovation_costs,
+            periods_per_year=periods_per_year
+        )
+
+    # The sweep runs in the background. While it is in flight it follows the inputs above:
+    # changing one cancels the run and starts a fresh one with the new values.
+    sweep_job = current_job("investment_sweep")
+    if st.button("👉 >> Run Sensitivity Sweep >>") or (sweep_job is not None and not sweep_job.done):
+        sweep_job = submit_sweep()
+
+    if sweep_job is not None:
+        if not sweep_job.done:
+            job_progress("investment_sweep", "🧪 Sweeping every scenario...")
+        elif sweep_job.state == "failed":
+            st.error(f"⚠️ The sweep failed: {sweep_job.error()}")
+        elif sweep_job.state == "done":
+            st.session_state["sweep_results"] = sweep_job.result()
+
+    sweep = st.session_state.get("sweep_results")
+    if sweep is not None:
+        import numpy as np
+        import plotly.graph_objects as go
+
+        margin = sweep["margin"]
+        real_estate_share = (margin > 0).mean()
+        st.markdown(f"#### 🏁 Real estate wins in **{real_estate_share:.0%}** of {margin.size:,} scenarios")
+        st.caption("Change your inputs? Run the sweep again to refresh these results.")
+
+        holding_periods = sweep["holding_period"].tolist()
+        view_years = st.select_slider(
+            "📅 Holding Period to Display",
+            options=holding_periods,
+            value=min(max(investment_years, holding_periods[0]), holding_periods[-1])
+        )
+        h = holding_periods.index(view_years)
+
+        mortgage_rates = sweep["mortgage_rate"].tolist()
+        if len(mortgage_rates) > 1:
+            view_mortgage = st.select_slider(
+                "🏦 Mortgage Rate to Display (%)",
+                options=mortgage_rates,
+                value=min(mortgage_rates, key=lambda rate: abs(rate - st.session_state.get("interest_rate", 6.0)))
+            )
+            m = mortgage_rates.index(view_mortgage)
+        else:
+            m = 0
+
+        # Winner and margin: positive favors real estate, negative favors the index fund
+        heatmap_fig = go.Figure(go.Heatmap(
+            x=sweep["equity_return"],
+            y=sweep["appreciation_rate"],
+            z=margin[:, m, :, h],
+            zmid=0,
+            colorscale=[[0, "green"], [0.5, "white"], [1, "goldenrod"]],
+            colorbar=dict(title="RE − Index ($)"),
+            hovertemplate="Equity return %{x:.2f}%<br>Appreciation %{y:.2f}%<br>Real estate ahead by $%{z:,.0f}<extra></extra>"
+        ))
+        heatmap_fig.update_layout(
+            template="plotly_white",
+            title=f"🗺️ Real Estate − Index Fund After {view_years} Years",
+            xaxis_title="Equity Return (%)",
+            yaxis_title="Property Appreciation (%)"
+        )
+        st.plotly_chart(heatmap_fig, use_container_width=True)
+        st.caption("🟨 Real estate ahead · 🟩 Index fund ahead. Darker cells mean a wider margin.")
+
+        # Breakeven surface: the equity return that would make both strategies tie
+        breakeven = sweep["breakeven_equity_return"][:, :, h]
+        if np.isfinite(breakeven).any():
+            if len(mortgage_rates) > 1:
+                breakeven_fig = go.Figure(go.Surface(
+                    x=sweep["mortgage_rate"],
+                    y=sweep["appreciation_rate"],
+                    z=breakeven,
+                    colorscale="YlGn",
+                    colorbar=dict(title="Breakeven (%)"),
+                    hovertemplate="Mortgage %{x:.2f}%<br>Appreciation %{y:.2f}%<br>Tie at %{z:.2f}% equity return<extra></extra>"
+                ))
+                breakeven_fig.update_layout(
+                    template="plotly_white",
+                    title=f"⚖️ Breakeven Equity Return After {view_years} Years",
+                    scene=dict(
+                        xaxis_title="Mortgage Rate (%)",
+                        yaxis_title="Appreciation (%)",
+                        zaxis_title="Equity Return (%)"
+                    ),
+                    margin=dict(l=0, r=0, t=60, b=0)
+                )
+            else:
+                breakeven_fig = go.Figure(go.Scatter(
+                    x=sweep["appreciation_rate"],
+                    y=breakeven[:, 0],
+                    mode="lines",
+                    line=dict(color="goldenrod"),
+                    hovertemplate="Appreciation %{x:.2f}%<br>Tie at %{y:.2f}% equity return<extra></extra>"
+                ))
+                breakeven_fig.update_layout(
+                    template="plotly_white",
+                    title=f"⚖️ Breakeven Equity Return After {view_years} Years",
+                    xaxis_title="Property Appreciation (%)",
+                    yaxis_title="Equity Return (%)"
+                )
+            st.plotly_chart(breakeven_fig, use_container_width=True)
+            st.caption("📘 Index fund returns above this level beat the property; below it, real estate comes out ahead. Gaps mean one strategy wins across the whole swept range.")
+        else:
+            st.info("⚖️ One strategy wins across the entire equity return range for this holding period, so there is no breakeven to plot.")
@@ -0,0 +1,254 @@
+# plan_export.py
+# "Download full plan": every module's latest results as one Excel workbook, a zip of CSVs
+# or a zip of Parquet files. Sheets are columnar tables written row by row (Excel, CSV) or
+# one sheet at a time (Parquet), so memory stays bounded however long the tables get.
+
+import csv
+import datetime
+import importlib.util
+import io
+import math
+import zipfile
+
+from money_matters.engine.cache import SimulationCache, scenario_key
+
+# Session keys the pages store their results under
+PLAN_STATE_KEYS = (
+    "expense_template",
+    "lifetime_projection",
+    "mc_results",
+    "real_estate_results",
+    "investment_comparison",
+)
+
+PLAN_EXPORT_FORMATS = {
+    "Excel": {"file_name": "money_matters_plan.xlsx",
+              "mime": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"},
+    "CSV (zip)": {"file_name": "money_matters_plan_csv.zip", "mime": "application/zip"},
+    "Parquet (zip)": {"file_name": "money_matters_plan_parquet.zip", "mime": "application/zip"},
+}
+
+# Finished files keyed by format and sheet content, so repeated downloads reuse the bytes
+PLAN_EXPORT_CACHE = SimulationCache(maxsize=8)
+
+
+def parquet_available():
+    """Parquet needs pyarrow, which isn't a hard requirement of the app."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _column(values):
+    # NumPy arrays become plain lists so every writer sees Python scalars
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _finite(value):
+    return value if value is None or math.isfinite(value) else None
+
+
+# --- Sheets ---
+
+def _budget_sheet(template):
+    from utils_export import EXPENSE_GROUPS
+
+    groups, categories, amounts = [], [], []
+    for group, members in EXPENSE_GROUPS.items():
+        for category in members:
+            if category in template:
+                groups.append(group)
+                categories.append(category)
+                amounts.append(template[category])
+    return ["Group", "Category", "Monthly Expense ($)"], [groups, categories, amounts]
+
+
+def _net_worth_sheet(lifetime, start_year):
+    ages = _column(lifetime["ages"])
+    n_years = len(ages)
+    fire_index = lifetime["fire_index"]
+
+    def _padded(key):
+        # Flows are yearly (one fewer entry than the year-end balances)
+        values = _column(lifetime[key])
+        return values + [None] * (n_years - len(values))
+
+    return (
+        ["Year", "Age", "Phase", "Net Worth ($)", "Spending ($)", "Retirement Income ($)", "Portfolio Withdrawals ($)"],
+        [
+            [start_year + i for i in range(n_years)],
+            ages,
+            ["Accumulation" if i < fire_index else "Retirement" for i in range(n_years)],
+            _column(lifetime["net_worth"]),
+            _padded("spending"),
+            _padded("retirement_income"),
+            _padded("withdrawals"),
+        ],
+    )
+
+
+def _monte_carlo_sheets(mc_results, start_year):
+    percentiles = list(mc_results["percentiles"])
+    bands = [_column(band) for band in mc_results["net_worth_percentiles"]]
+    paths = (
+        ["Year"] + [f"P{p} Net Worth ($)" for p in percentiles],
+        [[start_year + i for i in range(len(bands[0]))]] + bands,
+    )
+
+    metrics = ["Chance of FIRE by target year", f"Chance of FIRE within {len(bands[0]) - 1} years"]
+    values = [float(mc_results["success_probability"]), float(mc_results["probability_by_year"][-1])]
+    for p in percentiles:
+        metrics.append(f"P{p} years to FIRE")
+        values.append(_finite(float(mc_results["years_percentiles"][p])))
+    return paths, (["Metric", "Value"], [metrics, values])
+
+
+def _real_estate_sheets(results):
+    from money_matters.engine.amortization import SCHEDULE_COLUMNS
+
+    schedule = results["amortization"]
+    amortization = (SCHEDULE_COLUMNS, [_column(schedule[column]) for column in SCHEDULE_COLUMNS])
+
+    equity = results["equity"]
+    cashflow = _column(results["cashflow"])
+    equity_table = (
+        ["Year", "Property Value ($)", "Loan Balance ($)", "Equity ($)", "Net Cash Flow ($)"],
+        [
+            [row["year"] for row in equity],
+            [row["property_value"] for row in equity],
+            [row["loan_balance"] for row in equity],
+            [row["equity"] for row in equity],
+            cashflow + [None] * (len(equity) - len(cashflow)),
+        ],
+    )
+    return amortization, equity_table
+
+
+def _columns_sheet(table):
+    return list(table), [_column(values) for values in table.values()]
+
+
+def plan_sheets(state, start_year=None):
+    """
+    Ordered {sheet name: (column names, column values)} for every module with results in
+    `state`. Modules that haven't been run are left out.
+    """
+    start_year = datetime.datetime.now().year if start_year is None else start_year
+    sheets = {}
+
+    if state.get("expense_template"):
+        sheets["Budget"] = _budget_sheet(state["expense_template"])
+    if state.get("lifetime_projection"):
+        sheets["Net Worth Path"] = _net_worth_sheet(state["lifetime_projection"], start_year)
+    if state.get("mc_results"):
+        sheets["Monte Carlo Paths"], sheets["Monte Carlo Summary"] = _monte_carlo_sheets(state["mc_results"], start_year)
+    if state.get("real_estate_results"):
+        sheets["Amortization"], sheets["Property Equity"] = _real_estate_sheets(state["real_estate_results"])
+    if state.get("investment_comparison"):
+        sheets["Investment Comparison"] = _columns_sheet(state["investment_comparison"])
+    return sheets
+
+
+# --- Writers ---
+
+def write_plan_xlsx(sheets, buffer):
+    """One worksheet per sheet, streamed with openpyxl's write-only mode."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    for name, (header, columns) in sheets.items():
+        ws = wb.create_sheet(title=name[:31])
+        for i in range(1, len(header) + 1):
+            ws.column_dimensions[get_column_letter(i)].width = 22
+        ws.freeze_panes = "A2"
+
+        cells = []
+        for label in header:
+            cell = WriteOnlyCell(ws, value=label)
+            cell.font = Font(bold=True)
+            cell.fill = PatternFill(start_color="DDDDDD", fill_type="solid")
+            cells.append(cell)
+        ws.append(cells)
+
+        for row in zip(*columns):
+            ws.append(row)
+    wb.save(buffer)
+
+
+def write_plan_csv_zip(sheets, buffer):
+    """One CSV per sheet inside a zip, written row by row."""
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, (header, columns) in sheets.items():
+            with archive.open(f"{name}.csv", "w") as member, \
+                    io.TextIOWrapper(member, encoding="utf-8", newline="") as text:
+                writer = csv.writer(text)
+                writer.writerow(header)
+                writer.writerows(zip(*columns))
+
+
+def write_plan_parquet_zip(sheets, buffer):
+    """One Parquet file per sheet inside a zip (requires pyarrow)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, (header, columns) in sheets.items():
+            table = pa.table(dict(zip(header, columns)))
+            with archive.open(f"{name}.parquet", "w") as member:
+                pq.write_table(table, member)
+
+
+PLAN_WRITERS = {
+    "Excel": write_plan_xlsx,
+    "CSV (zip)": write_plan_csv_zip,
+    "Parquet (zip)": write_plan_parquet_zip,
+}
+
+
+def build_plan_export(state, export_format="Excel", start_year=None):
+    """Bytes of the full plan in `export_format`, cached by sheet content."""
+    sheets = plan_sheets(state, start_year)
+    key = scenario_key("plan_export", {"format": export_format, "sheets": sheets})
+    try:
+        return PLAN_EXPORT_CACHE.get(export_format, key)
+    except KeyError:
+        pass
+    buffer = io.BytesIO()
+    PLAN_WRITERS[export_format](sheets, buffer)
+    data = buffer.getvalue()
+    PLAN_EXPORT_CACHE.put(export_format, key, data)
+    return data
+
+
+def render_plan_export():
+    """Sidebar download for the full plan. Files are built only when the button is clicked."""
+    import streamlit as st
+
+    # Plain references taken now; the download callable runs outside the script thread
+    state = {key: st.session_state.get(key) for key in PLAN_STATE_KEYS}
+
+    formats = [name for name in PLAN_EXPORT_FORMATS if name != "Parquet (zip)" or parquet_available()]
+    with st.sidebar.expander("📦 Download Full Plan", expanded=False):
+        included = [label for key, label in [
+            ("expense_template", "budget"),
+            ("lifetime_projection", "net worth path"),
+            ("mc_results", "Monte Carlo percentiles"),
+            ("real_estate_results", "amortization & equity"),
+            ("investment_comparison", "investment comparison"),
+        ] if state.get(key)]
+        # Same checks as plan_sheets, without building the sheets on every rerun
+        if included:
+            st.caption("Includes: " + ", ".join(included) + ". Run a module to add its tables.")
+        else:
+            st.caption("Run a module to add its tables.")
+
+        export_format = st.radio("File format", formats, horizontal=True, key="plan_export_format")
+        st.download_button(
+            label="📥 Download Plan",
+            data=lambda: build_plan_export(state, export_format),
+            file_name=PLAN_EXPORT_FORMATS[export_format]["file_name"],
+            mime=PLAN_EXPORT_FORMATS[export_format]["mime"],
+            on_click="ignore",
+            disabled=not included
+        )
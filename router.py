@@ -1,6 +1,8 @@
 import streamlit as st
 from navigation import studio_nav
 from session_defaults import init_session_state  # ✅ Use centralized initializer
+from plan_export import render_plan_export
+from derived_values import begin_derived_run, render_derived_stats
 
 # --- Initialize Session State Once ---
 init_session_state()
@@ -28,4 +30,12 @@ st.set_page_config(page_title="Money Matters Studio", page_icon="💰")
 
 # --- Navigation ---
 selected_page = studio_nav()
+begin_derived_run()
 selected_page.run()
+
+# --- Full Plan Export (after the page, so it sees this run's results) ---
+render_plan_export()
+
+# --- Derived Value Recompute Stats ---
+render_derived_stats()
+
@@ -19,6 +19,34 @@ DEFAULTS = {
     "withdrawal_option": "Moderate (3.5%)",
     "inflation_option": "Average (2.5%)",
     "adjust_fire_expenses_for_inflation": True,
+    "time_step": "Annual",
+
+    # --- Monte Carlo Defaults ---
+    "mc_enabled": False,
+    "mc_method": "Lognormal",
+    "mc_volatility": 15.0,
+    "mc_inflation_volatility": 1.0,
+    "mc_stock_allocation": 100,
+    "mc_paths": 10000,
+    "mc_years": 60,
+    "mc_seed": 42,
+
+    # --- Lifetime Defaults ---
+    "plan_end_age": 95,
+    "social_security_income": 0,
+    "social_security_age": 67,
+    "pension_income": 0,
+    "pension_age": 65,
+
+    # --- Tax & Drawdown Defaults ---
+    "tax_aware_access": False,
+    "filing_status": "married_joint",
+    "drawdown_ordering": "conventional",
+    "drawdown_fill_bracket": 0.12,
+    "drawdown_taxable_basis_pct": 60,
+    "drawdown_roth": 0,
+    "drawdown_roth_basis": 0,
+    "drawdown_mc": False,
 
     # --- Real Estate Planner Defaults ---
     "purchase_year": this_year,
@@ -28,6 +56,7 @@ DEFAULTS = {
     "interest_rate": 3.0,
     "rental_growth_rate": 1.5,
     "run_model": False,
+    "run_investment_analyzer": False,
     "appreciation_rate": 3.0,
     "mortgage_years": 30,
     "annual_rent": 24000,
@@ -298,3 +298,60 @@ def equity_return_picker(default="Balanced (7.0%)", allow_custom=True):
 
     return annual_return, return_option
 
+
+# Simulation Time Step
+
+def time_step_picker(label="🗓️ Simulation Time Step"):
+    from money_matters.engine.periods import TIME_STEPS
+
+    options = list(TIME_STEPS.keys())
+    current_option = st.session_state.get("time_step", "Annual")
+
+    time_step = st.selectbox(
+        label,
+        options=options,
+        index=options.index(current_option),
+        key=f"{label}_dropdown",
+        help="Monthly applies savings, rent, mortgage payments, dividends and returns every month instead of once a year. Annual rates keep the same meaning in both modes. This choice is shared across all modules."
+    )
+    st.session_state["time_step"] = time_step
+
+    return TIME_STEPS[time_step]
+
+
+# Background Jobs
+
+def job_owner():
+    """Id that keys this browser session's background jobs."""
+    if "job_owner" not in st.session_state:
+        import uuid
+        st.session_state["job_owner"] = uuid.uuid4().hex
+    return st.session_state["job_owner"]
+
+
+def submit_job(name, func, *args, **kwargs):
+    """Run `func` on the shared job runner. Same inputs reuse the job; new inputs supersede it."""
+    from money_matters.jobs import JOB_RUNNER
+
+    return JOB_RUNNER.submit(job_owner(), name, func, *args, **kwargs)
+
+
+def current_job(name):
+    from money_matters.jobs import JOB_RUNNER
+
+    return JOB_RUNNER.get(job_owner(), name)
+
+
+@st.fragment(run_every=0.5)
+def job_progress(name, label):
+    """
+    Live progress for a background job. Only this fragment reruns while the job works;
+    once it finishes the whole page reruns so the caller can show the result.
+    """
+    job = current_job(name)
+    if job is None or job.done:
+        st.rerun()
+
+    with st.status(label, expanded=True):
+        st.progress(job.progress, text=job.message)
+        st.caption(f"⏱️ {job.elapsed:.1f}s so far. The page stays usable; changing inputs restarts the run.")
@@ -1,8 +1,6 @@
 import streamlit as st
 
-def inject_tab_style():
-    st.markdown("""
-        <style>
+TAB_STYLE = """
         button[aria-selected="true"] {
             background-color: #ffe082 !important;
             color: #333 !important;
@@ -24,12 +22,9 @@ def inject_tab_style():
         button[aria-selected]:hover {
             background-color: #ffecb3 !important;
         }
-        </style>
-    """, unsafe_allow_html=True)
+"""
 
-def inject_button_style():
-    st.markdown("""
-        <style>
+BUTTON_STYLE = """
         div[data-testid="stButton"] button {
             padding: 2px 6px;
             font-size: 0.75rem;
@@ -41,5 +36,11 @@ def inject_button_style():
         div[data-testid="stButton"] button:hover {
             background-color: #e0e0e0;
         }
-        </style>
-    """, unsafe_allow_html=True)
+"""
+
+# Built once at import; pages send it as a single element instead of one per helper
+PAGE_STYLE = f"<style>{TAB_STYLE}{BUTTON_STYLE}</style>"
+
+def inject_page_style():
+    # Streamlit drops any element a rerun doesn't emit, so the CSS has to be re-sent every run
+    st.markdown(PAGE_STYLE, unsafe_allow_html=True)
@@ -0,0 +1,140 @@
+# Years-to-FI solvers checked against a plain year-by-year (or month-by-month) reference loop.
+
+import numpy as np
+import pytest
+
+from money_matters.engine.fire import estimate_years_to_fi, estimate_years_to_fi_batch
+
+
+def reference_years_to_fi(net_worth, annual_savings, annual_return, fire_number, merit_growth=0.0,
+                          max_years=100, periods_per_year=1):
+    # Save, then compound, one period at a time; savings step up by merit_growth each year
+    step = (1 + annual_return) ** (1 / periods_per_year)
+    history = [net_worth]
+    period = 0
+    while net_worth < fire_number and period < max_years * periods_per_year:
+        deposit = annual_savings / periods_per_year * (1 + merit_growth) ** (period // periods_per_year)
+        previous = net_worth
+        net_worth = (net_worth + deposit) * step
+        period += 1
+        if period % periods_per_year == 0 or net_worth >= fire_number:
+            history.append(net_worth)
+    return period / periods_per_year, net_worth, history, previous if period else net_worth
+
+
+PROFILES = [
+    # current_net_worth, annual_savings, annual_return, fire_number, merit_growth
+    (100_000, 30_000, 0.07, 2_000_000, 0.0),
+    (100_000, 30_000, 0.07, 2_000_000, 0.03),
+    (0, 12_000, 0.05, 1_500_000, 0.05),
+    (50_000, 20_000, 0.04, 1_000_000, 0.04),  # savings grow at the return rate
+    (250_000, 60_000, -0.01, 900_000, 0.02),
+]
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_batch_matches_reference_loop(profile):
+    expected_years, expected_net_worth, expected_history, _ = reference_years_to_fi(*profile)
+
+    years, net_worth, history = estimate_years_to_fi_batch(*profile)
+
+    assert years == expected_years
+    assert net_worth == pytest.approx(expected_net_worth, rel=1e-9)
+    finite = history[~np.isnan(history)]
+    assert finite == pytest.approx(expected_history, rel=1e-9)
+
+
+def test_merit_growth_shortens_years_to_fi():
+    years_flat, _, _ = estimate_years_to_fi_batch(100_000, 30_000, 0.07, 2_000_000, 0.0)
+    years_growing, _, _ = estimate_years_to_fi_batch(100_000, 30_000, 0.07, 2_000_000, 0.05)
+
+    assert years_growing < years_flat
+
+
+def test_batch_over_arrays_matches_profile_by_profile():
+    columns = [np.array(column, dtype=float) for column in zip(*PROFILES)]
+
+    years, net_worth, history = estimate_years_to_fi_batch(*columns)
+
+    assert history.shape == (len(PROFILES), 101)
+    for i, profile in enumerate(PROFILES):
+        expected_years, expected_net_worth, _, _ = reference_years_to_fi(*profile)
+        assert years[i] == expected_years
+        assert net_worth[i] == pytest.approx(expected_net_worth, rel=1e-9)
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_fractional_years_interpolate_within_crossing_year(profile):
+    expected_years, expected_net_worth, _, previous = reference_years_to_fi(*profile)
+    fire_number = profile[3]
+    expected = expected_years - 1 + (fire_number - previous) / (expected_net_worth - previous)
+
+    years, _, _ = estimate_years_to_fi_batch(*profile, return_history=False, fractional=True)
+
+    assert years == pytest.approx(expected, rel=1e-9)
+    assert expected_years - 1 < years <= expected_years
+
+
+def test_already_at_fi():
+    years, net_worth, history = estimate_years_to_fi_batch(2_500_000, 30_000, 0.07, 2_000_000, 0.02, fractional=True)
+
+    assert years == 0
+    assert net_worth == 2_500_000
+    assert history[0] == 2_500_000
+    assert np.isnan(history[1:]).all()
+
+
+def test_never_reaches_fi_stops_at_horizon():
+    profile = (10_000, 1_000, 0.0, 5_000_000, 0.0)
+    expected_years, expected_net_worth, expected_history, _ = reference_years_to_fi(*profile, max_years=40)
+
+    years, net_worth, history = estimate_years_to_fi_batch(*profile, max_years=40)
+
+    assert years == expected_years == 40
+    assert net_worth == pytest.approx(expected_net_worth)
+    assert history == pytest.approx(expected_history)
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+@pytest.mark.parametrize("periods_per_year", [1, 12])
+def test_estimate_years_to_fi_matches_reference_loop(profile, periods_per_year):
+    expected_years, expected_net_worth, expected_history, _ = reference_years_to_fi(
+        *profile, periods_per_year=periods_per_year
+    )
+
+    years, net_worth, history = estimate_years_to_fi.uncached(*profile, periods_per_year=periods_per_year)
+
+    assert years == pytest.approx(expected_years)
+    assert net_worth == pytest.approx(expected_net_worth, rel=1e-9)
+    assert history == pytest.approx(expected_history, rel=1e-9)
+
+
+def test_monthly_never_reaches_fi():
+    profile = (10_000, 1_000, 0.0, 5_000_000, 0.0)
+    expected_years, expected_net_worth, expected_history, _ = reference_years_to_fi(
+        *profile, max_years=30, periods_per_year=12
+    )
+
+    years, net_worth, history = estimate_years_to_fi.uncached(*profile, periods_per_year=12, max_years=30)
+
+    assert years == expected_years == 30
+    assert net_worth == pytest.approx(expected_net_worth)
+    assert history == pytest.approx(expected_history)
+
+
+def test_blocks_give_the_same_answer(monkeypatch):
+    from money_matters.engine import fire
+
+    columns = [np.array(column, dtype=float) for column in zip(*PROFILES)]
+    expected = estimate_years_to_fi_batch(*columns, fractional=True)
+
+    monkeypatch.setattr(fire, "SOLVER_BLOCK_PROFILES", 2)
+    years, net_worth, history = estimate_years_to_fi_batch(*columns, fractional=True)
+    years_only, net_worth_only, no_history = estimate_years_to_fi_batch(*columns, return_history=False, fractional=True)
+
+    np.testing.assert_array_equal(years, expected[0])
+    np.testing.assert_array_equal(net_worth, expected[1])
+    np.testing.assert_array_equal(history, expected[2])
+    np.testing.assert_array_equal(years_only, expected[0])
+    np.testing.assert_array_equal(net_worth_only, expected[1])
+    assert no_history is None
@@ -0,0 +1,30 @@
+# Monte Carlo summaries when some paths never reach FIRE.
+
+import math
+import warnings
+
+import numpy as np
+
+from money_matters.engine.monte_carlo import run_monte_carlo, summarize_paths
+
+
+def test_years_percentiles_are_inf_not_nan_when_paths_fail():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        results = run_monte_carlo(100_000, 30_000, 80_000, 0.035, seed=0)
+
+    assert 0.1 < results["success_probability"] < 0.9
+    years = results["years_percentiles"]
+    assert not any(math.isnan(value) for value in years.values())
+    assert math.isinf(years[90])
+    assert math.isfinite(years[10])
+    assert list(years.values()) == sorted(years.values())
+
+
+def test_years_percentiles_are_path_outcomes():
+    years_to_fi = np.array([5.0, 7.0, 9.0, np.inf, np.inf])
+    net_worth = np.zeros((5, 11))
+
+    years = summarize_paths(years_to_fi, net_worth, percentiles=(10, 50, 60, 90))["years_percentiles"]
+
+    assert years == {10: 5.0, 50: 9.0, 60: 9.0, 90: np.inf}
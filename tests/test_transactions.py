@@ -0,0 +1,143 @@
+# Bank CSV import and recurring-charge detection.
+
+import datetime
+
+import pytest
+
+from money_matters.transactions import find_recurring_charges, import_transactions
+
+
+def _csv(*lines):
+    return list(lines)
+
+
+def test_header_detection_with_alternate_names():
+    result = import_transactions(_csv(
+        "Posted Date,Payee,Transaction Amount",
+        "2024-01-05,SAFEWAY #123,-60.00",
+        "2024-02-05,SAFEWAY #123,-40.00",
+    ))
+
+    assert result["months"] == 2
+    assert result["monthly"]["Food"] == pytest.approx(50.0)
+    assert result["transactions"]["Food"] == 2
+
+
+def test_missing_columns_raise():
+    with pytest.raises(ValueError):
+        import_transactions(_csv("When,What", "2024-01-05,SAFEWAY"))
+
+
+def test_debit_and_credit_columns():
+    result = import_transactions(_csv(
+        "Date,Description,Debit,Credit",
+        "01/03/2024,AMAZON MKTPLACE,120.00,",
+        "01/10/2024,AMAZON MKTPLACE,,20.00",
+        "01/15/2024,NETFLIX.COM,15.99,",
+    ))
+
+    assert result["spending_sign"] == "negative"
+    assert result["monthly"]["Shopping"] == pytest.approx(100.0)
+    assert result["monthly"]["Subscriptions"] == pytest.approx(15.99)
+
+
+def test_sign_auto_detection_for_positive_spending():
+    result = import_transactions(_csv(
+        "Date,Description,Amount",
+        "2024-01-02,STARBUCKS,5.00",
+        "2024-01-03,STARBUCKS,5.00",
+        "2024-01-04,SHELL OIL,40.00",
+        "2024-01-20,SHELL OIL,-10.00",
+    ))
+
+    assert result["spending_sign"] == "positive"
+    assert result["monthly"]["Food"] == pytest.approx(10.0)
+    assert result["monthly"]["Transportation"] == pytest.approx(30.0)
+
+
+def test_refunds_net_against_their_category():
+    result = import_transactions(_csv(
+        "Date,Description,Amount",
+        "2024-03-01,TARGET STORE,-80.00",
+        "2024-03-02,TARGET STORE,-20.00",
+        "2024-03-09,TARGET STORE,30.00",
+        "2024-03-10,HILTON HOTEL,-200.00",
+    ), spending_sign="negative")
+
+    assert result["monthly"]["Shopping"] == pytest.approx(70.0)
+    assert result["monthly"]["Travel"] == pytest.approx(200.0)
+    # A refund larger than the spending never makes a category negative
+    refund_only = import_transactions(_csv("Date,Description,Amount", "2024-03-09,TARGET STORE,30.00"),
+                                      spending_sign="negative")
+    assert refund_only["monthly"]["Shopping"] == 0.0
+
+
+def test_unmatched_counts_every_row():
+    rows = [f"2024-01-{day:02d},ACME WIDGETS SVC,-10.00" for day in range(1, 13)]
+    rows.append("2024-01-20,ZORBLAX LTD,-5.00")
+
+    result = import_transactions(_csv("Date,Description,Amount", *rows))
+
+    assert result["unmatched"][0] == ("ACME WIDGETS SVC", 12)
+    assert result["unmatched"][1] == ("ZORBLAX LTD", 1)
+
+
+def _days(start, gaps):
+    day = datetime.date.fromisoformat(start).toordinal()
+    days = [day]
+    for gap in gaps:
+        day += gap
+        days.append(day)
+    return days
+
+
+def test_cadence_detection():
+    monthly = _days("2024-01-15", [31, 29, 31, 30, 31])
+    weekly = _days("2024-05-06", [7, 7, 8, 7, 6])
+    annual = _days("2022-06-01", [365, 366])
+    merchants = [0] * len(monthly) + [1] * len(weekly) + [2] * len(annual)
+    days = monthly + weekly + annual
+    amounts = [15.99] * len(monthly) + [12.0] * len(weekly) + [99.0] * len(annual)
+
+    found = find_recurring_charges(merchants, days, amounts, as_of=max(days))
+
+    assert {merchant: charge["cadence"] for merchant, charge in found.items()} == {
+        0: "monthly", 1: "weekly", 2: "annual"
+    }
+    assert found[0]["monthly"] == pytest.approx(15.99)
+    assert found[1]["monthly"] == pytest.approx(12.0 * 52 / 12)
+    assert all(charge["active"] for charge in found.values())
+
+
+def test_merchant_drifting_off_schedule_is_not_recurring():
+    # Billed monthly at first, then at wandering intervals
+    days = _days("2024-01-10", [30, 31, 47, 18, 62, 25])
+
+    found = find_recurring_charges([0] * len(days), days, [20.0] * len(days), as_of=max(days))
+
+    assert found == {}
+
+
+def test_small_drift_within_tolerance_stays_recurring():
+    days = _days("2024-01-10", [30, 33, 27, 31, 29])
+
+    found = find_recurring_charges([0] * len(days), days, [20.0] * len(days), as_of=max(days))
+
+    assert found[0]["cadence"] == "monthly"
+
+
+def test_stopped_series_is_inactive():
+    days = _days("2024-01-10", [30, 31, 30, 31])
+
+    found = find_recurring_charges([0] * len(days), days, [9.99] * len(days), as_of=max(days) + 90)
+
+    assert found[0]["cadence"] == "monthly"
+    assert not found[0]["active"]
+
+
+def test_varying_amounts_are_not_recurring():
+    days = _days("2024-01-10", [30, 31, 30, 31])
+
+    found = find_recurring_charges([0] * len(days), days, [10.0, 55.0, 3.0, 80.0, 20.0], as_of=max(days))
+
+    assert found == {}
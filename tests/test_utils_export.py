@@ -0,0 +1,25 @@
+# Cached budget workbooks must not carry a stale snapshot Timestamp.
+
+import io
+
+import openpyxl
+
+from utils_export import budget_workbook_bytes, get_budget_snapshot
+
+
+def _summary(data):
+    sheet = openpyxl.load_workbook(io.BytesIO(data))["Budget Summary"]
+    return dict(sheet.iter_rows(min_row=2, values_only=True))
+
+
+def test_cached_workbook_records_its_build_time():
+    state = {"annual_income": 100_000, "annual_savings": 20_000, "Housing_expense": 2_000}
+
+    first = budget_workbook_bytes(*get_budget_snapshot(state))
+    second = budget_workbook_bytes(*get_budget_snapshot(state))
+
+    assert first is second
+    summary = _summary(first)
+    assert "Timestamp" not in summary
+    assert summary["Workbook Built"]
+    assert summary["Annual Income ($)"] == 100_000
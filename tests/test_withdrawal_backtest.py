@@ -0,0 +1,27 @@
+# Historical withdrawal backtests: the sustainable rate needs a way for cohorts to fail.
+
+import pytest
+
+from money_matters.engine.withdrawal_backtest import backtest_withdrawals, rate_grid
+
+
+def test_constant_percent_without_floor_has_no_max_rate():
+    results = backtest_withdrawals(1_000_000, 0.04, rule="constant_percent", horizon=30)
+
+    assert results["survival_rate"] == 1.0
+    assert results["max_sustainable_rate"] is None
+
+
+def test_constant_percent_with_floor_can_fail():
+    results = backtest_withdrawals(1_000_000, 0.04, rule="constant_percent", horizon=30, spending_floor=0.75)
+
+    max_rate = results["max_sustainable_rate"]
+    assert max_rate is not None
+    assert max_rate < rate_grid().max()
+
+
+@pytest.mark.parametrize("rule", ["constant_dollar", "guardrails"])
+def test_other_rules_report_a_max_rate(rule):
+    results = backtest_withdrawals(1_000_000, 0.04, rule=rule, horizon=30)
+
+    assert 0 < results["max_sustainable_rate"] < rate_grid().max()
@@ -1,10 +1,11 @@
 # ui_helpers.py
 
 import streamlit as st
-from streamlit_javascript import st_javascript
 
 def show_sidebar_hint():
     """Show sidebar hint only on small (mobile) screen widths."""
+    from streamlit_javascript import st_javascript  # Deferred: only this helper needs the JS bridge
+
     screen_width = st_javascript("window.innerWidth")
 
     if screen_width and screen_width < 700:  # Tailwind's mobile breakpoint
@@ -15,3 +16,15 @@ def show_sidebar_hint():
             )
             if st.button("✅ Got it"):
                 st.session_state["show_sidebar_hint"] = False
+
+@st.cache_resource
+def logo_thumbnail(path="logo.png", size=200):
+    """The logo shrunk once per server process; the source file is 6388px square and took ~1s to decode on every rerun."""
+    from io import BytesIO
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image.thumbnail((size, size))
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+    return buffer.getvalue()
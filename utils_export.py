@@ -4,6 +4,8 @@ import pandas as pd
 import json
 from datetime import datetime
 
+from money_matters.engine.cache import SimulationCache, scenario_key
+
 # --- Expense Grouping ---
 EXPENSE_GROUPS = {
     "Essentials": ["Housing", "Utilities", "Food", "Transportation", "Insurance", "Phone/Internet"],
@@ -40,7 +42,7 @@ def get_budget_snapshot(session_state):
                 })
 
     # --- Create DataFrame ---
-    df_expenses = pd.DataFrame(expense_data)
+    df_expenses = pd.DataFrame(expense_data, columns=["Group", "Category", "Monthly Expense ($)"])
 
     # --- Add Metadata Row ---
     metadata = {
@@ -57,120 +59,142 @@ def get_budget_snapshot(session_state):
 
     return df_expenses, metadata
 
-def render_export_buttons(snapshot_tuple):
-    import streamlit as st
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, numbers
-    from openpyxl.utils import get_column_letter
-    from openpyxl.chart import PieChart, BarChart, Reference
-    from io import BytesIO
-    import pandas as pd
+# --- Excel Workbook ---
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+HEADER_FILL = "DDDDDD"
 
-    df_expenses, metadata = snapshot_tuple
+# Built workbooks keyed by snapshot content; a rerun with the same budget reuses the bytes
+EXPORT_CACHE = SimulationCache(maxsize=32)
 
-    # --- Create workbook ---
-    wb = Workbook()
 
-    # === Sheet 1: Metadata ===
-    ws_meta = wb.active
-    ws_meta.title = "Budget Summary"
-    ws_meta.append(["Field", "Value"])
-    for key, value in metadata.items():
-        ws_meta.append([key, value])
+def snapshot_key(df_expenses, metadata):
+    """
+    Content hash of a budget snapshot. The Timestamp is left out so it doesn't defeat the
+    cache; the workbook records its own build time instead (see build_budget_workbook).
+    """
+    rows = list(zip(df_expenses["Group"].tolist(), df_expenses["Category"].tolist(),
+                    df_expenses["Monthly Expense ($)"].tolist()))
+    content = {key: value for key, value in metadata.items() if key != "Timestamp"}
+    return scenario_key("budget_workbook", {"rows": rows, "metadata": content})
+
 
-    # Style header
-    for cell in ws_meta["A1:B1"][0]:
+def _header_row(ws, labels):
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment, PatternFill
+
+    cells = []
+    for label in labels:
+        cell = WriteOnlyCell(ws, value=label)
         cell.font = Font(bold=True)
         cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(start_color="DDDDDD", fill_type="solid")
+        cell.fill = PatternFill(start_color=HEADER_FILL, fill_type="solid")
+        cells.append(cell)
+    return cells
+
+
+def _currency(ws, value):
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import numbers
+
+    cell = WriteOnlyCell(ws, value=value)
+    cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
+    return cell
+
+
+def build_budget_workbook(df_expenses, metadata):
+    """
+    Budget snapshot as .xlsx bytes: summary, expense breakdown with a pie chart, and group
+    totals with a bar chart. Uses openpyxl's write-only mode, so rows stream straight to
+    the file instead of building an in-memory cell grid.
+    The snapshot's Timestamp is written as "Workbook Built", the time these bytes were
+    made: cached bytes are reused for the same budget, so it is not the download time.
+    """
+    from openpyxl import Workbook
+    from openpyxl.chart import PieChart, BarChart, Reference
+    from io import BytesIO
+
+    groups = df_expenses["Group"].tolist()
+    categories = df_expenses["Category"].tolist()
+    amounts = df_expenses["Monthly Expense ($)"].tolist()
 
-    # Auto column widths
+    wb = Workbook(write_only=True)
+
+    # === Sheet 1: Metadata ===
+    ws_meta = wb.create_sheet(title="Budget Summary")
     for col in ["A", "B"]:
         ws_meta.column_dimensions[col].width = 30
+    ws_meta.append(_header_row(ws_meta, ["Field", "Value"]))
+    for key, value in metadata.items():
+        if key == "Timestamp":
+            key, value = "Workbook Built", datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ws_meta.append([key, value])
 
     # === Sheet 2: Expenses ===
     ws_exp = wb.create_sheet(title="Expense Breakdown")
-    ws_exp.append(["Group", "Category", "Monthly Expense ($)"])
-
-    # Write expenses
-    for _, row in df_expenses.iterrows():
-        ws_exp.append([row["Group"], row["Category"], row["Monthly Expense ($)"]])
+    for col in ["A", "B", "C"]:
+        ws_exp.column_dimensions[col].width = 25
+    ws_exp.append(_header_row(ws_exp, ["Group", "Category", "Monthly Expense ($)"]))
+    for group, category, amount in zip(groups, categories, amounts):
+        ws_exp.append([group, category, _currency(ws_exp, amount)])
+    ws_exp.append(["TOTAL", "", _currency(ws_exp, sum(amounts))])
+
+    # === Sheet 3: Group totals ===
+    group_totals = {}
+    for group, amount in zip(groups, amounts):
+        group_totals[group] = group_totals.get(group, 0) + amount
 
-    # Add total row
-    total = df_expenses["Monthly Expense ($)"].sum()
-    ws_exp.append(["TOTAL", "", total])
-
-    # Style header
-    for cell in ws_exp["A1:C1"][0]:
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal="center")
-        cell.fill = PatternFill(start_color="DDDDDD", fill_type="solid")
-
-    # Format currency column
-    for row in ws_exp.iter_rows(min_row=2, min_col=3, max_col=3):
-        for cell in row:
-            cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-
-    # Auto column widths
-    for col in range(1, 4):
-        col_letter = get_column_letter(col)
-        ws_exp.column_dimensions[col_letter].width = 25
-
-    # === Pie Chart: Category Spend ===
-    pie = PieChart()
-    pie.title = "Spending by Category"
-
-    data_start = 2
-    data_end = data_start + len(df_expenses) - 1
-    pie_values = Reference(ws_exp, min_col=3, min_row=data_start, max_row=data_end)
-    pie_labels = Reference(ws_exp, min_col=2, min_row=data_start, max_row=data_end)
-    pie.add_data(pie_values, titles_from_data=False)
-    pie.set_categories(pie_labels)
-    ws_exp.add_chart(pie, "E2")
-
-    # === Bar Chart: Group Spend ===
-    group_totals = df_expenses.groupby("Group")["Monthly Expense ($)"].sum().reset_index()
     ws_chart = wb.create_sheet(title="Charts")
-    ws_chart.append(["Group", "Total Monthly Expense ($)"])
-    for _, row in group_totals.iterrows():
-        ws_chart.append([row["Group"], row["Monthly Expense ($)"]])
-
-    # Style chart sheet
-    for cell in ws_chart["A1:B1"][0]:
-        cell.font = Font(bold=True)
-        cell.fill = PatternFill(start_color="DDDDDD", fill_type="solid")
-        cell.alignment = Alignment(horizontal="center")
-
     for col in ["A", "B"]:
         ws_chart.column_dimensions[col].width = 30
+    ws_chart.append(_header_row(ws_chart, ["Group", "Total Monthly Expense ($)"]))
+    for group in sorted(group_totals):
+        ws_chart.append([group, _currency(ws_chart, group_totals[group])])
+
+    if amounts:
+        # === Pie Chart: Category Spend ===
+        pie = PieChart()
+        pie.title = "Spending by Category"
+        data_end = 1 + len(amounts)
+        pie.add_data(Reference(ws_exp, min_col=3, min_row=2, max_row=data_end), titles_from_data=False)
+        pie.set_categories(Reference(ws_exp, min_col=2, min_row=2, max_row=data_end))
+        ws_exp.add_chart(pie, "E2")
+
+        # === Bar Chart: Group Spend ===
+        bar = BarChart()
+        bar.title = "Total Spend by Group"
+        bar.y_axis.title = "Monthly Expense ($)"
+        bar.x_axis.title = "Group"
+        bar.add_data(Reference(ws_chart, min_col=2, min_row=1, max_row=1 + len(group_totals)), titles_from_data=True)
+        bar.set_categories(Reference(ws_chart, min_col=1, min_row=2, max_row=1 + len(group_totals)))
+        bar.shape = 4
+        ws_chart.add_chart(bar, "D2")
 
-    # Format currency
-    for row in ws_chart.iter_rows(min_row=2, min_col=2, max_col=2):
-        for cell in row:
-            cell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-
-    # Bar chart
-    bar = BarChart()
-    bar.title = "Total Spend by Group"
-    bar.y_axis.title = "Monthly Expense ($)"
-    bar.x_axis.title = "Group"
-
-    bar_data = Reference(ws_chart, min_col=2, min_row=1, max_row=1 + len(group_totals))
-    bar_labels = Reference(ws_chart, min_col=1, min_row=2, max_row=1 + len(group_totals))
-    bar.add_data(bar_data, titles_from_data=True)
-    bar.set_categories(bar_labels)
-    bar.shape = 4
-    ws_chart.add_chart(bar, "D2")
-
-    # === Save to buffer ===
     buffer = BytesIO()
     wb.save(buffer)
-    buffer.seek(0)
+    return buffer.getvalue()
+
+
+def budget_workbook_bytes(df_expenses, metadata):
+    """Cached build_budget_workbook, keyed by snapshot_key."""
+    key = snapshot_key(df_expenses, metadata)
+    try:
+        return EXPORT_CACHE.get("budget_workbook", key)
+    except KeyError:
+        pass
+    data = build_budget_workbook(df_expenses, metadata)
+    EXPORT_CACHE.put("budget_workbook", key, data)
+    return data
+
+
+def render_export_buttons(snapshot_tuple):
+    import streamlit as st
+
+    df_expenses, metadata = snapshot_tuple
 
-    # === Download button ===
+    # The workbook is only built when the button is clicked (Streamlit calls `data` then)
     st.download_button(
         label="👉 >> 📁 Export to Excel >>",
-        data=buffer,
+        data=lambda: budget_workbook_bytes(df_expenses, metadata),
         file_name="lifestyle_budget_snapshot.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
\ No newline at end of file
+        mime=XLSX_MIME
+    )